@@ -0,0 +1,77 @@
+import os
+import sys
+import time
+
+# Run from the project root so eda/outputs resolves like it does for the dashboard
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+os.chdir(ROOT)
+sys.path.append(os.path.join(ROOT, 'streamlit'))
+from utils.data_loader import SECTOR_READERS
+
+REPEATS = 5
+
+# First dataset each page reads (top of its "Extract data" block)
+PAGE_FIRST_KEY = {
+    "agriculture": "trend",
+    "defence": "high_value",
+    "economy": "sentiment_raw",
+    "energy": "iea_stocks_raw",
+    "industry": "manufacturing_inventory_raw",
+    "global_trade": "export_decrease_items_top5",
+    "korea_trade": "export_top_partners",
+}
+
+
+def best_of(func):
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+# Previous behaviour: every loader read all of its files up front
+def eager_sector(sector):
+    SECTOR_READERS[sector]().load_all()
+
+
+def eager_home():
+    for sector in SECTOR_READERS:
+        eager_sector(sector)
+
+
+# Home now reads only the dated datasets and the Gemini text of each sector
+def lazy_home():
+    for sector, reader in SECTOR_READERS.items():
+        data = reader()
+        for key in data.dated_keys():
+            data[key]
+        data.get("gemini_insight")
+
+
+def lazy_first_dataset(sector):
+    SECTOR_READERS[sector]()[PAGE_FIRST_KEY[sector]]
+
+
+# Page reads everything in order while the prefetch thread works through the rest
+def lazy_page_with_prefetch(sector):
+    data = SECTOR_READERS[sector]()
+    data.prefetch()
+    for key in data:
+        data[key]
+
+
+def report(name, eager, lazy, label):
+    print(f"{name:<26} eager {eager * 1000:8.1f} ms   {label} {lazy * 1000:8.1f} ms   ({eager / lazy:5.1f}x)")
+
+
+if __name__ == "__main__":
+    print(f"🚀 Dashboard cold-start benchmark (best of {REPEATS}, fresh loaders each run)")
+
+    report("Home", best_of(eager_home), best_of(lazy_home), "lazy        ")
+
+    for sector in SECTOR_READERS:
+        eager = best_of(lambda: eager_sector(sector))
+        report(f"{sector} first dataset", eager, best_of(lambda: lazy_first_dataset(sector)), "lazy        ")
+        report(f"{sector} full page", eager, best_of(lambda: lazy_page_with_prefetch(sector)), "lazy+prefetch")
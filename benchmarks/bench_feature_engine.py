@@ -0,0 +1,57 @@
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+# Add eda/ to Python path for the shared feature engine
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'eda'))
+from feature_engine import FeatureFrame
+
+# Many monthly indicators, far beyond today's economy and sentiment tables
+N_SERIES = 2000
+DATES = pd.date_range("1990-01-01", "2025-07-01", freq="MS")
+rng = np.random.default_rng(0)
+
+df = pd.DataFrame({
+    "date": np.tile(DATES, N_SERIES),
+    "indicator": np.repeat([f"indicator_{i}" for i in range(N_SERIES)], len(DATES)),
+    "value": 100 + rng.normal(size=N_SERIES * len(DATES)).cumsum() / 10,
+}).sample(frac=1, random_state=0)
+
+
+# What sentiment_indicators_analysis did: groupby + per-group lambdas
+def legacy_features(df):
+    out = df.sort_values(["indicator", "date"])
+    grouped = out.groupby("indicator")["value"]
+    out["momentum"] = grouped.pct_change()
+    out["value_lag1"] = grouped.shift(1)
+    out["ma_3m"] = grouped.transform(lambda x: x.rolling(window=3, min_periods=1).mean())
+    out["ma_6m"] = grouped.transform(lambda x: x.rolling(window=6, min_periods=1).mean())
+    return out
+
+
+def engine_features(df):
+    features = FeatureFrame(df, series="indicator")
+    out = features.frame.copy()
+    out["momentum"] = features.pct_change()
+    out["value_lag1"] = features.shift(1)
+    out["ma_3m"] = features.rolling_mean(3, min_periods=1)
+    out["ma_6m"] = features.rolling_mean(6, min_periods=1)
+    return out
+
+
+def timed(func, *args):
+    t = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - t, result
+
+
+if __name__ == "__main__":
+    print(f"🚀 Feature engine benchmark ({N_SERIES} series x {len(DATES)} months = {len(df):,} rows)")
+    legacy_time, legacy = timed(legacy_features, df)
+    engine_time, engine = timed(engine_features, df)
+    for col in ["momentum", "value_lag1", "ma_3m", "ma_6m"]:
+        assert np.allclose(legacy[col], engine[col].reindex(legacy.index), equal_nan=True), f"{col} disagrees"
+    print(f"groupby lambdas {legacy_time * 1000:9.1f} ms")
+    print(f"feature engine  {engine_time * 1000:9.1f} ms   ({legacy_time / engine_time:5.1f}x)")
@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+# Add eda/ to Python path for the lead-lag engine
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'eda'))
+from lead_lag import MAX_LAG, lagged_correlations, lead_lag_table
+
+# Monthly changes of many indicators with gaps, far beyond the README's 92
+N_SERIES = 500
+N_CHECKED = 30
+N_MONTHS = 427
+rng = np.random.default_rng(0)
+
+values = rng.normal(size=(N_MONTHS, N_SERIES))
+values[rng.random(values.shape) < 0.2] = np.nan
+changes = pd.DataFrame(values, columns=[f"indicator_{i}" for i in range(N_SERIES)])
+
+# A leads B by one month over the whole span; C follows A too but only covers the last 30
+# months, so its longer lags fall below MIN_OVERLAP and are masked
+lead = rng.normal(size=N_MONTHS)
+short = np.full(N_MONTHS, np.nan)
+short[-30:] = np.r_[0, lead[:-1]][-30:] + 0.3 * rng.normal(size=30)
+partial = pd.DataFrame({"A": lead, "B": np.r_[0, lead[:-1]] + 0.1 * rng.normal(size=N_MONTHS), "C": short})
+
+
+# One pandas correlation per pair and lag, the way the two hand-picked pairs were computed
+def pairwise_correlations(df):
+    out = np.full((2 * MAX_LAG + 1, df.shape[1], df.shape[1]), np.nan)
+    for k in range(-MAX_LAG, MAX_LAG + 1):
+        shifted = df.shift(-k)
+        for i in range(df.shape[1]):
+            for j in range(df.shape[1]):
+                out[MAX_LAG + k, i, j] = df.iloc[:, i].corr(shifted.iloc[:, j])
+    return out
+
+
+def timed(func, *args):
+    t = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - t, result
+
+
+if __name__ == "__main__":
+    print(f"🚀 Lead-lag benchmark ({N_MONTHS} months, lags -{MAX_LAG}..+{MAX_LAG})")
+    subset = changes.iloc[:, :N_CHECKED]
+    legacy_time, legacy = timed(pairwise_correlations, subset)
+    engine_time, (engine, _) = timed(lagged_correlations, subset.to_numpy())
+    assert np.allclose(legacy, engine, equal_nan=True, atol=1e-12), "engine and pairwise correlations disagree"
+    print(f"{N_CHECKED} series   pairwise loop {legacy_time * 1000:9.1f} ms   "
+          f"engine {engine_time * 1000:7.1f} ms   ({legacy_time / engine_time:6.0f}x)")
+
+    # Masked lags never win over a real correlation, and every tested pair gets a q-value
+    check = lead_lag_table(partial).set_index(["leader", "follower"])
+    assert check.loc[("A", "B"), "lead_months"] == 1 and check.loc[("A", "C"), "lead_months"] == 1
+    assert check["correlation"].notna().all() and check["q_value"].notna().all(), "masked lag picked"
+    assert (check["significance"] == "Significant").all()
+    print(f"partial overlap      lead 1 found for A->B and A->C ({check.loc[('A', 'C'), 'data_points']} months)")
+
+    table_time, table = timed(lead_lag_table, changes)
+    print(f"{N_SERIES} series  ranked lead-lag table ({len(table):,} pairs) {table_time * 1000:9.1f} ms")
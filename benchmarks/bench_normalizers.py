@@ -0,0 +1,93 @@
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+import pycountry
+from datetime import datetime
+
+# Add src/processed to Python path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'processed'))
+from normalizers import split_currency, extract_partner, month_label_to_date
+from dimensions import country_key, iso2_to_name
+
+N_ROWS = 500_000
+rng = np.random.default_rng(0)
+
+
+# Per-row implementations previously inlined in sector_process
+def legacy_split_currency(currency):
+    return currency.apply(lambda x: pd.Series(x.split('/') if '/' in x else ['KRW', x]))
+
+def legacy_extract_partner(indicator):
+    return indicator.apply(
+        lambda x: 'World' if '관세청' in x
+        else (x[x.rfind('(')+1:x.rfind(')')] if '(' in x and ')' in x and x.rfind('(') < x.rfind(')')
+        else 'World')
+    )
+
+def legacy_month_label_to_date(label):
+    month_strs = label.str.split().str[0]
+    year_strs = label.str.split().str[1]
+    month_nums = month_strs.str[:3].apply(lambda x: datetime.strptime(x, '%b').month)
+    return pd.to_datetime(year_strs + '-' + month_nums.astype(str).str.zfill(2) + '-01', errors='coerce')
+
+def legacy_iso2_to_name(codes, calls=4):
+    # global_trade_* and korea_trade_trend each rebuilt the map on every call
+    for _ in range(calls):
+        iso2_to_country = {c.alpha_2: c.name for c in pycountry.countries}  # type: ignore
+        names = codes.map(iso2_to_country).fillna(codes)
+    return names
+
+def fast_iso2_to_name(codes, calls=4):
+    for _ in range(calls):
+        names = iso2_to_name(codes)
+    return names
+
+
+def timeit(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def same_values(a, b):
+    return (pd.DataFrame(a).astype(object).to_numpy() == pd.DataFrame(b).astype(object).to_numpy()).all()
+
+
+# Canonical names differ from pycountry's (e.g. South Korea), so compare the resolved country
+def same_countries(a, b):
+    return (country_key(a).fillna(-1) == country_key(b).fillna(-1)).all()
+
+
+def report(name, legacy, fast, *args, check=None):
+    t_legacy, r_legacy = timeit(legacy, *args)
+    t_fast, r_fast = timeit(fast, *args)
+    if check is not None:
+        assert check(r_legacy, r_fast), f"{name}: outputs differ"
+    print(f"{name:<22} legacy {t_legacy:8.3f}s   vectorized {t_fast:7.3f}s   ({t_legacy / t_fast:6.1f}x)")
+
+
+if __name__ == "__main__":
+    print(f"📊 Normalizer benchmark on {N_ROWS:,} rows")
+
+    # Row-wise pd.Series construction is very slow, so this one runs on a tenth of the rows
+    currency = pd.Series(rng.choice(['USD', 'EUR/USD', 'JPY(100)', 'CNY', 'GBP/USD', 'EUR'], N_ROWS // 10))
+    report("fxrate currency", legacy_split_currency, split_currency, currency,
+           check=same_values)
+
+    indicator = pd.Series(rng.choice(['수출총액(관세청)', '수출총액(독일)', '수입총액(미국)', '수출총액(중국)', '수입총액'], N_ROWS))
+    report("ecos_trade partner", legacy_extract_partner, extract_partner, indicator,
+           check=same_values)
+
+    label = pd.Series(rng.choice(['May 2025 YoY', 'Jan–May 2025 YoY', 'April 2024 YoY', 'Dec 2023 YoY'], N_ROWS))
+    report("steel month parsing", legacy_month_label_to_date, month_label_to_date, label,
+           check=same_values)
+
+    # Partner columns repeat every ISO2 code (plus the "ALL" aggregate) over all rows. The
+    # country index is built once per process, so it is timed apart from the lookups
+    build_time, _ = timeit(iso2_to_name, pd.Series(['KR']))
+    codes = pd.Series(rng.choice([c.alpha_2 for c in pycountry.countries] + ['ALL'], N_ROWS))
+    report("global_trade ISO2", legacy_iso2_to_name, fast_iso2_to_name, codes,
+           check=same_countries)
+    print(f"{'':<22} (one-time country index build {build_time:.3f}s)")
@@ -0,0 +1,66 @@
+import os
+import sys
+import time
+import numpy as np
+
+# Add src/energy to Python path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'energy'))
+from petronetsummary import CONTINENT_MAPPING, parse_wide_data, parse_wide_data_bs4, build_oil_imports_with_continents
+
+COUNTRIES = [country for countries in CONTINENT_MAPPING.values() for country in countries] + ['합 계']
+COUNTRIES_PER_TABLE = 6
+
+
+# Build a multi-year PETRONET export in the same disguised-HTML layout as the download
+def make_petronet_html(start_year=2000, years=25, seed=42):
+    rng = np.random.default_rng(seed)
+    tables = []
+
+    for t in range(0, len(COUNTRIES), COUNTRIES_PER_TABLE):
+        countries = COUNTRIES[t:t + COUNTRIES_PER_TABLE]
+        header = ''.join(f'<td colspan="3">{c}</td>' for c in countries)
+        subheader = '<td>물량</td><td>금액</td><td>단가</td>' * len(countries)
+        rows = [
+            f'<tr><td rowspan="2">월</td><td rowspan="2">국가</td>{header}</tr>',
+            f'<tr>{subheader}</tr>'
+        ]
+        for year in range(start_year, start_year + years):
+            for month in range(1, 13):
+                label = f"{year % 100:02d}년&nbsp;{month:02d}월" if month == 1 else f"{month:02d}월"
+                cells = []
+                for _ in countries:
+                    if rng.random() < 0.3:
+                        cells += ['-', '-', '-']
+                    else:
+                        vol = int(rng.integers(100, 50000))
+                        price = round(float(rng.uniform(20, 120)), 2)
+                        cells += [f"{vol:,}", f"{int(vol * price):,}", f"{price:.2f}"]
+                tds = ''.join(f'<td style="text-align:right;">{c}</td>' for c in cells)
+                rows.append(f'<tr><td colspan="2">{label}</td>{tds}</tr>')
+        tables.append('<table width="100%" border="1">' + ''.join(rows) + '</table>')
+
+    return '<html><body><table border="0"><tr><td>' + ''.join(tables) + '</td></tr></table></body></html>'
+
+
+def timeit(func, *args, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+if __name__ == "__main__":
+    for years in [5, 25]:
+        html = make_petronet_html(years=years)
+        t_bs4, df_bs4 = timeit(parse_wide_data_bs4, html)
+        t_fast, df_fast = timeit(parse_wide_data, html)
+        t_full, _ = timeit(build_oil_imports_with_continents, html)
+
+        assert df_bs4.equals(df_fast), "Fast parser output differs from BeautifulSoup parser"
+
+        print(f"📊 {years} years ({len(html) / 1e6:.1f} MB, {df_fast.shape[0]} months x {df_fast.shape[1] - 1} columns)")
+        print(f"   bs4 parser:   {t_bs4:8.3f}s")
+        print(f"   fast parser:  {t_fast:8.3f}s  ({t_bs4 / t_fast:.1f}x)")
+        print(f"   full build:   {t_full:8.3f}s")
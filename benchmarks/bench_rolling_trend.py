@@ -0,0 +1,59 @@
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+# Add eda/ to Python path for the shared feature engine
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'eda'))
+from feature_engine import rolling_momentum
+
+# Many long monthly series, far beyond today's two inventory categories
+N_CATEGORIES = 200
+DATES = pd.date_range("1980-01-01", "2025-07-01", freq="MS")
+rng = np.random.default_rng(0)
+
+df = pd.DataFrame({
+    "date": np.tile(DATES, N_CATEGORIES),
+    "category": np.repeat([f"category_{i}" for i in range(N_CATEGORIES)], len(DATES)),
+    "value": 100 + rng.normal(size=N_CATEGORIES * len(DATES)).cumsum() / 10,
+})
+
+
+# What manufacturing_inventory_analysis did: np.polyfit once per window per category
+def calculate_momentum(series):
+    if len(series) < 2:
+        return 0
+    x = np.arange(len(series))
+    slope = np.polyfit(x, series, 1)[0]
+    return slope / series.mean() if series.mean() != 0 else 0
+
+
+def legacy_momentum(df, window, min_periods):
+    parts = []
+    for _, group in df.groupby("category"):
+        group = group.sort_values("date")
+        parts.append(group["value"].rolling(window, min_periods=min_periods).apply(calculate_momentum))
+    return pd.concat(parts).reindex(df.index)
+
+
+def kernel_momentum(df, window, min_periods):
+    ordered = df.sort_values(["category", "date"], kind="stable")
+    momentum = rolling_momentum(ordered["value"], window, min_periods=min_periods, groups=ordered["category"])
+    return pd.Series(momentum, index=ordered.index).reindex(df.index)
+
+
+def timed(func, *args):
+    t = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - t, result
+
+
+if __name__ == "__main__":
+    print(f"🚀 Rolling momentum benchmark ({N_CATEGORIES} categories x {len(DATES)} months = {len(df):,} rows)")
+    for window, min_periods in [(3, 2), (6, 3)]:
+        legacy_time, legacy = timed(legacy_momentum, df, window, min_periods)
+        kernel_time, kernel = timed(kernel_momentum, df, window, min_periods)
+        assert np.allclose(legacy, kernel, equal_nan=True, rtol=1e-9, atol=1e-12), "kernel and polyfit disagree"
+        print(f"momentum_{window}m  polyfit {legacy_time * 1000:9.1f} ms   "
+              f"kernel {kernel_time * 1000:7.1f} ms   ({legacy_time / kernel_time:6.0f}x)")
@@ -0,0 +1,56 @@
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+# Add eda/ to Python path for the rollup cube
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'eda'))
+from rollup_cube import GRAINS, RollupCube
+
+# Daily contract values across categories, charted at every grain and category
+N_ROWS = 500_000
+CATEGORIES = [f"category {i}" for i in range(20)]
+rng = np.random.default_rng(0)
+
+rows = pd.DataFrame({
+    "date": rng.choice(pd.date_range("2010-01-01", "2025-06-30", freq="D"), N_ROWS),
+    "category": rng.choice(CATEGORIES, N_ROWS),
+    "value": rng.lognormal(20, 2, N_ROWS),
+})
+
+
+# What a chart costs without the cube: filter the rows and regroup them on every request
+def regroup(rows, category, freq):
+    part = rows[rows["category"] == category]
+    return part.groupby(part["date"].dt.to_period(freq))["value"].agg(["sum", "count", "mean"])
+
+
+def timed(func, *args):
+    t = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - t, result
+
+
+if __name__ == "__main__":
+    print(f"🚀 Rollup cube benchmark ({N_ROWS:,} rows, {len(CATEGORIES)} series)")
+    build_time, cube = timed(RollupCube.from_rows, rows, "category")
+    with tempfile.TemporaryDirectory() as cube_dir:
+        cube.save(cube_dir)
+        load_time, cube = timed(RollupCube.load, cube_dir)
+    print(f"build                  {build_time * 1000:9.1f} ms   ({len(cube.frame):,} cube rows)")
+    print(f"load                   {load_time * 1000:9.1f} ms")
+
+    regroup_time = select_time = 0.0
+    for grain, freq in GRAINS.items():
+        for category in CATEGORIES:
+            t, expected = timed(regroup, rows, category, freq)
+            regroup_time += t
+            t, selected = timed(cube.select, grain, category)
+            select_time += t
+            assert list(expected.index.astype(str)) == list(selected["period"].dt.to_period(freq).astype(str))
+            assert np.allclose(expected["sum"], selected["sum"]) and np.allclose(expected["mean"], selected["mean"])
+            assert (expected["count"].to_numpy() == selected["count"].to_numpy()).all(), "cube and regroup disagree"
+    print(f"all charts (regroup)   {regroup_time * 1000:9.1f} ms")
+    print(f"all charts (cube)      {select_time * 1000:9.1f} ms   ({regroup_time / select_time:5.1f}x)")
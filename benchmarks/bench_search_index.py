@@ -0,0 +1,61 @@
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+# Add streamlit/ to Python path for the dashboard utils
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'streamlit'))
+from utils.search_index import SearchIndex
+
+# A contracts-sized table with Korean and English text, far beyond today's outputs
+N_ROWS = 200_000
+REPEATS = 10
+rng = np.random.default_rng(0)
+
+ITEMS = ["전투기 정비", "K9 자주포 부품", "radar module", "군용 트럭", "night vision goggles", "통신 장비"]
+df = pd.DataFrame({
+    "date": pd.date_range("2015-01-01", periods=N_ROWS, freq="h"),
+    "category": pd.Categorical(rng.choice(["항공", "지상", "해상", "통신"], N_ROWS)),
+    "item": rng.choice(ITEMS, N_ROWS) + " #" + pd.Series(rng.integers(0, 5000, N_ROWS)).astype(str),
+    "value": rng.lognormal(18, 1, N_ROWS),
+})
+term = "자주포 부품 #42"
+
+
+# What every data explorer did on each keystroke
+def legacy_search(df):
+    return df[df.apply(lambda x: x.astype(str).str.contains(term, case=False, na=False)).any(axis=1)]
+
+
+def best_of(func, *args):
+    times = []
+    for _ in range(REPEATS):
+        t = time.perf_counter()
+        result = func(*args)
+        times.append(time.perf_counter() - t)
+    return min(times), result
+
+
+if __name__ == "__main__":
+    print(f"🚀 Data explorer search benchmark ({len(df):,} rows, best of {REPEATS})")
+
+    legacy_time, legacy = best_of(legacy_search, df)
+
+    t = time.perf_counter()
+    index = SearchIndex(df)
+    build_time = time.perf_counter() - t
+
+    # Drop memoized hits before each run so every call scans the rows
+    def cold_search():
+        index._hits.clear()
+        return index.search(df, term)
+
+    cold_time, _ = best_of(cold_search)
+    warm_time, result = best_of(lambda: index.search(df, term))
+
+    assert result.index.equals(legacy.index), "search index and legacy search disagree"
+    print(f"legacy per-cell contains {legacy_time * 1000:9.2f} ms")
+    print(f"index build              {build_time * 1000:9.2f} ms   (once per artifact version)")
+    print(f"index first search       {cold_time * 1000:9.2f} ms   ({legacy_time / cold_time:6.1f}x)")
+    print(f"index memoized search    {warm_time * 1000:9.2f} ms   ({legacy_time / warm_time:6.1f}x)")
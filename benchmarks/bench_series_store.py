@@ -0,0 +1,72 @@
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+# Add eda/ to Python path for the series store and the feature engine
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'eda'))
+from series_store import SeriesStore
+from feature_engine import FeatureFrame
+
+# Monthly indicators in long format, each value carrying its domain, name and series strings
+N_SERIES = 2000
+DOMAINS = ["agriculture", "defence", "economy", "energy", "industry", "trade"]
+DATES = pd.date_range("1990-01-01", "2025-07-01", freq="MS")
+rng = np.random.default_rng(0)
+
+names = np.array([f"indicator {i}" for i in range(N_SERIES)], dtype=object)
+domains = np.array([DOMAINS[i % len(DOMAINS)] for i in range(N_SERIES)], dtype=object)
+df = pd.DataFrame({
+    "date": np.tile(DATES, N_SERIES),
+    "domain": np.repeat(domains, len(DATES)),
+    "series": np.repeat(domains + ": " + names, len(DATES)),
+    "name": np.repeat(names, len(DATES)),
+    "value": 100 + rng.normal(size=N_SERIES * len(DATES)).cumsum() / 10,
+})
+WANTED = [f"{DOMAINS[i % len(DOMAINS)]}: indicator {i}" for i in range(0, N_SERIES, 100)]
+
+
+# What a page pays today for a few indicators: parse the whole long CSV, then filter
+def read_csv_series(path, keys):
+    rows = pd.read_csv(path, parse_dates=["date"])
+    return rows[rows["series"].isin(keys)]
+
+
+def timed(func, *args):
+    t = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - t, result
+
+
+if __name__ == "__main__":
+    print(f"🚀 Series store benchmark ({N_SERIES} series x {len(DATES)} months = {len(df):,} rows)")
+    with tempfile.TemporaryDirectory() as store_dir:
+        csv_path = os.path.join(store_dir, "indicators.csv")
+        df.to_csv(csv_path, index=False)
+        build_time, store = timed(SeriesStore.from_frame, df)
+        store.save(store_dir)
+        csv_size = os.path.getsize(csv_path)
+        store_size = sum(e.stat().st_size for e in os.scandir(store_dir) if e.name.startswith("series_store"))
+        print(f"build                {build_time * 1000:9.1f} ms")
+        print(f"on disk              {csv_size / 1e6:9.1f} MB csv   {store_size / 1e6:6.1f} MB store")
+
+        csv_time, expected = timed(read_csv_series, csv_path, WANTED)
+        open_time, store = timed(SeriesStore.open, store_dir)
+        read_time, frame = timed(store.frame, WANTED)
+        # The store returns series in the order asked for
+        expected = expected.assign(order=expected["series"].map({k: i for i, k in enumerate(WANTED)}))
+        expected = expected.sort_values(["order", "date"])
+        assert np.allclose(expected["value"].to_numpy(), frame["value"].to_numpy()), "store and csv disagree"
+        assert (expected["date"].to_numpy() == frame["date"].to_numpy()).all()
+        print(f"{len(WANTED)} series (csv)      {csv_time * 1000:9.1f} ms")
+        print(f"{len(WANTED)} series (store)    {(open_time + read_time) * 1000:9.1f} ms   "
+              f"({csv_time / (open_time + read_time):5.1f}x, open {open_time * 1000:.1f} ms)")
+
+        # Features over every series: from the long frame, and straight from the mapped store
+        frame_time, from_frame = timed(lambda: FeatureFrame(df, series="series").rolling_mean(6, min_periods=1))
+        store_time, from_store = timed(lambda: FeatureFrame.from_store(store).rolling_mean(6, min_periods=1))
+        assert np.allclose(from_frame.to_numpy(), from_store.to_numpy(), equal_nan=True), "features disagree"
+        print(f"ma_6m (long frame)   {frame_time * 1000:9.1f} ms")
+        print(f"ma_6m (store)        {store_time * 1000:9.1f} ms   ({frame_time / store_time:5.1f}x)")
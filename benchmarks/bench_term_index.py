@@ -0,0 +1,60 @@
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+import numpy as np
+import pandas as pd
+
+# Add eda/ to Python path for the normalizer and the term index
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'eda'))
+from text_normalizer import TextNormalizer
+from term_index import update_term_index
+
+# Three years of procurement notices, refreshed one month at a time
+N_ROWS = 150_000
+N_NAMES = 15_000
+MEDIUM_VALUE = 5e8
+rng = np.random.default_rng(0)
+
+ITEMS = ["K9 자주포 부품", "전투기 정비", "레이더 유지보수", "탄약 구매 105mm", "KF21 통신 장비", "천무 유도탄 부품"]
+names = pd.Series([f"입찰공고 - 방산 - {rng.choice(ITEMS)} 품목{i % 500}" for i in range(N_NAMES)])
+dates = pd.date_range("2022-07-01", "2025-06-01", freq="MS")
+bids = pd.DataFrame({
+    "date": rng.choice(dates, N_ROWS),
+    "indicator": names.iloc[rng.integers(0, N_NAMES, N_ROWS)].to_numpy(),
+    "value": rng.choice([1e8, 6e8, 2e10], N_ROWS),
+})
+normalizer = TextNormalizer()
+bids["clean_indicator"] = normalizer.clean(bids["indicator"]).to_numpy()
+bids["tokens"] = normalizer.tokens(bids["indicator"]).to_numpy()
+STOP_WORDS = {"구매", "부품"}
+
+
+# What a term-over-time query costs without the index: re-count every month's bids
+def scan_term_frequency(bids, term):
+    medium = bids[bids["value"] >= MEDIUM_VALUE]
+    return {month: Counter(t for tokens in group["tokens"] for t in tokens)[term]
+            for month, group in medium.groupby("date")}
+
+
+def timed(func, *args):
+    t = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - t, result
+
+
+if __name__ == "__main__":
+    print(f"🚀 Term index benchmark ({N_ROWS:,} bids over {len(dates)} months)")
+    with tempfile.TemporaryDirectory() as index_dir:
+        full_time, _ = timed(update_term_index, bids[bids["date"] < dates[-1]], index_dir, STOP_WORDS)
+        refresh_time, index = timed(update_term_index, bids, index_dir, STOP_WORDS)
+    print(f"full build             {full_time * 1000:9.1f} ms")
+    print(f"one-month refresh      {refresh_time * 1000:9.1f} ms")
+
+    scan_time, scanned = timed(scan_term_frequency, bids, "정비")
+    query_time, monthly = timed(index.term_frequency, ["정비"], MEDIUM_VALUE)
+    assert dict(zip(monthly["date"], monthly["frequency"])) == {m: f for m, f in scanned.items() if f}, \
+        "index and token scan disagree"
+    print(f"term frequency (scan)  {scan_time * 1000:9.1f} ms")
+    print(f"term frequency (index) {query_time * 1000:9.1f} ms   ({scan_time / query_time:5.1f}x)")
@@ -0,0 +1,69 @@
+import os
+import re
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+# Add eda/ to Python path for the text normalizer
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'eda'))
+from text_normalizer import TextNormalizer
+
+# A full procurement history: many bids, names repeating across notices and years
+N_ROWS = 200_000
+N_NAMES = 20_000
+rng = np.random.default_rng(0)
+
+ITEMS = ["K9 자주포 부품", "'25년 전투기 정비", "25~27년 레이더 유지보수", "\"긴급\" 탄약 구매", "KF21 통신 장비"]
+names = pd.Series([f"입찰공고 - 방산 - {rng.choice(ITEMS)} {i}" for i in range(N_NAMES)])
+bids = pd.DataFrame({
+    "indicator": names.iloc[rng.integers(0, N_NAMES, N_ROWS)].to_numpy(),
+    "value": rng.choice([1e8, 6e8, 2e10], N_ROWS),
+})
+
+
+# What defence_eda did: nine uncompiled re.sub calls per row, applied to each analysis' subset
+def clean_texts(indicator):
+    s = str(indicator)
+    if ' - ' in s:
+        s = s.rsplit(' - ', 1)[-1]
+    s = re.sub(r"('?\d{2}년~'?\d{2}년)", '', s)
+    s = re.sub(r"('?\d{2}~'?\d{2}년)", '', s)
+    s = re.sub(r"('?\d{2}~'?\d{2})", '', s)
+    s = re.sub(r"'?\d{2}년", '', s)
+    s = re.sub(r"'?\d{2}\s", ' ', s)
+    s = re.sub(r'[\'"]', '', s)
+    s = re.sub(r'\s*~\s*', ' ', s)
+    s = re.sub(r'\s+', ' ', s).strip()
+    return s
+
+
+def legacy_clean(bids):
+    high_value = bids[bids['value'] >= 1e10]['indicator'].apply(clean_texts)
+    emergency = bids[bids['indicator'].str.contains('긴급') & (bids['value'] > 5e7)]['indicator'].apply(clean_texts)
+    medium = bids[bids['value'] >= 5e8]['indicator'].apply(clean_texts)
+    return high_value, emergency, medium
+
+
+def normalizer_clean(bids):
+    clean = TextNormalizer().clean(bids['indicator'])
+    high_value = clean[bids['value'] >= 1e10]
+    emergency = clean[bids['indicator'].str.contains('긴급') & (bids['value'] > 5e7)]
+    medium = clean[bids['value'] >= 5e8]
+    return high_value, emergency, medium
+
+
+def timed(func, *args):
+    t = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - t, result
+
+
+if __name__ == "__main__":
+    print(f"🚀 Contract name normalizer benchmark ({N_ROWS:,} bids, {N_NAMES:,} distinct names)")
+    legacy_time, legacy = timed(legacy_clean, bids)
+    normalizer_time, normalized = timed(normalizer_clean, bids)
+    for a, b in zip(legacy, normalized):
+        assert a.astype(str).equals(b.astype(str)), "normalizer and clean_texts disagree"
+    print(f"3 x apply(clean_texts) {legacy_time * 1000:9.1f} ms")
+    print(f"one normalizer pass    {normalizer_time * 1000:9.1f} ms   ({legacy_time / normalizer_time:5.1f}x)")
@@ -0,0 +1,95 @@
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+# Add eda/ to Python path for the economy analysis and the rolling state store
+EDA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'eda')
+sys.path.append(EDA_DIR)
+from economy_eda import key_indicators_analysis, sentiment_indicators_analysis
+from rolling_state import update_rolling_output
+
+# Months replayed one refresh at a time, after a full run on the history before them
+REPLAY_MONTHS = 24
+
+# Synthetic indicator set for timing, far beyond today's four indicators
+N_SYNTHETIC = 2000
+SYNTHETIC_MONTHS = 3
+
+CASES = [
+    ("key_indicators_processed.csv", "economic_indicators_raw.csv", key_indicators_analysis, 3, ["date"]),
+    ("sentiment_processed.csv", "sentiment_raw.csv", sentiment_indicators_analysis, 6, ["date", "indicator"]),
+]
+
+
+def read_raw(filename):
+    return pd.read_csv(os.path.join(EDA_DIR, "outputs", "economy", filename), encoding="utf-8-sig", parse_dates=["date"])
+
+
+def file_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def synthetic_raw():
+    dates = pd.date_range("1990-01-01", "2025-07-01", freq="MS")
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "date": np.repeat(dates, N_SYNTHETIC),
+        "indicator": np.tile([f"indicator_{i}" for i in range(N_SYNTHETIC)], len(dates)),
+        "value": 100 + rng.normal(size=N_SYNTHETIC * len(dates)),
+        "unit": "index",
+        "source": "ECOS",
+    })
+
+
+# Replay monthly refreshes through the state store and check every step against a full recompute
+def reconcile(output_name, raw, compute, depth, order, workdir, replay_months=REPLAY_MONTHS):
+    months = sorted(raw["date"].unique())
+    output_path = os.path.join(workdir, output_name)
+    full_path = os.path.join(workdir, "full_" + output_name)
+    incremental_time = full_time = 0.0
+
+    for cutoff in months[-replay_months - 1:]:
+        df = raw[raw["date"] <= cutoff]
+        t = time.perf_counter()
+        update_rolling_output(df, compute, output_path, series="indicator", depth=depth, order=order)
+        incremental_time += time.perf_counter() - t
+        # A full run recomputes and rewrites the whole file
+        t = time.perf_counter()
+        compute(df).to_csv(full_path, index=False, encoding="utf-8-sig")
+        full_time += time.perf_counter() - t
+        assert file_bytes(output_path) == file_bytes(full_path), f"{output_name} differs from a full recompute at {cutoff}"
+
+    # A revised value inside the lookback window must fall back to a full recompute
+    revised = raw.copy()
+    revised.loc[revised.index[-1], "value"] += 1
+    update_rolling_output(revised, compute, output_path, series="indicator", depth=depth, order=order)
+    compute(revised).to_csv(full_path, index=False, encoding="utf-8-sig")
+    assert file_bytes(output_path) == file_bytes(full_path), f"{output_name} missed a revision"
+
+    # Older revisions are caught when the whole history is verified
+    revised.loc[revised.index[0], "value"] += 1
+    update_rolling_output(revised, compute, output_path, series="indicator", depth=depth, order=order,
+                          verify_history=True)
+    compute(revised).to_csv(full_path, index=False, encoding="utf-8-sig")
+    assert file_bytes(output_path) == file_bytes(full_path), f"{output_name} missed an old revision"
+    return incremental_time, full_time
+
+
+if __name__ == "__main__":
+    print(f"🔍 Rolling state reconciliation ({REPLAY_MONTHS} monthly refreshes per output)")
+    with tempfile.TemporaryDirectory() as workdir:
+        for output_name, raw_name, compute, depth, order in CASES:
+            incremental_time, full_time = reconcile(output_name, read_raw(raw_name), compute, depth, order, workdir)
+            print(f"✅ {output_name}: identical to full recompute "
+                  f"(incremental {incremental_time * 1000:.1f} ms, full {full_time * 1000:.1f} ms)")
+
+        # The first replayed month is a full run either way; the rest show the refresh cost
+        raw = synthetic_raw()
+        incremental_time, full_time = reconcile("synthetic_key_indicators.csv", raw, key_indicators_analysis, 3,
+                                                ["date"], workdir, replay_months=SYNTHETIC_MONTHS)
+        print(f"✅ {N_SYNTHETIC} synthetic indicators ({len(raw):,} rows): identical to full recompute "
+              f"(incremental {incremental_time:.1f} s, full {full_time:.1f} s)")
@@ -3,6 +3,9 @@ import warnings
 import pandas as pd
 from sqlalchemy import create_engine
 from dotenv import load_dotenv
+from artifact_manifest import update_manifest
+from home_summary import update_home_summary
+from feature_engine import FeatureFrame
 import json
 import google.generativeai as genai
 
@@ -36,23 +39,14 @@ def load_agriculture_data(engine):
     return pd.read_sql(query, engine)
 
 def analyse_growth_rates(df):
-    growth_data = []
-    for commodity in df['commodity'].unique():
-        subset = df[(df['commodity'] == commodity)].sort_values('date')
-        if len(subset) < 2:
-            continue
-        start_value = subset.iloc[0]['value']
-        end_value = subset.iloc[-1]['value']
-        years = (subset.iloc[-1]['date'] - subset.iloc[0]['date']).days / 365.25
-        if start_value > 0 and years > 0:
-            cagr = (end_value / start_value) ** (1/years) - 1
-            growth_data.append({
-                'Commodity': commodity,
-                'Start Value': start_value,
-                'End Value': end_value,
-                'CAGR (%)': cagr * 100
-            })
-    return pd.DataFrame(growth_data).sort_values('CAGR (%)', ascending=False)
+    growth = FeatureFrame(df, series='commodity').cagr()
+    growth_df = pd.DataFrame({
+        'Commodity': growth.index,
+        'Start Value': growth['start_value'].to_numpy(),
+        'End Value': growth['end_value'].to_numpy(),
+        'CAGR (%)': growth['cagr'].to_numpy() * 100
+    })
+    return growth_df.sort_values('CAGR (%)', ascending=False)
 
 # Save
 def save_aggregated_data(df, output_dir=eda_path):
@@ -188,6 +182,9 @@ def main():
     # Generate AI insights
     generate_insights(stats_df, growth_df, corr_matrix, key_insights, eda_path)
 
+    # Record artifact versions (dashboard cache keys) and refresh this sector's Home summary
+    update_manifest(eda_path)
+    update_home_summary(eda_path)
     print(f"\n✅ All data saved to: {eda_path}")
     print("="*50)
 
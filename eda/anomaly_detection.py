@@ -0,0 +1,417 @@
+import os
+import json
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from rolling_state import series_counts, series_hashes, merge_totals
+from lead_lag import repeated_dates
+
+ALERTS_NAME = "alerts.json"
+STATE_NAME = "alerts.state.json"
+STATE_VERSION = 2
+
+# Detector settings. Changes are taken between a series' consecutive monthly observations,
+# so monthly, quarterly and annual indicators are all scored on their own cadence
+SETTINGS = {
+    "z_window": 24,          # trailing changes a new change is scored against
+    "z_min_periods": 12,
+    "z_threshold": 3.0,
+    "z_high": 4.0,
+    "cusum_drift": 0.5,      # allowance k, in standard deviations
+    "cusum_limit": 5.0,      # decision interval h
+    "shift_window": 36,      # trailing changes searched for a change point
+    "shift_min_segment": 6,
+    "shift_threshold": 4.0,
+    "shift_high": 6.0,
+    "event_months": 12,      # events older than this (before the latest month) are dropped
+    "recent_months": 3,      # events shown are this close to their series' latest observation
+    "max_alerts": 25         # per domain in alerts.json
+}
+
+DETECTOR_BASIS = {
+    "zscore": "Change scored against the previous {z_window} changes (rolling z-score)",
+    "cusum": "Cumulative drift beyond {cusum_drift} standard deviations per period (CUSUM, h = {cusum_limit})",
+    "level_shift": "Best split of the last {shift_window} changes into two regimes (change-point t-test)"
+}
+
+
+# Month number (year * 12 + month - 1) and back to a month-start date
+def month_numbers(dates):
+    dates = pd.to_datetime(dates)
+    return (dates.dt.year * 12 + dates.dt.month - 1).astype("int64")
+
+
+def month_label(month, fmt="%Y-%m-%d"):
+    return datetime(int(month) // 12, int(month) % 12 + 1, 1).strftime(fmt)
+
+
+def format_number(x):
+    return f"{x:,.0f}" if abs(x) >= 1000 else f"{x:.3g}"
+
+
+# Long (date, series, value) rows -> one row per series and month (monthly mean), sorted,
+# with the change since the series' previous observation. Only sub-monthly observations of
+# one series are averaged; keys with several rows on one date hold distinct entities and are
+# left out rather than scored as their mean
+def monthly_observations(df, series="series", date="date", value="value", labels=("domain", "name")):
+    repeated = repeated_dates(df, series, date)
+    if len(repeated):
+        print(f"⚠️ Warning: {len(repeated):,} series have several rows on one date and are not scored "
+              f"(e.g. {repeated[0]})")
+        df = df[~df[series].isin(repeated)]
+    labels = [c for c in labels if c in df.columns]
+    obs = df.assign(month=month_numbers(df[date])).groupby([series, "month"], sort=True, observed=True).agg(
+        value=(value, "mean"), **{c: (c, "first") for c in labels}).reset_index()
+    obs = obs[np.isfinite(obs["value"])].rename(columns={series: "series"}).reset_index(drop=True)
+    obs["change"] = obs.groupby("series", sort=False)["value"].diff()
+    return obs
+
+
+# The last `depth` observations of each series as (depth, S) matrices, right-aligned so the
+# bottom row is every series' latest observation; shorter series are NaN-padded on top
+def right_aligned(obs, depth, columns=("change", "value", "month")):
+    codes, names = pd.factorize(obs["series"], sort=False)
+    counts = np.bincount(codes, minlength=len(names))
+    position = obs.groupby(codes, sort=False).cumcount().to_numpy()
+    from_end = counts[codes] - 1 - position
+    keep = from_end < depth
+    rows, cols = depth - 1 - from_end[keep], codes[keep]
+    matrices = {}
+    for c in columns:
+        m = np.full((depth, len(names)), np.nan)
+        m[rows, cols] = obs[c].to_numpy(dtype="float64")[keep]
+        matrices[c] = m
+    return names, matrices
+
+
+def trailing_zscores(changes, rows, window, min_periods):
+    """z-score of changes[r] against the `window` changes above it, for each row r in rows.
+
+    The window sums are accumulated one offset at a time in a fixed order, so a cell's score
+    depends only on its own trailing values, not on how many rows the matrix holds.
+    """
+    n_series = changes.shape[1]
+    padded = np.vstack([np.full((window, n_series), np.nan), changes])
+    observed = ~np.isnan(padded)
+    filled = np.where(observed, padded, 0.0)
+    r = np.asarray(rows) + window
+
+    count = np.zeros((len(r), n_series))
+    total = np.zeros((len(r), n_series))
+    for j in range(1, window + 1):
+        count += observed[r - j]
+        total += filled[r - j]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = total / count
+        squares = np.zeros((len(r), n_series))
+        for j in range(1, window + 1):
+            squares += np.where(observed[r - j], (filled[r - j] - mean) ** 2, 0.0)
+        std = np.sqrt(squares / (count - 1))
+        z = (padded[r] - mean) / std
+    z[(count < min_periods) | ~(std > 0)] = np.nan
+    return z
+
+
+def cusum(z, pos, neg, drift, limit, clip):
+    """Two-sided CUSUM down the rows of z; NaN leaves a series' sums unchanged.
+
+    z is clipped at +/- clip so a single outlier (the z-score detector's job) cannot fire it
+    alone. Returns alarm scores (+ve for upward drift, -ve downward, 0 none) and the upper
+    and lower sums after every row; sums restart at zero after an alarm.
+    """
+    pos, neg = pos.copy(), neg.copy()
+    alarms = np.zeros(z.shape)
+    pos_rows, neg_rows = np.zeros(z.shape), np.zeros(z.shape)
+    for t in range(len(z)):
+        zt = np.clip(z[t], -clip, clip)
+        seen = ~np.isnan(zt)
+        pos = np.where(seen, np.maximum(0.0, pos + zt - drift), pos)
+        neg = np.where(seen, np.maximum(0.0, neg - zt - drift), neg)
+        up, down = pos > limit, neg > limit
+        alarms[t] = np.where(up, pos, 0.0) - np.where(down, neg, 0.0)
+        pos[up | down] = 0.0
+        neg[up | down] = 0.0
+        pos_rows[t], neg_rows[t] = pos, neg
+    return alarms, pos_rows, neg_rows
+
+
+def level_shifts(changes, min_segment):
+    """Best single split of each column of a (window, S) matrix into two mean regimes.
+
+    Returns (t, split row) per series: t is the pooled two-sample t statistic of the
+    regime after the split against the one before; NaN where no split leaves min_segment
+    observations on both sides.
+    """
+    observed = ~np.isnan(changes)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Standardize each window first so the one-pass sums below stay accurate
+        x = (changes - np.nanmean(changes, axis=0)) / np.nanstd(changes, axis=0)
+    x = np.where(observed, x, 0.0)
+
+    n1 = np.cumsum(observed, axis=0)[:-1]
+    s1 = np.cumsum(x, axis=0)[:-1]
+    q1 = np.cumsum(x * x, axis=0)[:-1]
+    n, s, q = n1[-1:] + observed[-1:], s1[-1:] + x[-1:], q1[-1:] + x[-1:] ** 2
+    n2, s2, q2 = n - n1, s - s1, q - q1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        within = (q1 - s1 ** 2 / n1) + (q2 - s2 ** 2 / n2)
+        pooled = within / (n1 + n2 - 2)
+        t = (s2 / n2 - s1 / n1) / np.sqrt(pooled * (1 / n1 + 1 / n2))
+    # Splits must fall right before an observation, with enough points on both sides
+    valid = (n1 >= min_segment) & (n2 >= min_segment) & observed[1:] & np.isfinite(t)
+    t = np.where(valid, t, np.nan)
+    has_split = valid.any(axis=0)
+    best = np.argmax(np.where(valid, np.abs(t), -1.0), axis=0)
+    cols = np.arange(changes.shape[1])
+    best_t = np.where(has_split, t[best, cols], np.nan)
+    return best_t, best + 1
+
+
+class AlertState:
+    """Detector state of every series, persisted next to alerts.json.
+
+    Per series it keeps the last settled month, the CUSUM sums after it, the count of settled
+    observations, a hash of the last z_window + 1 of them (all a new change is scored
+    against) and a running hash of them all; recent events are kept with it. A series'
+    latest month may still be filling in (daily data averaged into a partial month), so it is
+    re-scored on every run and only earlier months settle. A refresh scores only months
+    after each series' last settled one (trailing windows are re-read from the data).
+
+    Like RollingState, a refresh hashes only the settled tails: lost or added observations
+    show in the counts and a revision inside the scoring window in the tail hash, either
+    triggering a full recompute. An older revision is caught only with verify_history,
+    which hashes every settled observation against the running hash.
+    """
+
+    def __init__(self, outputs_dir, settings=SETTINGS):
+        self.path = os.path.join(outputs_dir, STATE_NAME)
+        self.settings = settings
+
+    def load(self):
+        """Stored state, or None when there is none or it was built with other settings"""
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("version") != STATE_VERSION or state.get("settings") != self.settings:
+            return None
+        return state
+
+    def save(self, last_month, counts, tail_hashes, history_hashes, cusum_sums, events):
+        state = {
+            "version": STATE_VERSION,
+            "settings": self.settings,
+            "last_month": last_month,
+            "counts": counts,
+            "tail_hashes": tail_hashes,
+            "history_hashes": history_hashes,
+            "cusum": cusum_sums,
+            "events": events
+        }
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+
+
+# z-score and CUSUM events of the observations flagged new, and each series' CUSUM sums
+# after its second-to-last observation (the last settled one); trailing windows come from
+# the observations before the new ones
+def stream_events(obs, is_new, cusum_sums, settings):
+    new_counts = obs.loc[is_new, "series"].value_counts()
+    if new_counts.empty:
+        return [], {}
+    scored = obs[obs["series"].isin(new_counts.index)]
+    n_new = int(new_counts.max())
+    depth = n_new + 1 + settings["z_window"]
+    names, m = right_aligned(scored, depth, columns=("change", "value", "month"))
+
+    # Bottom rows hold the new observations (plus one settled row above them, so the
+    # settled sums are always a row of the output); older cells are context only
+    rows = np.arange(depth - n_new - 1, depth)
+    z = trailing_zscores(m["change"], rows, settings["z_window"], settings["z_min_periods"])
+    fresh = (depth - rows)[:, None] <= new_counts.reindex(names).to_numpy()[None, :]
+    z[~fresh] = np.nan
+
+    start = np.array([cusum_sums.get(s, [0.0, 0.0]) for s in names], dtype="float64").reshape(-1, 2)
+    alarms, pos, neg = cusum(z, start[:, 0], start[:, 1], settings["cusum_drift"], settings["cusum_limit"],
+                             settings["z_threshold"])
+
+    events = []
+    months, values, changes = m["month"][rows], m["value"][rows], m["change"][rows]
+    for detector, scores, hit in [("zscore", z, np.abs(np.nan_to_num(z)) >= settings["z_threshold"]),
+                                  ("cusum", alarms, alarms != 0)]:
+        for r, c in zip(*np.nonzero(hit)):
+            events.append({
+                "series": names[c],
+                "month": int(months[r, c]),
+                "detector": detector,
+                "score": float(scores[r, c]),
+                "value": float(values[r, c]),
+                "change": float(changes[r, c])
+            })
+    events.sort(key=lambda e: (e["month"], e["series"], e["detector"]))
+    return events, {s: [float(p), float(n)] for s, p, n in zip(names, pos[-2], neg[-2])}
+
+
+# Change points in the last shift_window changes of every series, kept when the new regime
+# began within the event horizon
+def shift_events(obs, latest_month, settings):
+    names, m = right_aligned(obs, settings["shift_window"])
+    changes = m["change"]
+    t, split = level_shifts(changes, settings["shift_min_segment"])
+    events = []
+    for c in np.nonzero(np.abs(np.nan_to_num(t)) >= settings["shift_threshold"])[0]:
+        start = int(m["month"][split[c], c])
+        if start <= latest_month - settings["event_months"]:
+            continue
+        before, after = changes[:split[c], c], changes[split[c]:, c]
+        events.append({
+            "series": names[c],
+            "month": start,
+            "detector": "level_shift",
+            "score": float(t[c]),
+            "value": float(m["value"][-1, c]),
+            "change": float(np.nanmean(after)),
+            "before": float(np.nanmean(before))
+        })
+    return events
+
+
+def alert_record(event, labels, last_month, settings):
+    name = labels.get("name", {}).get(event["series"], event["series"])
+    detector, score = event["detector"], event["score"]
+    direction = "up" if score > 0 else "down"
+    month = month_label(event["month"], "%b %Y")
+    if detector == "zscore":
+        severity = "high" if abs(score) >= settings["z_high"] else "medium"
+        title = f"UNUSUAL {'RISE' if score > 0 else 'DROP'}: {name}"
+        message = (f"{name} {'rose' if score > 0 else 'fell'} by {format_number(abs(event['change']))} in {month}, "
+                   f"{abs(score):.1f} standard deviations from its usual change.")
+    elif detector == "cusum":
+        severity = "medium"
+        title = f"SUSTAINED {'UPWARD' if score > 0 else 'DOWNWARD'} DRIFT: {name}"
+        message = (f"{name} has kept moving {direction} faster than usual through {month} "
+                   f"(cumulative drift {abs(score):.1f}σ).")
+    else:
+        severity = "high" if abs(score) >= settings["shift_high"] else "medium"
+        title = f"REGIME SHIFT: {name}"
+        message = (f"Average change of {name} moved from {format_number(event['before'])} to "
+                   f"{format_number(event['change'])} per period since {month} (t = {score:.1f}).")
+    return {
+        "series": event["series"],
+        "name": name,
+        "detector": detector,
+        "date": month_label(event["month"]),
+        "last_date": month_label(last_month),
+        "direction": direction,
+        "severity": severity,
+        "score": round(score, 2),
+        "value": event["value"],
+        "title": title,
+        "message": message,
+        "basis": DETECTOR_BASIS[detector].format(**settings)
+    }
+
+
+def build_alerts(events, obs, settings):
+    """Compact per-domain alert lists for the dashboards: recent events, most severe first"""
+    last = obs.groupby("series", sort=False)["month"].max()
+    latest = int(last.max()) if len(last) else None
+    labels = {c: obs.groupby("series", sort=False)[c].first().to_dict() for c in ("domain", "name") if c in obs}
+    series_domain = labels.get("domain", {})
+
+    domains = {}
+    for domain, count in pd.Series(series_domain, dtype=object).value_counts().sort_index().items():
+        domains[domain] = {"series": int(count), "alerts": []}
+    for event in events:
+        series_last = int(last.get(event["series"], -1))
+        if event["month"] <= series_last - settings["recent_months"]:
+            continue
+        domain = series_domain.get(event["series"], "other")
+        entry = domains.setdefault(domain, {"series": 0, "alerts": []})
+        entry["alerts"].append(alert_record(event, labels, series_last, settings))
+
+    for entry in domains.values():
+        entry["total"] = len(entry["alerts"])
+        entry["alerts"] = sorted(entry["alerts"], key=lambda a: (a["severity"] != "high", -abs(a["score"]),
+                                                                 a["series"], a["detector"], a["date"]))[:settings["max_alerts"]]
+    return {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "latest_date": month_label(latest) if latest is not None else None,
+        "series_monitored": int(len(last)),
+        "domains": domains
+    }
+
+
+def load_alerts(outputs_dir):
+    try:
+        with open(os.path.join(outputs_dir, ALERTS_NAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"domains": {}}
+
+
+# Hashes of the last `depth` observations of every series (keyed rows are in series/month order)
+def tail_hashes(keyed, depth):
+    return series_hashes(keyed.groupby("series", sort=False).tail(depth), "series")
+
+
+def update_alerts(df, outputs_dir, series="series", date="date", value="value", settings=SETTINGS,
+                  verify_history=False):
+    """Score new observations of every series and write <outputs>/alerts.json.
+
+    df holds long (date, series, value) rows, optionally with domain and name columns used to
+    group and label the alerts. verify_history also checks settled observations older than
+    the scoring window for revisions.
+    """
+    obs = monthly_observations(df, series, date, value)
+    state = AlertState(outputs_dir, settings)
+    stored = state.load()
+    keyed = obs[["series", "month", "value"]]
+    depth = settings["z_window"] + 1
+
+    is_new = None
+    if stored is not None:
+        cutoff = obs["series"].map(stored["last_month"])
+        is_new = cutoff.isna() | (obs["month"] > cutoff)
+        # Revised history: a series lost or gained settled observations, or one inside the
+        # scoring window changed
+        history = keyed[~is_new]
+        if series_counts(history, "series") != stored["counts"] or \
+                tail_hashes(history, depth) != stored["tail_hashes"] or \
+                (verify_history and series_hashes(history, "series") != stored["history_hashes"]):
+            is_new = None
+
+    if is_new is None:
+        is_new = pd.Series(True, index=obs.index)
+        stored = {"last_month": {}, "counts": {}, "history_hashes": {}, "cusum": {}, "events": []}
+        print(f"♻️ alerts: full scan ({obs['series'].nunique():,} series, {len(obs):,} observations)")
+    else:
+        print(f"♻️ alerts: {int(is_new.sum()):,} new observations")
+
+    events, sums = stream_events(obs, is_new.to_numpy(), stored["cusum"], settings)
+    latest = int(obs["month"].max()) if len(obs) else 0
+    events = sorted((e for e in stored["events"] + events if e["month"] > latest - settings["event_months"]),
+                    key=lambda e: (e["month"], e["series"], e["detector"]))
+
+    # Everything but each series' latest month settles into the state
+    last_months = obs.groupby("series", sort=False)["month"].max()
+    settled = is_new & (obs["month"] < obs["series"].map(last_months))
+    settled_series = set(obs.loc[settled, "series"])
+    state.save(
+        {**stored["last_month"], **{str(k): int(v) for k, v in obs[settled].groupby("series")["month"].max().items()}},
+        merge_totals(stored["counts"], series_counts(keyed[settled], "series")),
+        tail_hashes(keyed[~is_new | settled], depth),
+        merge_totals(stored["history_hashes"], series_hashes(keyed[settled], "series"), modulo=2 ** 64),
+        {**stored["cusum"], **{k: v for k, v in sums.items() if k in settled_series}},
+        [e for e in events if e["month"] < last_months[e["series"]]]
+    )
+
+    alerts = build_alerts(events + shift_events(obs, latest, settings), obs, settings)
+    path = os.path.join(outputs_dir, ALERTS_NAME)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(alerts, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+    print(f"🚨 alerts: {sum(d['total'] for d in alerts['domains'].values()):,} across "
+          f"{alerts['series_monitored']:,} series")
+    return alerts
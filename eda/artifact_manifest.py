@@ -0,0 +1,84 @@
+import os
+import json
+import hashlib
+from datetime import datetime
+
+MANIFEST_NAME = "manifest.json"
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def scan_sector(sector_dir):
+    files = {}
+    for entry in sorted(os.scandir(sector_dir), key=lambda e: e.name):
+        if not entry.is_file() or entry.name.startswith("."):
+            continue
+        stat = entry.stat()
+        files[entry.name] = {
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "sha256": file_sha256(entry.path)
+        }
+    return files
+
+
+# One version string per sector: changes only when a file is added, removed or its content changes
+def sector_version(files):
+    digest = hashlib.sha256()
+    for name, meta in sorted(files.items()):
+        digest.update(f"{name}:{meta['sha256']}\n".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def load_manifest(outputs_dir):
+    path = os.path.join(outputs_dir, MANIFEST_NAME)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"sectors": {}}
+
+
+def update_manifest(sector_dir):
+    """Record the sector's artifacts (mtime, size, sha256) in <outputs>/manifest.json"""
+    sector_dir = os.path.abspath(sector_dir)
+    outputs_dir = os.path.dirname(sector_dir)
+    sector = os.path.basename(sector_dir)
+
+    manifest = load_manifest(outputs_dir)
+    files = scan_sector(sector_dir)
+    version = sector_version(files)
+    now = datetime.now().isoformat(timespec="seconds")
+
+    previous = manifest.get("sectors", {}).get(sector, {})
+    manifest.setdefault("sectors", {})[sector] = {
+        "version": version,
+        # Re-running without changes keeps the original refresh time
+        "updated_at": previous.get("updated_at", now) if previous.get("version") == version else now,
+        "files": files
+    }
+    manifest["generated_at"] = now
+
+    # Write to a temp file and swap, so the dashboard never reads a half-written manifest
+    path = os.path.join(outputs_dir, MANIFEST_NAME)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+    print(f"🗂️ Manifest updated for {sector} (version {version})")
+    return manifest
+
+
+if __name__ == "__main__":
+    # Rebuild the manifest for every sector folder, e.g. after copying outputs by hand
+    outputs_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "outputs")
+    for entry in sorted(os.scandir(outputs_dir), key=lambda e: e.name):
+        if entry.is_dir():
+            update_manifest(entry.path)
@@ -1,11 +1,16 @@
 import os
-import re
 import warnings
 import pandas as pd
 import json
 from collections import Counter
 from sqlalchemy import create_engine
 from dotenv import load_dotenv
+from artifact_manifest import update_manifest
+from home_summary import update_home_summary
+from keyword_matcher import KeywordMatcher
+from text_normalizer import TextNormalizer
+from term_index import update_term_index
+from rollup_cube import RollupCube
 import google.generativeai as genai
 
 # Configuration
@@ -61,89 +66,72 @@ stop_words = [
     'Seoul', 'ADEX', '통합홍보관', '관사', '동원훈련장','취사식당'
 ]
 
-def clean_texts(indicator):
-    s = str(indicator)
+# Contract names cleaned and tokenised once per distinct name, shared by every analysis
+normalizer = TextNormalizer()
 
-    # Remove administrative prefixes
-    if ' - ' in s:
-        s = s.rsplit(' - ', 1)[-1]
+# Bid rows with cleaned names and tokens; the analyses below filter this one frame
+def prepare_bid_info(df):
+    bid_df = df[df['file_source'] == 'bid_info_processed'].copy()
+    bid_df['clean_indicator'] = normalizer.clean(bid_df['indicator'])
+    bid_df['tokens'] = normalizer.tokens(bid_df['indicator'])
+    return bid_df
 
-    # Remove year patterns (including quoted years and ranges)
-    s = re.sub(r"('?\d{2}년~'?\d{2}년)", '', s)  # 25년~27년
-    s = re.sub(r"('?\d{2}~'?\d{2}년)", '', s)  # 25~27년
-    s = re.sub(r"('?\d{2}~'?\d{2})", '', s)      # '25~'29
-    s = re.sub(r"'?\d{2}년", '', s)               # '25년 or 25년
-    s = re.sub(r"'?\d{2}\s", ' ', s)              # '25 (standalone)
-    
-    # Remove quotation marks
-    s = re.sub(r'[\'"]', '', s)
-    
-    # Clean up remaining artifacts
-    s = re.sub(r'\s*~\s*', ' ', s)  # Clean ~ with spaces
-    s = re.sub(r'\s+', ' ', s).strip()  # Normalise whitespace
-    
-    return s
+# Swap the raw name for the cleaned one and drop the shared helper columns
+def with_clean_names(df):
+    return df.assign(indicator=df['clean_indicator']).drop(columns=['clean_indicator', 'tokens'])
 
 # High-value contracts (value >= 10 billion KRW)
-def high_value_contracts(df):
-    bid_df = df[df['file_source'] == 'bid_info_processed'].copy()
-    high_value_df = bid_df[bid_df['value'] >= 10000000000].copy()
+def high_value_contracts(bid_df):
+    high_value_df = with_clean_names(bid_df[bid_df['value'] >= 10000000000])
     high_value_df['category'] = 'High-Value (≥ 10B KRW)'
-    high_value_df['indicator'] = high_value_df['indicator'].apply(clean_texts)
     return high_value_df
 
 # Emergency procurement (value > 50 million KRW)
-def emergency_procurement(df):
-    bid_df = df[df['file_source'] == 'bid_info_processed'].copy()
-    emergency_df = bid_df[bid_df['indicator'].str.contains('긴급', na=False) & (bid_df['value'] > 50000000)].copy()
+def emergency_procurement(bid_df):
+    emergency_df = with_clean_names(bid_df[bid_df['indicator'].str.contains('긴급', na=False) & (bid_df['value'] > 50000000)])
     emergency_df['category'] = 'Emergency Procurement'
-    emergency_df['indicator'] = emergency_df['indicator'].apply(clean_texts)
     return emergency_df
 
 # Frequent word analysis (value >= 500 million KRW)
-def frequent_word_analysis(df):
-    bid_df = df[df['file_source'] == 'bid_info_processed'].copy()
-    value_500m_df = bid_df[bid_df['value'] >= 500000000].copy()
-    value_500m_df['category'] = 'Medium-Value (≥ 500M KRW)'
+def frequent_word_analysis(bid_df):
+    value_500m_df = bid_df[bid_df['value'] >= 500000000]
 
-    # Clean and tokenise
-    value_500m_df['indicator'] = value_500m_df['indicator'].apply(clean_texts)
-    all_tokens = []
-    for text in value_500m_df['indicator']:
-        tokens = re.findall(r'[가-힣]{2,}|[A-Za-z]{2,}\d*[A-Za-z]*', text)
-        filtered = [token for token in tokens 
-                    if token not in stop_words and not re.fullmatch(r'\d+', token)]
-        all_tokens.extend(filtered)
+    # Tokens of every contract in row order, without stop words
+    all_tokens = value_500m_df['tokens'].explode().dropna()
+    all_tokens = all_tokens[~all_tokens.isin(stop_words) & ~all_tokens.str.fullmatch(r'\d+')]
+    value_500m_df = with_clean_names(value_500m_df)
+    value_500m_df['category'] = 'Medium-Value (≥ 500M KRW)'
 
     # Count frequency and find meaningful words
-    word_counts = Counter(all_tokens)
+    word_counts = Counter(all_tokens.tolist())
     meaningful_words = [word for word, count in word_counts.items() if count >= 3]
 
-    # Find matching rows for meaningful words and update category with frequency
-    frequent_df = value_500m_df[
-        value_500m_df['indicator'].apply(lambda x: any(word in x for word in meaningful_words))
-    ].copy()
-
-    # Update category to show frequency for each matched item
-    for idx, indicator_text in frequent_df['indicator'].items():
-        matching_words = [word for word in meaningful_words if word in indicator_text]
-        if matching_words:
-            # Get the highest frequency among matching words
-            max_freq = max(word_counts[word] for word in matching_words)
-            frequent_df.loc[idx, 'category'] = f"Frequent Items ({max_freq} times)"
+    # One compiled scan finds every meaningful word in each contract; rows containing any
+    # are kept, labelled with the highest frequency among the words they contain
+    matcher = KeywordMatcher({word: word_counts[word] for word in meaningful_words})
+    max_freq = matcher.best_scores(value_500m_df['indicator'])
+    frequent_df = value_500m_df[value_500m_df.index.isin(max_freq.index)].copy()
+    frequent_df['category'] = "Frequent Items (" + frequent_df.index.map(max_freq).astype(int).astype(str) + " times)"
     
     return frequent_df, meaningful_words, word_counts
 
 def save_eda_data(df, output_dir=eda_path):
     os.makedirs(output_dir, exist_ok=True)
+    bid_df = prepare_bid_info(df)
+
+    # Ammunition terms are annotated wherever terms are listed
+    ammunition_keywords = {"mm", "밀리"}
+
+    # Persistent term index over every bid; only contracts not indexed before are added
+    update_term_index(bid_df, output_dir, stop_words, labels={w: f"{w} (탄약)" for w in ammunition_keywords})
 
-    high_value_df = high_value_contracts(df).drop_duplicates(subset=['indicator', 'value', 'date'])
+    high_value_df = high_value_contracts(bid_df).drop_duplicates(subset=['indicator', 'value', 'date'])
     high_value_df.to_csv(f'{output_dir}/high_value_contracts.csv', index=False, encoding='utf-8-sig')
  
-    emergency_df = emergency_procurement(df).drop_duplicates(subset=['indicator', 'value', 'date'])
+    emergency_df = emergency_procurement(bid_df).drop_duplicates(subset=['indicator', 'value', 'date'])
     emergency_df.to_csv(f'{output_dir}/emergency_contracts.csv', index=False, encoding='utf-8-sig')
     
-    frequent_items_df, meaningful_words, word_counts = frequent_word_analysis(df)
+    frequent_items_df, meaningful_words, word_counts = frequent_word_analysis(bid_df)
     frequent_items_df.to_csv(f'{output_dir}/frequent_items.csv', index=False, encoding='utf-8-sig')
     
     # Combined results
@@ -152,8 +140,9 @@ def save_eda_data(df, output_dir=eda_path):
     combined_df = combined_df.sort_values('value', ascending=False)
     combined_df.to_csv(f'{output_dir}/defense_contracts_analysis.csv', index=False, encoding='utf-8-sig')
 
-    # Word frequency analysis
-    ammunition_keywords = {"mm", "밀리"}
+    # Contract value by month, quarter and year, over all contracts and per category
+    cube_rows = pd.concat([combined_df.assign(series="All contracts"), combined_df.assign(series=combined_df['category'])])
+    RollupCube.from_rows(cube_rows, series='series').save(output_dir)
 
     # Word frequency analysis with annotation
     word_frequency_df = pd.DataFrame([
@@ -322,6 +311,9 @@ if __name__ == "__main__":
         # Run Gemini insight generation
         generate_insights(insights, combined_data, insight_text, eda_path)
 
+        # Record artifact versions (dashboard cache keys) and refresh this sector's Home summary
+        update_manifest(eda_path)
+        update_home_summary(eda_path)
         print(f"\n✅ All data saved to: {eda_path}")
         print("="*50)
         
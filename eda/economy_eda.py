@@ -4,6 +4,14 @@ import pandas as pd
 import json
 from sqlalchemy import create_engine
 from dotenv import load_dotenv
+from artifact_manifest import update_manifest
+from home_summary import update_home_summary
+from serving_layer import update_serving_frames
+from feature_engine import FeatureFrame
+from rolling_state import update_rolling_output
+from lead_lag import monthly_grid, monthly_changes, lead_lag_table, repeated_dates
+from anomaly_detection import update_alerts
+from series_store import SeriesStore
 import numpy as np
 import google.generativeai as genai
 from scipy.stats import pearsonr
@@ -80,6 +88,24 @@ def load_economic_indicators_data():
     df_economic_indicators['indicator'] = df_economic_indicators['indicator'].replace(indicator_rename_map)
     return df_economic_indicators
 
+# Load every numeric indicator of every sector from the unified view
+def load_unified_indicators():
+    query = """
+    SELECT date, domain, indicator, country, partner, value
+    FROM unified_macro_view
+    WHERE value IS NOT NULL AND insight IS NULL
+    ORDER BY date
+    """
+    df_unified = pd.read_sql(query, engine)
+    df_unified['date'] = pd.to_datetime(df_unified['date'])
+    df_unified['indicator'] = df_unified['indicator'].replace({**indicator_rename_map, **sentiment_rename_map})
+    # One series per domain, indicator, country and trade partner; the view repeats an indicator
+    # across countries (IEA stocks, oil imports by supplier, steel by region) on every date
+    df_unified['series'] = df_unified['domain'] + ': ' + df_unified['indicator'] + \
+        df_unified['country'].map(lambda c: f' [{c}]' if pd.notna(c) and c else '') + \
+        df_unified['partner'].map(lambda p: f' ({p})' if pd.notna(p) and p else '')
+    return df_unified
+
 # Helper functions for key insights
 def get_latest_value(df, indicator_name, value_col='value'):
     if df.empty:
@@ -118,23 +144,19 @@ def sentiment_indicators_analysis(sentiment_df):
     if sentiment_df.empty:
         return sentiment_df
 
-    sentiment_processed = sentiment_df.copy()
-    sentiment_processed = sentiment_processed.sort_values(['indicator', 'date'])
+    features = FeatureFrame(sentiment_df, series='indicator')
+    sentiment_processed = features.frame.copy()
 
     # Momentum (MoM % change)
-    sentiment_processed['momentum'] = sentiment_processed.groupby('indicator')['value'].pct_change()
+    sentiment_processed['momentum'] = features.pct_change()
 
     # Absolute difference
-    sentiment_processed['value_lag1'] = sentiment_processed.groupby('indicator')['value'].shift(1)
+    sentiment_processed['value_lag1'] = features.shift(1)
     sentiment_processed['value_change'] = sentiment_processed['value'] - sentiment_processed['value_lag1']
 
     # Rolling Averages
-    sentiment_processed['ma_3m'] = sentiment_processed.groupby('indicator')['value'].transform(
-        lambda x: x.rolling(window=3, min_periods=1).mean()
-    )
-    sentiment_processed['ma_6m'] = sentiment_processed.groupby('indicator')['value'].transform(
-        lambda x: x.rolling(window=6, min_periods=1).mean()
-    )
+    sentiment_processed['ma_3m'] = features.rolling_mean(3, min_periods=1)
+    sentiment_processed['ma_6m'] = features.rolling_mean(6, min_periods=1)
 
     # Business-rule categorisation
     def categorize_sentiment(value):
@@ -153,7 +175,8 @@ def sentiment_indicators_analysis(sentiment_df):
 
     sentiment_processed['sentiment_strength'] = sentiment_processed['value'].apply(categorize_sentiment)
 
-    return sentiment_processed
+    # Month by month, so each refresh's rows go at the end of the saved file
+    return sentiment_processed.sort_values(['date', 'indicator'], kind='stable')
 
 # FX analysis
 def fx_analysis(fx_df):
@@ -164,43 +187,38 @@ def fx_analysis(fx_df):
     volatility_data = []
 
     latest_date = df_fx['date'].max()
-    three_months_ago = latest_date - pd.DateOffset(months=3)
-    twelve_months_ago = latest_date - pd.DateOffset(months=12)
-
-    for pair in df_fx['pair'].unique():
-        pair_data = df_fx[df_fx['pair'] == pair].sort_values('date').copy()
 
-        # Full returns column
-        pair_data['returns'] = pair_data['exchange_rate'].pct_change()
-
-        # --- 3-month volatility ---
-        recent_3m = pair_data[pair_data['date'] >= three_months_ago]
-        if len(recent_3m) > 1:
-            vol_3m = recent_3m['returns'].std() * 100
-            volatility_data.append({
-                'date': recent_3m['date'].iloc[-1].strftime('%Y-%m-%d'),
-                'indicator': f"{pair} Volatility (3M)",
-                'value': vol_3m,
-                'category': 'FX Volatility',
-                'pair': pair,
-                'current_rate': recent_3m['exchange_rate'].iloc[-1],
-                'rate_range': recent_3m['exchange_rate'].max() - recent_3m['exchange_rate'].min(),
-                'data_points': len(recent_3m)
-            })
+    # Daily returns for every pair in one pass over the pair/date-sorted rates
+    features = FeatureFrame(df_fx, series='pair', value='exchange_rate')
+    pair_data = features.frame.assign(returns=features.pct_change())
+
+    # Per-pair stats over the trailing 3 and 12 months, one grouped aggregation each
+    window_stats = {}
+    for label, months in {'3M': 3, '12M': 12}.items():
+        recent = pair_data[pair_data['date'] >= latest_date - pd.DateOffset(months=months)]
+        window_stats[label] = recent.groupby('pair', sort=False, observed=True).agg(
+            date=('date', 'last'),
+            volatility=('returns', 'std'),
+            current_rate=('exchange_rate', 'last'),
+            high=('exchange_rate', 'max'),
+            low=('exchange_rate', 'min'),
+            data_points=('exchange_rate', 'size')
+        )
 
-        # --- 12-month volatility ---
-        recent_12m = pair_data[pair_data['date'] >= twelve_months_ago]
-        if len(recent_12m) > 1:
-            vol_12m = recent_12m['returns'].std() * 100
+    for pair in df_fx['pair'].unique():
+        for label, stats in window_stats.items():
+            if pair not in stats.index or stats.loc[pair, 'data_points'] <= 1:
+                continue
+            row = stats.loc[pair]
             volatility_data.append({
-                'date': recent_12m['date'].iloc[-1].strftime('%Y-%m-%d'),
-                'indicator': f"{pair} Volatility (12M)",
-                'value': vol_12m,
+                'date': row['date'].strftime('%Y-%m-%d'),
+                'indicator': f"{pair} Volatility ({label})",
+                'value': row['volatility'] * 100,
                 'category': 'FX Volatility',
                 'pair': pair,
-                'current_rate': recent_12m['exchange_rate'].iloc[-1],
-                'rate_range': recent_12m['exchange_rate'].max() - recent_12m['exchange_rate'].min(),
-                'data_points': len(recent_12m)
+                'current_rate': row['current_rate'],
+                'rate_range': row['high'] - row['low'],
+                'data_points': int(row['data_points'])
             })
 
     return df_fx, volatility_data
@@ -212,16 +230,9 @@ def key_indicators_analysis(df_economic_indicators):
         
     df_processed = df_economic_indicators.copy()
     
-    # Add trend analysis
-    for indicator in df_processed['indicator'].unique():
-        mask = df_processed['indicator'] == indicator
-        indicator_data = df_processed[mask].sort_values('date').copy()
-
-        # Calculate rolling trend using trailing 3 values (pct_change between them)
-        indicator_data['trend_3m'] = indicator_data['value'].pct_change().rolling(2).mean()
-        
-        # Assign back
-        df_processed.loc[mask, 'trend_3m'] = indicator_data['trend_3m'].values
+    # Rolling trend using trailing 3 values (mean of the 2 pct_changes between them), all indicators at once
+    features = FeatureFrame(df_processed, series='indicator')
+    df_processed['trend_3m'] = features.rolling_mean(2, values=features.pct_change())
     
     return df_processed
 
@@ -273,7 +284,33 @@ def cross_correlation_analysis(df_economic_indicators, df_fx):
 
     return pd.DataFrame(correlation_results)
 
-def save_eda_data(df_economic_indicators, df_fx, df_sentiment, output_dir=eda_path):
+# Lead-lag analysis: lagged cross-correlations of monthly changes over all indicator pairs
+def lead_lag_analysis(df_unified):
+    if df_unified.empty:
+        return lead_lag_table(pd.DataFrame()), 0
+    changes = monthly_changes(monthly_grid(df_unified, series='series'))
+    return lead_lag_table(changes), changes.shape[1]
+
+# Series scanned for anomalies and kept in the series store: every unified indicator, with
+# defence bids (one row per contract, rarely repeated) rolled up into monthly procurement totals
+def anomaly_series(df_unified):
+    if df_unified.empty:
+        return pd.DataFrame(columns=['date', 'domain', 'series', 'name', 'value'])
+    is_bid = df_unified['domain'] == 'defence'
+    indicators = df_unified[~is_bid].assign(name=lambda d: d['series'].str.split(': ', n=1).str[-1])
+    if not is_bid.any():
+        return indicators[['date', 'domain', 'series', 'name', 'value']]
+
+    bids = df_unified[is_bid].assign(month=lambda d: d['date'].dt.to_period('M').dt.to_timestamp())
+    monthly = bids.groupby('month')['value'].agg(['sum', 'count']).reset_index()
+    rollups = [
+        pd.DataFrame({'date': monthly['month'], 'domain': 'defence', 'series': f'defence: {name}',
+                      'name': name, 'value': monthly[column].astype(float)})
+        for column, name in [('sum', 'Procurement bids - total value'), ('count', 'Procurement bids - count')]
+    ]
+    return pd.concat([indicators[['date', 'domain', 'series', 'name', 'value']], *rollups], ignore_index=True)
+
+def save_eda_data(df_economic_indicators, df_fx, df_sentiment, df_unified, output_dir=eda_path):
     os.makedirs(output_dir, exist_ok=True)
 
     df_fx, fx_volatility_data = fx_analysis(df_fx)
@@ -284,15 +321,31 @@ def save_eda_data(df_economic_indicators, df_fx, df_sentiment, output_dir=eda_pa
     df_economic_indicators.to_csv(f'{output_dir}/economic_indicators_raw.csv', index=False, encoding='utf-8-sig')
 
     # Processed data
-    key_indicators_df = key_indicators_analysis(df_economic_indicators)
-    key_indicators_df.to_csv(f'{output_dir}/key_indicators_processed.csv', index=False, encoding='utf-8-sig')
-
-    sentiment_analysis_df = sentiment_indicators_analysis(df_sentiment)
-    sentiment_analysis_df.to_csv(f'{output_dir}/sentiment_processed.csv', index=False, encoding='utf-8-sig')
+    # Monthly refreshes only append rows, so features are computed for the new rows alone
+    # (trend_3m looks back 2 rows, ma_6m 5); added or lost old rows, or a revised row inside
+    # that lookback, trigger a full recompute
+    update_rolling_output(df_economic_indicators, key_indicators_analysis,
+                          f'{output_dir}/key_indicators_processed.csv', series='indicator', depth=3, order=['date'])
+    update_rolling_output(df_sentiment, sentiment_indicators_analysis,
+                          f'{output_dir}/sentiment_processed.csv', series='indicator', depth=6,
+                          order=['date', 'indicator'])
 
     correlation_df = cross_correlation_analysis(df_economic_indicators, df_fx)
     correlation_df.to_csv(f'{output_dir}/cross_correlations.csv', index=False, encoding='utf-8-sig')
 
+    lead_lag_df, series_tested = lead_lag_analysis(df_unified)
+    lead_lag_df.to_csv(f'{output_dir}/lead_lag_table.csv', index=False, encoding='utf-8-sig')
+    significant_lead_lag = lead_lag_df[lead_lag_df['significance'] == 'Significant']
+
+    # Array-backed store of every indicator and anomaly alerts for every sector's dashboard, both
+    # written next to the sector folders; only observations after the last run are scored for
+    # alerts, a revised history triggers a full scan. Keys with several rows on one date hold
+    # distinct entities and are left out of the store (the alert scan warns about them)
+    outputs_dir = os.path.dirname(os.path.abspath(output_dir))
+    indicators = anomaly_series(df_unified)
+    SeriesStore.from_frame(indicators[~indicators['series'].isin(repeated_dates(indicators))]).save(outputs_dir)
+    alerts = update_alerts(indicators, outputs_dir)
+
     # FX Volatility (last 3 months)
     last_3_months_volatility = []
     if fx_volatility_data:
@@ -348,6 +401,20 @@ def save_eda_data(df_economic_indicators, df_fx, df_sentiment, output_dir=eda_pa
             "significant_correlations": len(correlation_df[correlation_df['significance'] == 'Significant']) if not correlation_df.empty else 0,
             "total_correlations": len(correlation_df) if not correlation_df.empty else 0
         },
+
+        # Lead-lag relationships across every sector's indicators
+        "lead_lag": {
+            "series_tested": series_tested,
+            "pairs_tested": len(lead_lag_df),
+            "significant_pairs": len(significant_lead_lag),
+            "top_relationships": significant_lead_lag.head(10).to_dict('records')
+        },
+
+        # Anomaly and regime-shift alerts on economy indicators
+        "anomaly_alerts": {
+            "series_monitored": alerts["series_monitored"],
+            "economy_alerts": [a["message"] for a in alerts["domains"].get("economy", {}).get("alerts", [])[:10]]
+        },
         
         # Data Quality & Coverage
         "data_quality": {
@@ -483,13 +550,20 @@ def main():
     df_fx = load_fx_data()
     df_sentiment = load_economy_sentiment_data()
     df_economic_indicators = load_economic_indicators_data()
+    df_unified = load_unified_indicators()
     
     # Run analysis and save results
-    insights = save_eda_data(df_economic_indicators, df_fx, df_sentiment)
+    insights = save_eda_data(df_economic_indicators, df_fx, df_sentiment, df_unified)
     
     # Generate AI insights
     generate_insights(insights, eda_path)
     
+    # Chart-ready frames first, so the manifest version covers them too
+    update_serving_frames(eda_path)
+
+    # Record artifact versions (dashboard cache keys) and refresh this sector's Home summary
+    update_manifest(eda_path)
+    update_home_summary(eda_path)
     print(f"\n✅ All data saved to: {eda_path}")
     print("="*50)
 
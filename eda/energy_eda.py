@@ -4,6 +4,8 @@ import pandas as pd
 import json
 from sqlalchemy import create_engine
 from dotenv import load_dotenv
+from artifact_manifest import update_manifest
+from home_summary import update_home_summary
 import google.generativeai as genai
 
 # Configuration
@@ -513,6 +515,9 @@ def main():
     # Generate AI insights
     generate_insights(insights, df_opec_summary, eda_path)
 
+    # Record artifact versions (dashboard cache keys) and refresh this sector's Home summary
+    update_manifest(eda_path)
+    update_home_summary(eda_path)
     print(f"\n✅ All data saved to: {eda_path}")
     print("="*50)
 
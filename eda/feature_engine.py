@@ -0,0 +1,195 @@
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+# Row order that puts each group's rows together (time order within a group is kept),
+# and each row's position inside its group
+def group_layout(n, groups=None):
+    if groups is None:
+        codes = np.zeros(n, dtype=np.int64)
+    else:
+        codes = pd.factorize(pd.Series(groups), use_na_sentinel=False)[0]
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    starts = np.r_[True, sorted_codes[1:] != sorted_codes[:-1]] if n else np.array([], dtype=bool)
+    first_row = np.maximum.accumulate(np.where(starts, np.arange(n), 0)) if n else np.array([], dtype=np.int64)
+    return order, np.arange(n) - first_row
+
+
+# Least-squares line through each trailing window (x = 0..k-1), for every row and group at once.
+# Built from windowed sums of y and x*y, so no window is fitted in Python; windows shorter than
+# `window` at the start of a group use only that group's rows, like rolling(window, min_periods)
+def rolling_trend(values, window, min_periods=None, groups=None):
+    """(slope, mean) arrays of the trailing window ending at each row; NaN below min_periods"""
+    y = np.asarray(values, dtype="float64")
+    n = len(y)
+    min_periods = window if min_periods is None else min_periods
+    if n == 0:
+        return np.array([]), np.array([])
+
+    order, position = group_layout(n, groups)
+    ys = y[order]
+    k = np.minimum(position + 1, window).astype("float64")
+
+    # Row i of `windows` holds the `window` values ending at ys[i]; columns before the
+    # window's own group start are masked out
+    padded = np.concatenate([np.full(window - 1, np.nan), ys])
+    windows = sliding_window_view(padded, window)
+    column = np.arange(window)
+    offset = window - k
+    in_window = column[None, :] >= offset[:, None]
+    windows = np.where(in_window, windows, 0.0)
+
+    sum_y = windows.sum(axis=1)
+    sum_xy = windows @ column - offset * sum_y
+    sum_x = k * (k - 1) / 2
+    sum_xx = (k - 1) * k * (2 * k - 1) / 6
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (k * sum_xy - sum_x * sum_y) / (k * sum_xx - sum_x ** 2)
+        mean = sum_y / k
+    too_short = k < max(min_periods, 2)
+    slope[too_short] = np.nan
+    mean[too_short] = np.nan
+
+    slope_out, mean_out = np.empty(n), np.empty(n)
+    slope_out[order] = slope
+    mean_out[order] = mean
+    return slope_out, mean_out
+
+
+def rolling_slope(values, window, min_periods=None, groups=None):
+    return rolling_trend(values, window, min_periods, groups)[0]
+
+
+# Trend slope relative to the window's level; 0 for a window averaging exactly zero
+def rolling_momentum(values, window, min_periods=None, groups=None):
+    slope, mean = rolling_trend(values, window, min_periods, groups)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        momentum = np.where(mean != 0, slope / mean, 0.0)
+    momentum[np.isnan(slope)] = np.nan
+    return momentum
+
+
+class FeatureFrame:
+    """A long (date, series, value) frame sorted once by series and date, with grouped features.
+
+    Every feature is computed for all series in one vectorized pass over the sorted arrays
+    and comes back as a Series on the frame's own index, so it can be assigned straight
+    back to the caller's frame whatever its row order.
+    """
+
+    def __init__(self, df, series="series_id", date="date", value="value"):
+        self.series, self.date, self.value = series, date, value
+        self.frame = df.sort_values([series, date], kind="stable")
+        n = len(self.frame)
+        # Codes follow first appearance, so after the sort each series is one contiguous block
+        self.codes = pd.factorize(self.frame[series], use_na_sentinel=False)[0]
+        self.starts = np.flatnonzero(np.r_[True, self.codes[1:] != self.codes[:-1]]) if n else np.array([], dtype=np.int64)
+        self.ends = np.r_[self.starts[1:], n].astype(np.int64)
+        self.position = np.arange(n) - np.repeat(self.starts, self.ends - self.starts)
+        self.values = self.frame[value].to_numpy(dtype="float64")
+
+    @classmethod
+    def from_store(cls, store, keys=None):
+        """Features over series read from a SeriesStore; its blocks are already in series/date
+        order, so nothing is sorted or factorized and only the selected blocks are read"""
+        features = cls.__new__(cls)
+        features.series, features.date, features.value = "series", "date", "value"
+        features.frame = store.frame(keys)
+        lengths = np.bincount(features.frame["series"].cat.codes.to_numpy(),
+                              minlength=len(features.frame["series"].cat.categories))
+        features.codes = np.repeat(np.arange(len(lengths)), lengths)
+        features.ends = np.cumsum(lengths).astype(np.int64)
+        features.starts = features.ends - lengths
+        features.position = np.arange(len(features.frame)) - np.repeat(features.starts, lengths)
+        features.values = features.frame["value"].to_numpy(dtype="float64")
+        return features
+
+    def __len__(self):
+        return len(self.frame)
+
+    def to_series(self, values):
+        return pd.Series(values, index=self.frame.index)
+
+    def array(self, values=None):
+        if values is None:
+            return self.values
+        return np.asarray(values, dtype="float64")
+
+    def shift(self, periods=1, values=None):
+        v = self.array(values)
+        out = np.full(len(v), np.nan)
+        if periods < len(v):
+            out[periods:] = v[:len(v) - periods]
+        out[self.position < periods] = np.nan
+        return self.to_series(out)
+
+    # MoM for periods=1, YoY for periods=12 on monthly data
+    def pct_change(self, periods=1, values=None):
+        v = self.array(values)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.to_series(v / self.shift(periods, v).to_numpy() - 1)
+
+    def diff(self, periods=1, values=None):
+        v = self.array(values)
+        return self.to_series(v - self.shift(periods, v).to_numpy())
+
+    # Trailing windows (rows x window) with cells from before the series start set to NaN
+    def windows(self, window, values=None):
+        v = self.array(values)
+        padded = np.concatenate([np.full(window - 1, np.nan), v])
+        view = sliding_window_view(padded, window)
+        outside = np.arange(window)[None, :] < (window - 1 - np.minimum(self.position, window - 1))[:, None]
+        return np.where(outside, np.nan, view)
+
+    def rolling_mean(self, window, min_periods=None, values=None):
+        w = self.windows(window, values)
+        count = (~np.isnan(w)).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = np.nansum(w, axis=1) / count
+        # pandas' compensated rolling sum turns any window holding an infinity into NaN
+        mean[np.isinf(w).any(axis=1)] = np.nan
+        mean[count < (window if min_periods is None else min_periods)] = np.nan
+        return self.to_series(mean)
+
+    # Windowed volatility: sample standard deviation of each trailing window
+    def rolling_std(self, window, min_periods=None, values=None):
+        w = self.windows(window, values)
+        count = (~np.isnan(w)).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = np.nansum(w, axis=1) / count
+            std = np.sqrt(np.nansum((w - mean[:, None]) ** 2, axis=1) / (count - 1))
+        std[(count < (window if min_periods is None else min_periods)) | (count < 2)] = np.nan
+        return self.to_series(std)
+
+    def rolling_momentum(self, window, min_periods=None):
+        return self.to_series(rolling_momentum(self.values, window, min_periods, groups=self.codes))
+
+    # Standard score against each series' own mean and sample standard deviation
+    def zscore(self, values=None):
+        v = pd.Series(self.array(values))
+        grouped = v.groupby(self.codes)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.to_series(((v - grouped.transform("mean")) / grouped.transform("std")).to_numpy())
+
+    # First and last row of every series, one row per series in sorted order
+    def endpoints(self):
+        names = self.frame[self.series].to_numpy()[self.starts]
+        dates = pd.to_datetime(self.frame[self.date])
+        return pd.DataFrame({
+            "rows": self.ends - self.starts,
+            "start_date": dates.to_numpy()[self.starts],
+            "end_date": dates.to_numpy()[self.ends - 1],
+            "start_value": self.values[self.starts],
+            "end_value": self.values[self.ends - 1]
+        }, index=pd.Index(names, name=self.series))
+
+    # Compound annual growth between each series' first and last observation
+    def cagr(self):
+        ends = self.endpoints()
+        ends["years"] = (ends["end_date"] - ends["start_date"]).dt.days / 365.25
+        valid = (ends["rows"] >= 2) & (ends["start_value"] > 0) & (ends["years"] > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ends["cagr"] = np.where(valid, (ends["end_value"] / ends["start_value"]) ** (1 / ends["years"]) - 1, np.nan)
+        return ends[valid]
@@ -3,6 +3,10 @@ import warnings
 import pandas as pd
 from sqlalchemy import create_engine
 from dotenv import load_dotenv
+from artifact_manifest import update_manifest
+from home_summary import update_home_summary
+from serving_layer import update_serving_frames
+from rollup_cube import RollupCube
 import json
 import google.generativeai as genai
 
@@ -231,25 +235,29 @@ def correlation_analysis(shipping_index_pivoted):
 
     return correlation_matrix
 
+# Rollup cube: each shipping index, plus every reading pooled, at monthly/quarterly/annual grain
+ALL_SHIPPING_INDICES = "All shipping indices"
+
+def build_shipping_cube(df):
+    rows = df[['date', 'indicator', 'value']]
+    pooled = rows.assign(indicator=ALL_SHIPPING_INDICES)
+    return RollupCube.from_rows(pd.concat([rows.dropna(subset=['indicator']), pooled], ignore_index=True),
+                                series='indicator')
+
 # Volatility Analysis
-def three_month_volatility_analysis(df):
-    df = df.copy()
-    df['date'] = pd.to_datetime(df['date'])
-    df['value'] = pd.to_numeric(df['value'], errors='coerce')
+def three_month_volatility_analysis(cube):
+    # Monthly mean of all index readings, read from the cube instead of resampling raw rows
+    monthly = cube.select('month', ALL_SHIPPING_INDICES).set_index('period')['mean']
+    if monthly.empty:
+        return pd.DataFrame(columns=['value'])
 
-    # Fill missing values
-    df_filled = df.fillna(method='ffill').fillna(method='bfill')
+    # Months without readings stay on the axis as gaps, labelled by month end as before
+    months = pd.date_range(monthly.index.min(), monthly.index.max(), freq='MS')
+    monthly_mean = monthly.reindex(months).to_frame('value')
+    monthly_mean.index = (months + pd.offsets.MonthEnd(0)).rename('date')
 
-    # Set 'date' as the index and sort it
-    df_filled = df_filled.set_index('date').sort_index()
-    
     # Debug info
-    print(f"Volatility analysis - data shape: {df_filled.shape}")
-    print(f"Volatility analysis - date range: {df_filled.index.min()} to {df_filled.index.max()}")
-
-    # Resample the data to a monthly frequency and calculate the mean for each month
-    monthly_mean = df_filled.resample('M')['value'].mean().to_frame()
-    
+    print(f"Volatility analysis - date range: {monthly_mean.index.min()} to {monthly_mean.index.max()}")
     print(f"Monthly mean shape: {monthly_mean.shape}")
 
     # Apply a rolling 3-month standard deviation (volatility) calculation
@@ -309,9 +317,13 @@ def save_trade_eda_outputs(
     except Exception as e:
         print(f"❌ Error processing correlation matrix: {e}")
 
+    # Rollup cube of the shipping indices, saved for the dashboard's period views
+    shipping_cube = build_shipping_cube(df_shipping_index)
+    shipping_cube.save(output_dir)
+
     # Rolling 3-Month Volatility
     try:
-        rolling_volatility = three_month_volatility_analysis(df_shipping_index)
+        rolling_volatility = three_month_volatility_analysis(shipping_cube)
         if not rolling_volatility.empty:
             rolling_volatility.to_csv(os.path.join(output_dir, "shipping_index_3m_volatility.csv"))
             print(f"✅ Rolling volatility saved: {rolling_volatility.shape}")
@@ -455,6 +467,12 @@ def main():
     # Generate Gemini insight text based on key stats
     generate_insights(key_insights, eda_path)
 
+    # Chart-ready frames first, so the manifest version covers them too
+    update_serving_frames(eda_path)
+
+    # Record artifact versions (dashboard cache keys) and refresh this sector's Home summary
+    update_manifest(eda_path)
+    update_home_summary(eda_path)
     print(f"\n✅ All data saved to: {eda_path}")
     print("="*50)
 
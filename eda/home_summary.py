@@ -0,0 +1,214 @@
+import os
+import json
+import pandas as pd
+from datetime import datetime
+
+SUMMARY_NAME = "home_summary.json"
+
+# Source datasets behind each dashboard: (file, series columns, date column).
+# Series columns of None means a wide table where every other column is one series.
+SECTOR_SERIES = {
+    "agriculture": [("production_yoy_change.csv", ["indicator", "commodity"], "date")],
+    "defence": [("defense_contracts_analysis.csv", ["category"], "date")],
+    "economy": [
+        ("economic_indicators_raw.csv", ["indicator"], "date"),
+        ("fx_raw.csv", ["pair"], "date"),
+        ("sentiment_raw.csv", ["indicator"], "date")
+    ],
+    "energy": [
+        ("iea_stocks_raw.csv", ["country"], "date"),
+        ("oil_imports_raw.csv", ["country", "unit"], "date")
+    ],
+    "industry": [
+        ("manufacturing_inventory_raw.csv", ["category"], "date"),
+        ("steel_production_raw.csv", ["region", "indicator"], "date")
+    ],
+    "global_trade": [
+        ("shipping_index_pivoted.csv", None, "date"),
+        ("trade_partners_top5.csv", ["country", "partner"], "date")
+    ],
+    "korea_trade": [
+        ("trade_balance.csv", ["partner"], "date"),
+        ("wsts_trend_monthly.csv", None, "date")
+    ]
+}
+
+# Headline KPIs shown on Home: (label, insights file, path into the JSON)
+HEADLINE_KPIS = {
+    "agriculture": [
+        ("Highest growth", "key_insights.json", ["highest_growth"]),
+        ("Highest CAGR (%)", "key_insights.json", ["highest_growth_rate"]),
+        ("Average CAGR (%)", "key_insights.json", ["average_growth"])
+    ],
+    "defence": [
+        ("Contracts analysed", "comprehensive_insights.json", ["summary_statistics", "total_contracts_analysed"]),
+        ("Total contract value (KRW)", "comprehensive_insights.json", ["summary_statistics", "total_contract_value"])
+    ],
+    "economy": [
+        ("KOSPI", "key_insights.json", ["market_indicators", "kospi", "latest"]),
+        ("Leading index", "key_insights.json", ["market_indicators", "leading_index", "latest"]),
+        ("Coincident index", "key_insights.json", ["market_indicators", "coincident_index", "latest"])
+    ],
+    "energy": [
+        ("Dominant supplier", "key_insights.json", ["import_analysis", "dependency_risk", "dominant_supplier"]),
+        ("Supplier dependency (%)", "key_insights.json", ["import_analysis", "dependency_risk", "max_dependency"])
+    ],
+    "global_trade": [
+        ("Shipping 3M volatility", "key_insights.json", ["shipping_index", "volatility_3m_std", "value"])
+    ],
+    "industry": [
+        ("Inventory avg YoY (%)", "key_insights.json", ["manufacturing_inventory", "average_yoy_change"]),
+        ("Steel period", "key_insights.json", ["steel_production", "metadata", "current_month"])
+    ],
+    "korea_trade": [
+        ("Top export partner", "key_insights.json", ["trade_balance", "top_export_partner"]),
+        ("Top value index item", "key_insights.json", ["value_index", "top_yoy_item"]),
+        ("Top chip region", "key_insights.json", ["semiconductors", "top_monthly_country"])
+    ]
+}
+
+# Gemini insight file per sector and the section Home shows from it
+GEMINI_FILES = {
+    "agriculture": "gemini_insight.txt",
+    "defence": "gemini_insight.txt",
+    "economy": "gemini_insights.txt",
+    "energy": "gemini_insight.txt",
+    "global_trade": "gemini_insight_gloal_trade.txt",
+    "industry": "gemini_insight.txt",
+    "korea_trade": "gemini_insights_korea_trade.txt"
+}
+ACTIONABLE_START = "### Top 1 actionable insight"
+ACTIONABLE_END = "### Key risks"
+
+# Strategic Implications sub-tabs: (label, start heading, end heading)
+INSIGHT_SECTIONS = [
+    ("Core Trend", "### Core Trend", "### Hidden Effects"),
+    ("Hidden Effects", "### Hidden Effects", "### Strategic Recommendations"),
+    ("Strategic Recommendations", "### Strategic Recommendations", "### Risk Assessment"),
+    ("Risk Assessment", "### Risk Assessment", "### Market Intelligence"),
+    ("Market Intelligence", "### Market Intelligence", None)
+]
+
+
+def extract_section(text, start, end=None):
+    if start not in text:
+        return ""
+    section = text.split(start)[1]
+    if end and end in section:
+        section = section.split(end)[0]
+    return section.strip()
+
+
+def json_path(data, path):
+    for key in path:
+        if not isinstance(data, dict) or key not in data:
+            return None
+        data = data[key]
+    return data
+
+
+def series_stats(sector_dir, filename, series_cols, date_col):
+    path = os.path.join(sector_dir, filename)
+    if not os.path.exists(path):
+        return None
+
+    df = pd.read_csv(path, encoding="utf-8-sig")
+    dates = pd.to_datetime(df[date_col], errors="coerce") if date_col in df.columns else pd.Series(dtype="datetime64[ns]")
+
+    if series_cols is None:
+        values = df.drop(columns=[date_col], errors="ignore")
+        series = [str(col) for col in values.columns]
+        records = int(values.notna().sum().sum())
+    else:
+        cols = [col for col in series_cols if col in df.columns]
+        series = sorted({" | ".join(map(str, row)) for row in df[cols].drop_duplicates().itertuples(index=False)}) if cols else []
+        records = len(df)
+
+    return {
+        "records": records,
+        "series": series,
+        "start": dates.min().strftime("%Y-%m-%d") if dates.notna().any() else None,
+        "end": dates.max().strftime("%Y-%m-%d") if dates.notna().any() else None
+    }
+
+
+def sector_summary(sector_dir, sector):
+    records, series, starts, ends = 0, set(), [], []
+    for filename, series_cols, date_col in SECTOR_SERIES.get(sector, []):
+        stats = series_stats(sector_dir, filename, series_cols, date_col)
+        if stats is None:
+            continue
+        records += stats["records"]
+        series.update(f"{filename}:{name}" for name in stats["series"])
+        starts += [stats["start"]] if stats["start"] else []
+        ends += [stats["end"]] if stats["end"] else []
+
+    kpis = []
+    for label, filename, path in HEADLINE_KPIS.get(sector, []):
+        try:
+            with open(os.path.join(sector_dir, filename), "r", encoding="utf-8") as f:
+                value = json_path(json.load(f), path)
+        except (FileNotFoundError, json.JSONDecodeError):
+            value = None
+        if value is not None:
+            kpis.append({"label": label, "value": value})
+
+    gemini_text = ""
+    gemini_path = os.path.join(sector_dir, GEMINI_FILES.get(sector, "gemini_insight.txt"))
+    if os.path.exists(gemini_path):
+        with open(gemini_path, "r", encoding="utf-8") as f:
+            gemini_text = f.read()
+
+    return {
+        "records": records,
+        "indicators": len(series),
+        "date_range": {"start": min(starts) if starts else None, "end": max(ends) if ends else None},
+        "kpis": kpis,
+        "actionable_insight": extract_section(gemini_text, ACTIONABLE_START, ACTIONABLE_END),
+        "insight_sections": {label: extract_section(gemini_text, start, end) for label, start, end in INSIGHT_SECTIONS}
+    }
+
+
+def load_home_summary(outputs_dir):
+    try:
+        with open(os.path.join(outputs_dir, SUMMARY_NAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"sectors": {}}
+
+
+def update_home_summary(sector_dir):
+    """Refresh one sector's entry (and the totals) in <outputs>/home_summary.json"""
+    sector_dir = os.path.abspath(sector_dir)
+    outputs_dir = os.path.dirname(sector_dir)
+    sector = os.path.basename(sector_dir)
+
+    summary = load_home_summary(outputs_dir)
+    summary.setdefault("sectors", {})[sector] = sector_summary(sector_dir, sector)
+
+    sectors = summary["sectors"].values()
+    ends = [s["date_range"]["end"] for s in sectors if s["date_range"]["end"]]
+    summary["totals"] = {
+        "sectors": len(summary["sectors"]),
+        "records": sum(s["records"] for s in sectors),
+        "indicators": sum(s["indicators"] for s in sectors),
+        "latest_date": max(ends) if ends else None
+    }
+    summary["generated_at"] = datetime.now().isoformat(timespec="seconds")
+
+    path = os.path.join(outputs_dir, SUMMARY_NAME)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2, default=str)
+    os.replace(tmp_path, path)
+
+    print(f"🏠 Home summary updated for {sector}")
+    return summary
+
+
+if __name__ == "__main__":
+    # Rebuild the summary for every sector folder
+    outputs_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "outputs")
+    for entry in sorted(os.scandir(outputs_dir), key=lambda e: e.name):
+        if entry.is_dir():
+            update_home_summary(entry.path)
@@ -4,6 +4,10 @@ import pandas as pd
 import json
 from sqlalchemy import create_engine
 from dotenv import load_dotenv
+from artifact_manifest import update_manifest
+from home_summary import update_home_summary
+from serving_layer import update_serving_frames
+from feature_engine import FeatureFrame
 import numpy as np
 import google.generativeai as genai
 
@@ -64,6 +68,16 @@ def manufacturing_inventory_analysis(df):
     df['month'] = df['date'].dt.month
     df['year'] = df['date'].dt.year
 
+    # Per-category features for all categories in one pass; each is aligned to df's index.
+    # Momentum is the OLS slope of the trailing 3/6 values over their mean
+    features = FeatureFrame(df, series='category')
+    mom_change = features.pct_change() * 100
+    yoy_change = features.pct_change(12) * 100
+    ma_3m = features.rolling_mean(3, min_periods=1)
+    ma_12m = features.rolling_mean(12, min_periods=1)
+    momentum_3m = features.rolling_momentum(3, min_periods=2)
+    momentum_6m = features.rolling_momentum(6, min_periods=3)
+
     all_processed = []
     volatility_results = []
     trend_stats_all = {}
@@ -72,23 +86,14 @@ def manufacturing_inventory_analysis(df):
         group = group.sort_values('date').copy()
 
         # Basic indicators
-        group['mom_change'] = group['value'].pct_change() * 100
-        group['yoy_change'] = group['value'].pct_change(periods=12) * 100
-        group['ma_3m'] = group['value'].rolling(window=3, min_periods=1).mean()
-        group['ma_12m'] = group['value'].rolling(window=12, min_periods=1).mean()
+        group['mom_change'] = mom_change
+        group['yoy_change'] = yoy_change
+        group['ma_3m'] = ma_3m
+        group['ma_12m'] = ma_12m
         group['above_3m_ma'] = (group['value'] > group['ma_3m']).astype(int)
         group['above_12m_ma'] = (group['value'] > group['ma_12m']).astype(int)
-
-        # Momentum
-        def calculate_momentum(series):
-            if len(series) < 2:
-                return 0
-            x = np.arange(len(series))
-            slope = np.polyfit(x, series, 1)[0]
-            return slope / series.mean() if series.mean() != 0 else 0
-
-        group['momentum_3m'] = group['value'].rolling(3, min_periods=2).apply(calculate_momentum)
-        group['momentum_6m'] = group['value'].rolling(6, min_periods=3).apply(calculate_momentum)
+        group['momentum_3m'] = momentum_3m
+        group['momentum_6m'] = momentum_6m
 
         # Volatility
         current_date = group['date'].max()
@@ -419,6 +424,12 @@ def main():
        key_insights["steel_production"]["top_current_performers"]:
         generate_insights(key_insights, eda_path)
 
+    # Chart-ready frames first, so the manifest version covers them too
+    update_serving_frames(eda_path)
+
+    # Record artifact versions (dashboard cache keys) and refresh this sector's Home summary
+    update_manifest(eda_path)
+    update_home_summary(eda_path)
     print(f"\n✅ All data saved to: {eda_path}")
     print("="*50)
 
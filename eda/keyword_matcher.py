@@ -0,0 +1,33 @@
+import re
+import pandas as pd
+
+
+class KeywordMatcher:
+    """Many keywords compiled into one regex, scanned once over every text.
+
+    The pattern is a zero-width lookahead over an alternation ordered by score (highest
+    first), so at each position it reports the best-scoring keyword starting there, and
+    overlapping keywords ("전투" inside "전투기") are all seen. Taking the maximum per text
+    gives the best keyword contained anywhere in it, exactly like testing `word in text`
+    for every word.
+    """
+
+    def __init__(self, scores):
+        # scores: {keyword: score}; ties keep the given order
+        self.scores = dict(sorted(scores.items(), key=lambda item: -item[1]))
+        words = [w for w in self.scores if w]
+        self.pattern = re.compile("(?=(" + "|".join(map(re.escape, words)) + "))") if words else None
+
+    def hits(self, texts):
+        """Long frame of (text label, keyword, score), one row per matching position"""
+        if self.pattern is None or len(texts) == 0:
+            return pd.DataFrame({"keyword": pd.Series(dtype=object), "score": pd.Series(dtype=float)})
+        found = pd.Series(texts).astype(str).str.extractall(self.pattern)[0].rename("keyword")
+        return found.to_frame().assign(score=found.map(self.scores))
+
+    def best_scores(self, texts):
+        """Highest keyword score in each text that contains any keyword, by text label"""
+        hits = self.hits(texts)
+        if hits.empty:
+            return pd.Series(dtype=float)
+        return hits["score"].groupby(level=0, sort=False).max()
@@ -3,6 +3,9 @@ import warnings
 import pandas as pd
 from sqlalchemy import create_engine
 from dotenv import load_dotenv
+from artifact_manifest import update_manifest
+from home_summary import update_home_summary
+from rollup_cube import RollupCube
 import json
 import google.generativeai as genai
 
@@ -395,12 +398,12 @@ def analyse_trade_yoy(df):
         'trade_balance': pivot.reset_index()
     }
 
-# Semiconductors
+# Semiconductors (monthly rows only; coarser grains come from the rollup cube)
 def load_wsts_billings_data(engine):
     query = """
     SELECT date, country, value, unit, sector, indicator, period_type
     FROM trade_wsts_billings_latest_processed
-    WHERE period_type IN ('month', 'annual')
+    WHERE period_type = 'month'
     ORDER BY date, country;
     """
     return pd.read_sql(query, engine)
@@ -413,9 +416,22 @@ def analyse_wsts_billings(df):
     # Filter for semiconductors only
     df = df[(df['sector'] == 'semiconductors') & (df['indicator'] == 'billings')]
 
-    # Split by period type
+    # Monthly billings rolled up to quarterly and annual grain; the annual sums equal the
+    # source's 'Total Year' rows (year to date for the current year)
     df_month = df[df['period_type'] == 'month']
-    df_annual = df[df['period_type'] == 'annual']
+    cube = RollupCube.from_rows(df_month, series='country')
+
+    # Annual rows keep the source's mid-year date
+    annual = cube.select('year')
+    df_annual = pd.DataFrame({
+        'date': annual['period'] + pd.DateOffset(months=6),
+        'country': annual['series'],
+        'value': annual['sum'],
+        'unit': annual['series'].map(df_month.groupby('country')['unit'].first()),
+        'sector': 'semiconductors',
+        'indicator': 'billings',
+        'period_type': 'annual'
+    })
 
     # Latest Monthly Snapshot
     latest_month = df_month['date'].max()
@@ -424,21 +440,10 @@ def analyse_wsts_billings(df):
     latest_month_df_filtered = latest_month_df[latest_month_df['country'] != 'World']
     top_monthly_regions = latest_month_df_filtered.sort_values('value', ascending=False)
 
-    # Monthly Time Series Trend
-    trend_month = (
-        df_month.groupby(['date', 'country'], as_index=False)
-        .agg({'value': 'sum'})
-        .sort_values(['country', 'date'])
-    )
-    trend_month_pivot = trend_month.pivot(index='date', columns='country', values='value')
-
-    # Annual Time Series Trend
-    trend_annual = (
-        df_annual.groupby(['date', 'country'], as_index=False)
-        .agg({'value': 'sum'})
-        .sort_values(['country', 'date'])
-    )
-    trend_annual_pivot = trend_annual.pivot(index='date', columns='country', values='value')
+    # Monthly and Annual Time Series Trends, read from the cube
+    trend_month_pivot = cube.wide('month', 'sum').rename_axis('date')
+    trend_annual_pivot = cube.wide('year', 'sum').rename_axis('date')
+    trend_annual_pivot.index = trend_annual_pivot.index + pd.DateOffset(months=6)
 
     # Year-over-Year Change (Monthly)
     df_month = df_month.sort_values(['country', 'date'])
@@ -483,7 +488,8 @@ def analyse_wsts_billings(df):
         'yoy_monthly': df_month[['date', 'country', 'yoy_change']],
         'yoy_annual': df_annual[['date', 'country', 'yoy_change']],
         'volatility': volatility,
-        'market_share_monthly': df_month[['date', 'country', 'market_share']]
+        'market_share_monthly': df_month[['date', 'country', 'market_share']],
+        'cube': cube
     }
 
 
@@ -563,6 +569,7 @@ def save_trade_eda_outputs(output_dir, engine):
     print("🔌 Analyzing semiconductor billings...")
     df_wsts = load_wsts_billings_data(engine)
     wsts_insights = analyse_wsts_billings(df_wsts)
+    wsts_insights['cube'].save(output_dir)
     
     wsts_insights['top_monthly_regions'].to_csv(
         os.path.join(output_dir, "wsts_top_monthly_regions.csv"), index=False
@@ -854,5 +861,8 @@ if __name__ == "__main__":
     # Generate AI-powered insights
     generate_gemini_insights(results, eda_path)
     
+    # Record artifact versions (dashboard cache keys) and refresh this sector's Home summary
+    update_manifest(eda_path)
+    update_home_summary(eda_path)
     print(f"\n✅ All data saved to: {eda_path}")
     print("="*50)
\ No newline at end of file
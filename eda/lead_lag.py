@@ -0,0 +1,146 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+MAX_LAG = 12
+MIN_OVERLAP = 24
+SIGNIFICANCE = 0.05
+
+
+# Series with more than one row on the same date: distinct entities (countries, contracts)
+# under one key, which must not be averaged into a single series
+def repeated_dates(df, series="series", date="date"):
+    return pd.unique(df.loc[df.duplicated([series, date], keep=False), series])
+
+
+# Long (date, series, value) rows -> months x series matrix of monthly means on one
+# gap-free month-start axis, so row t of every column is the same calendar month. Only
+# sub-monthly observations of one series are averaged; keys with repeated dates are left out
+def monthly_grid(df, series="series", date="date", value="value"):
+    repeated = repeated_dates(df, series, date)
+    if len(repeated):
+        print(f"⚠️ Warning: {len(repeated):,} series have several rows on one date and are left out "
+              f"of the monthly grid (e.g. {repeated[0]})")
+        df = df[~df[series].isin(repeated)]
+    if df.empty:
+        return pd.DataFrame()
+    month = pd.to_datetime(df[date]).dt.to_period("M").dt.to_timestamp()
+    grid = df.assign(**{date: month}).pivot_table(index=date, columns=series, values=value, aggfunc="mean",
+                                                  observed=True)
+    return grid.reindex(pd.date_range(grid.index.min(), grid.index.max(), freq="MS"))
+
+
+# Month-over-month changes, keeping series with enough non-constant observations; levels
+# of trending indicators correlate at every lag, their changes do not
+def monthly_changes(grid, min_overlap=MIN_OVERLAP):
+    changes = grid.diff()
+    enough = changes.notna().sum() >= min_overlap
+    varies = changes.std() > 0
+    return changes.loc[:, enough & varies]
+
+
+def lagged_correlations(values, max_lag=MAX_LAG):
+    """(corr, n) arrays of shape (2 * max_lag + 1, S, S) for a (T, S) matrix with NaN gaps.
+
+    corr[max_lag + k, i, j] is the Pearson correlation of series i at month t with series j
+    at month t + k over the months where both exist, so k > 0 means i leads j by k months.
+    Each lag is a handful of (S x T) @ (T x S) products over zero-filled values and their
+    masks, so every pair gets its own pairwise-complete overlap.
+    """
+    x = np.asarray(values, dtype="float64")
+    observed = ~np.isnan(x)
+    # Standardize once so the one-pass sums below do not cancel catastrophically
+    with np.errstate(invalid="ignore"):
+        x = (x - np.nanmean(x, axis=0)) / np.nanstd(x, axis=0)
+    x = np.where(observed, x, 0.0)
+    mask = observed.astype("float64")
+    squares = x * x
+
+    n_rows, n_series = x.shape
+    corr = np.full((2 * max_lag + 1, n_series, n_series), np.nan)
+    count = np.zeros((2 * max_lag + 1, n_series, n_series))
+    for k in range(min(max_lag, n_rows - 1) + 1):
+        a, ma, aa = x[:n_rows - k], mask[:n_rows - k], squares[:n_rows - k]
+        b, mb, bb = x[k:], mask[k:], squares[k:]
+        n = ma.T @ mb
+        sum_a, sum_b = a.T @ mb, ma.T @ b
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = a.T @ b - sum_a * sum_b / n
+            var_a = aa.T @ mb - sum_a ** 2 / n
+            var_b = ma.T @ bb - sum_b ** 2 / n
+            r = np.clip(cov / np.sqrt(var_a * var_b), -1, 1)
+        # corr(i at t, j at t - k) is corr(j at t, i at t + k)
+        corr[max_lag + k], corr[max_lag - k] = r, r.T
+        count[max_lag + k], count[max_lag - k] = n, n.T
+    return corr, count
+
+
+# Two-sided p-value of a Pearson correlation over n points
+def correlation_p_value(r, n):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = r * np.sqrt((n - 2) / (1 - r ** 2))
+    return 2 * stats.t.sf(np.abs(t), np.maximum(n - 2, 1))
+
+
+# Benjamini-Hochberg q-values: false discovery rate control across all pairs tested.
+# Only finite p-values count as tests; the others keep a NaN q-value
+def fdr_q_values(p):
+    p = np.asarray(p, dtype="float64")
+    q = np.full_like(p, np.nan)
+    finite = np.flatnonzero(np.isfinite(p))
+    if not len(finite):
+        return q
+    order = finite[np.argsort(p[finite])]
+    ranked = p[order] * len(finite) / np.arange(1, len(finite) + 1)
+    q[order] = np.minimum(np.minimum.accumulate(ranked[::-1])[::-1], 1.0)
+    return q
+
+
+def lead_lag_table(changes, max_lag=MAX_LAG, min_overlap=MIN_OVERLAP):
+    """One row per series pair at its strongest lag, ranked by absolute correlation.
+
+    p_value is Bonferroni-adjusted for picking the best of the lags tried; q_value then
+    controls the false discovery rate across all pairs.
+    """
+    columns = ["rank", "leader", "follower", "lead_months", "correlation", "same_month_correlation",
+               "data_points", "p_value", "q_value", "significance"]
+    names = np.asarray(changes.columns, dtype=object)
+    if len(names) < 2:
+        return pd.DataFrame(columns=columns)
+
+    corr, count = lagged_correlations(changes.to_numpy(), max_lag)
+    corr[count < min_overlap] = np.nan
+    i, j = np.triu_indices(len(names), k=1)
+    pair_corr = corr[:, i, j]
+    tested = ~np.isnan(pair_corr).all(axis=0)
+    i, j, pair_corr = i[tested], j[tested], pair_corr[:, tested]
+    if not len(i):
+        return pd.DataFrame(columns=columns)
+
+    # Lags masked for too little overlap must never win, so they rank below every real correlation
+    best = np.argmax(np.nan_to_num(np.abs(pair_corr), nan=-np.inf), axis=0)
+    cols = np.arange(len(i))
+    r = pair_corr[best, cols]
+    n = count[best, i, j]
+    lag = best - max_lag
+    lags_tried = (~np.isnan(pair_corr)).sum(axis=0)
+    p = np.minimum(correlation_p_value(r, n) * lags_tried, 1.0)
+    q = fdr_q_values(p)
+
+    # A negative lag means the second series of the pair moves first
+    leader = np.where(lag >= 0, names[i], names[j])
+    follower = np.where(lag >= 0, names[j], names[i])
+    table = pd.DataFrame({
+        "leader": leader,
+        "follower": follower,
+        "lead_months": np.abs(lag),
+        "correlation": r,
+        "same_month_correlation": corr[max_lag, i, j],
+        "data_points": n.astype(int),
+        "p_value": p,
+        "q_value": q,
+        "significance": np.where(q < SIGNIFICANCE, "Significant", "Not Significant")
+    })
+    table = table.iloc[np.argsort(-np.abs(r), kind="stable")].reset_index(drop=True)
+    table.insert(0, "rank", np.arange(1, len(table) + 1))
+    return table
@@ -0,0 +1,186 @@
+import os
+import json
+import pandas as pd
+
+STATE_SUFFIX = ".state.json"
+STATE_VERSION = 2
+
+
+# Rows as JSON-safe records: ISO dates, None for missing values
+def to_records(df, date="date"):
+    out = df.copy()
+    out[date] = pd.to_datetime(out[date]).dt.strftime("%Y-%m-%d")
+    out = out.astype(object).where(out.notna(), None)
+    return out.to_dict("records")
+
+
+# Row count of every series
+def series_counts(df, series):
+    return {k: int(n) for k, n in df[series].astype(str).value_counts(sort=False).items()}
+
+
+# Order-independent hash of every series' rows; hashes add up modulo 2**64
+def series_hashes(df, series):
+    hashes = pd.util.hash_pandas_object(df, index=False)
+    return {k: int(h) for k, h in hashes.groupby(df[series].astype(str).to_numpy(), sort=False).sum().items()}
+
+
+# Per-series totals of two disjoint row sets combined
+def merge_totals(a, b, modulo=None):
+    merged = dict(a)
+    for k, v in b.items():
+        merged[k] = merged.get(k, 0) + v
+        if modulo:
+            merged[k] %= modulo
+    return merged
+
+
+# Hashes of the rows of df at the given (series, date) keys, e.g. each series' stored tail
+def keyed_hashes(df, series, date, keys):
+    wanted = pd.MultiIndex.from_arrays([keys[series].astype(str), pd.to_datetime(keys[date])])
+    rows = df[pd.MultiIndex.from_arrays([df[series].astype(str), df[date]]).isin(wanted)]
+    return series_hashes(rows, series)
+
+
+# Last `depth` rows of every series, in series/date order
+def series_tails(df, series, date, depth):
+    return df.sort_values([series, date], kind="stable").groupby(series, sort=False).tail(depth)
+
+
+class RollingState:
+    """Trailing context of every series behind one derived output, persisted next to it.
+
+    For each series it keeps the last `depth` raw rows (the longest lookback any feature
+    needs: moving-average window, lag or YoY anchor), its row count, a hash of those tail rows
+    and a running hash of all its rows. Window sums are taken from the stored values rather
+    than from running totals, so features of appended rows come out bit-identical to a full
+    recompute.
+
+    A refresh hashes only the tail rows and the new rows: lost or added old rows show in the
+    counts, and a revised row inside the lookback window shows in the tail hash. A revision
+    older than that cannot change any new feature; it is caught only with verify_history,
+    which hashes the whole history against the running hash.
+    """
+
+    def __init__(self, output_path, series, depth, date="date", order=None):
+        self.output_path = output_path
+        self.path = output_path + STATE_SUFFIX
+        self.series, self.depth, self.date, self.order = series, depth, date, order
+
+    def load(self, columns):
+        """Stored state, or None when there is none or it was built for another layout"""
+        if not (os.path.exists(self.path) and os.path.exists(self.output_path)):
+            return None
+        with open(self.path, encoding="utf-8") as f:
+            state = json.load(f)
+        spec = {"version": STATE_VERSION, "series": self.series, "date": self.date, "depth": self.depth,
+                "order": self.order, "columns": list(map(str, columns))}
+        if any(state.get(k) != v for k, v in spec.items()):
+            return None
+        return state
+
+    def save(self, df, rows, counts, history_hashes, last_row):
+        """Persist the state of input df; rows must hold at least the last `depth` rows of every series"""
+        tails = series_tails(rows, self.series, self.date, self.depth)
+        state = {
+            "version": STATE_VERSION,
+            "series": self.series,
+            "date": self.date,
+            "depth": self.depth,
+            "order": self.order,
+            "columns": list(map(str, rows.columns)),
+            "counts": counts,
+            "tail_hashes": keyed_hashes(df, self.series, self.date, tails),
+            "history_hashes": history_hashes,
+            "tails": to_records(tails, self.date),
+            "last_row": last_row
+        }
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+
+    def split(self, df, state, verify_history=False):
+        """(context, new rows, counts, history hashes of df): stored tails plus rows dated after
+        each series' last stored date, or None when earlier history was revised and only a full
+        recompute is safe"""
+        tails = pd.DataFrame(state["tails"], columns=state["columns"])
+        tails[self.date] = pd.to_datetime(tails[self.date])
+        last_date = tails.groupby(self.series, sort=False)[self.date].max()
+
+        keys = df[self.series].astype(str)
+        cutoff = keys.map(last_date.rename(index=str))
+        is_new = cutoff.isna() | (df[self.date] > cutoff)
+        history = df[~is_new]
+
+        # Revised history: a series lost or gained old rows, or changed rows new features read
+        if series_counts(history, self.series) != state["counts"]:
+            return None
+        if keyed_hashes(df, self.series, self.date, tails) != state["tail_hashes"]:
+            return None
+        if verify_history and series_hashes(history, self.series) != state["history_hashes"]:
+            return None
+
+        new = df[is_new]
+        context = pd.concat([tails.astype({c: df[c].dtype for c in df.columns if c != self.date}, errors="ignore"), new],
+                            ignore_index=True)
+        counts = merge_totals(state["counts"], series_counts(new, self.series))
+        history_hashes = merge_totals(state["history_hashes"], series_hashes(new, self.series), modulo=2 ** 64)
+        return context, new, counts, history_hashes
+
+
+# Order key of an output row, comparable across runs (dates as ISO strings)
+def order_key(row, order, date):
+    key = [row[c].strftime("%Y-%m-%d") if c == date else row[c] for c in order]
+    return [v.item() if hasattr(v, "item") else v for v in key]
+
+
+# Derived output kept up to date by computing features for appended rows only.
+# `compute` must use trailing windows of at most `depth` rows per series (lags, rolling
+# means, pct changes, YoY) and row-local rules; `order` sorts the output the way a full
+# run emits it (None: input row order)
+def update_rolling_output(df, compute, output_path, series, depth, date="date", order=None, verify_history=False):
+    """Write compute(df) to output_path, computing only rows the previous output lacks.
+
+    New rows that sort after everything already written are appended to the file, so a
+    date-ordered output refreshes in O(new rows); rows that land in the middle (a series
+    sorted ahead of others) mean one merge and rewrite.
+    """
+    state = RollingState(output_path, series, depth, date, order)
+    stored = state.load(df.columns)
+    split = state.split(df, stored, verify_history) if stored is not None else None
+    name = os.path.basename(output_path)
+
+    if split is None:
+        result = compute(df)
+        result.to_csv(output_path, index=False, encoding="utf-8-sig")
+        last_row = result.iloc[-1] if len(result) else None
+        rows, counts, history_hashes = df, series_counts(df, series), series_hashes(df, series)
+        print(f"♻️ {name}: full recompute ({len(df):,} rows)")
+    else:
+        context, new, counts, history_hashes = split
+        rows = context
+        computed = compute(context)
+        new_keys = pd.MultiIndex.from_frame(new[[series, date]])
+        appended = computed[pd.MultiIndex.from_frame(computed[[series, date]]).isin(new_keys)]
+        if order:
+            appended = appended.sort_values(order, kind="stable")
+            at_end = stored["last_row"] is None or (
+                len(appended) == 0 or order_key(appended.iloc[0], order, date) >= stored["last_row"])
+        else:
+            at_end = bool(df.index[-len(new):].equals(new.index)) if len(new) else True
+
+        if at_end:
+            appended.to_csv(output_path, mode="a", header=False, index=False, encoding="utf-8-sig")
+            last_row = appended.iloc[-1] if len(appended) else None
+        else:
+            previous = pd.read_csv(output_path, encoding="utf-8-sig", parse_dates=[date], float_precision="round_trip")
+            result = pd.concat([previous, appended], ignore_index=True)
+            if order:
+                result = result.sort_values(order, kind="stable", ignore_index=True)
+            result.to_csv(output_path, index=False, encoding="utf-8-sig")
+            last_row = result.iloc[-1]
+        print(f"♻️ {name}: {len(new):,} new rows ({'appended' if at_end else 'merged'})")
+
+    last_key = stored["last_row"] if split is not None else None
+    if order and last_row is not None:
+        last_key = order_key(last_row, order, date)
+    state.save(df, rows, counts, history_hashes, last_key)
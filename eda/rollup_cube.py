@@ -0,0 +1,95 @@
+import os
+import numpy as np
+import pandas as pd
+
+CUBE_NAME = "rollup_cube.parquet"
+
+# Grains in coarsening order, with their pandas period frequency
+GRAINS = {"month": "M", "quarter": "Q", "year": "Y"}
+STATS = ["sum", "mean", "last", "std", "count"]
+
+
+def build_cube(df, series, date="date", value="value", grains=tuple(GRAINS)):
+    """Every series rolled up to each grain: one row per (series, grain, period).
+
+    period is the period's start date; sum/mean/std/count cover the non-missing values in
+    the period and last is the latest of them (later rows win ties on date).
+    """
+    rows = df[[series, date, value]].rename(columns={series: "series", date: "date", value: "value"})
+    rows = rows.assign(date=pd.to_datetime(rows["date"]), value=pd.to_numeric(rows["value"], errors="coerce"))
+    rows = rows.dropna(subset=["date", "value"]).sort_values("date", kind="stable")
+
+    parts = []
+    for grain in grains:
+        period = rows["date"].dt.to_period(GRAINS[grain]).dt.start_time
+        stats = rows.groupby(["series", period.rename("period")], sort=False, observed=True)["value"].agg(STATS)
+        parts.append(stats.reset_index().assign(grain=grain))
+    if not parts:
+        return RollupCube().frame
+
+    cube = pd.concat(parts, ignore_index=True)
+    cube["grain"] = pd.Categorical(cube["grain"], categories=list(GRAINS))
+    cube["series"] = cube["series"].astype(str)
+    cube["count"] = cube["count"].astype("int32")
+    cube = cube.sort_values(["grain", "series", "period"], ignore_index=True)
+    return cube[["series", "grain", "period"] + STATS]
+
+
+class RollupCube:
+    """Pre-aggregated series at monthly, quarterly and annual grain, stored as one Parquet file.
+
+    Rows are sorted by (grain, series, period), so each grain is one contiguous slice and
+    readers take the grain they chart instead of resampling raw rows on request.
+    """
+
+    def __init__(self, frame=None):
+        if frame is None:
+            frame = pd.DataFrame({
+                "series": pd.Series(dtype=object),
+                "grain": pd.Categorical([], categories=list(GRAINS)),
+                "period": pd.Series(dtype="datetime64[ns]"),
+                **{stat: pd.Series(dtype="float64") for stat in STATS if stat != "count"},
+                "count": pd.Series(dtype="int32")
+            })[["series", "grain", "period"] + STATS]
+        self.frame = frame
+        codes = self.frame["grain"].cat.codes.to_numpy()
+        self.bounds = np.searchsorted(codes, np.arange(len(GRAINS) + 1))
+
+    @classmethod
+    def from_rows(cls, df, series, date="date", value="value"):
+        return cls(build_cube(df, series, date, value))
+
+    @classmethod
+    def load(cls, directory, name=CUBE_NAME):
+        """Cube saved in directory, or None when it has not been built"""
+        path = os.path.join(directory, name)
+        if not os.path.exists(path):
+            return None
+        frame = pd.read_parquet(path)
+        frame["grain"] = pd.Categorical(frame["grain"].astype(str), categories=list(GRAINS))
+        return cls(frame)
+
+    def save(self, directory, name=CUBE_NAME):
+        os.makedirs(directory, exist_ok=True)
+        self.frame.to_parquet(os.path.join(directory, name), index=False)
+
+    @property
+    def series(self):
+        return sorted(self.frame["series"].unique())
+
+    def select(self, grain, series=None, start=None, end=None):
+        """Long (series, period, stats) rows of one grain, optionally narrowed to series and periods"""
+        g = list(GRAINS).index(grain)
+        rows = self.frame.iloc[self.bounds[g]:self.bounds[g + 1]]
+        if series is not None:
+            rows = rows[rows["series"].isin([series] if isinstance(series, str) else list(series))]
+        if start is not None:
+            rows = rows[rows["period"] >= pd.Timestamp(start)]
+        if end is not None:
+            rows = rows[rows["period"] <= pd.Timestamp(end)]
+        return rows.drop(columns="grain").reset_index(drop=True)
+
+    def wide(self, grain, stat, series=None):
+        """period x series table of one statistic at one grain"""
+        rows = self.select(grain, series)
+        return rows.pivot(index="period", columns="series", values=stat).rename_axis(columns=None)
@@ -0,0 +1,190 @@
+import os
+import json
+import time
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Written next to the sector folders, like alerts.json: three arrays and one metadata table.
+# Every save writes a new generation of arrays; the metadata names its generation and is
+# swapped in last, so it always points at a complete set
+STORE_PREFIX = "series_store"
+ARRAYS = ["axis", "positions", "values"]
+META_NAME = f"{STORE_PREFIX}.series.parquet"
+META_COLUMNS = ["key", "domain", "name", "freq", "offset", "length", "start", "end"]
+META_KEY = b"series_store"
+
+
+def array_path(directory, array, generation):
+    return os.path.join(directory, f"{STORE_PREFIX}.{generation}.{array}.npy")
+
+
+# Generation and array lengths recorded in the metadata file, or None for a store without them
+def read_generation(meta_path):
+    try:
+        metadata = pq.read_schema(meta_path).metadata or {}
+    except FileNotFoundError:
+        return None
+    return json.loads(metadata[META_KEY]) if META_KEY in metadata else None
+
+
+# Regular spacing of a series ('MS', 'QS-OCT', 'D', ...), or None when irregular or too short
+def infer_freq(dates):
+    if len(dates) < 3:
+        return None
+    try:
+        return pd.infer_freq(pd.DatetimeIndex(dates))
+    except (TypeError, ValueError):
+        return None
+
+
+class SeriesMeta:
+    """Metadata of one stored series: its name and domain, and where its values sit in the store.
+
+    The series' values are values[offset:offset + length], dated axis[positions[offset:offset + length]].
+    """
+
+    __slots__ = ("key", "domain", "name", "freq", "offset", "length", "start", "end")
+
+    def __init__(self, key, domain, name, freq, offset, length, start, end):
+        self.key = key
+        self.domain = domain
+        self.name = name
+        self.freq = freq
+        self.offset = int(offset)
+        self.length = int(length)
+        self.start = pd.Timestamp(start)
+        self.end = pd.Timestamp(end)
+
+    def __repr__(self):
+        return f"SeriesMeta({self.key!r}, {self.length} points, {self.start:%Y-%m-%d}..{self.end:%Y-%m-%d}, freq={self.freq})"
+
+    @property
+    def rows(self):
+        return slice(self.offset, self.offset + self.length)
+
+
+class SeriesStore:
+    """Every indicator as one contiguous float64 block of a single values array, on a shared date axis.
+
+    axis:      sorted distinct dates of all series (datetime64[ns])
+    positions: int32 index into axis of each value
+    values:    float64, one block per series, each block in date order
+
+    Opened from disk the three arrays are memory-mapped, so reading a series maps only its
+    own block; no text is parsed and no string column is repeated per value.
+    """
+
+    def __init__(self, axis, positions, values, meta):
+        self.axis = axis
+        self.positions = positions
+        self.values = values
+        self.meta = {m.key: m for m in meta}
+
+    @classmethod
+    def from_frame(cls, df, series="series", date="date", value="value", domain="domain", name="name"):
+        """Store of a long frame: one series per distinct `series`, rows without a date or value dropped"""
+        rows = df.assign(**{date: pd.to_datetime(df[date]), value: pd.to_numeric(df[value], errors="coerce")})
+        rows = rows.dropna(subset=[date, value]).sort_values([series, date], kind="stable")
+        # A series holds one value per date; several rows on a date are distinct entities under one key
+        repeated = pd.unique(rows.loc[rows.duplicated([series, date], keep=False), series])
+        if len(repeated):
+            raise ValueError(f"{len(repeated)} series have several rows on one date (e.g. {repeated[0]!r})")
+        dates = rows[date].to_numpy("datetime64[ns]")
+        axis = np.unique(dates)
+        positions = np.searchsorted(axis, dates).astype("int32")
+        values = rows[value].to_numpy(dtype="float64")
+
+        keys = rows[series].astype(str).to_numpy()
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else np.array([], dtype=np.int64)
+        ends = np.r_[starts[1:], len(keys)].astype(np.int64)
+        domains = rows[domain].to_numpy() if domain in rows else np.full(len(rows), None)
+        names = rows[name].to_numpy() if name in rows else keys
+        meta = [
+            SeriesMeta(keys[s], domains[s], names[s], infer_freq(dates[s:e]), s, e - s, dates[s], dates[e - 1])
+            for s, e in zip(starts, ends)
+        ]
+        return cls(axis, positions, values, meta)
+
+    @classmethod
+    def open(cls, directory, mmap=True):
+        """Store saved in directory with its arrays memory-mapped, or None when it has not been built"""
+        meta_path = os.path.join(directory, META_NAME)
+        generation = read_generation(meta_path)
+        if generation is None:
+            return None
+        paths = [array_path(directory, array, generation["id"]) for array in ARRAYS]
+        if not all(os.path.exists(path) for path in paths):
+            return None
+        axis, positions, values = [np.load(path, mmap_mode="r" if mmap else None) for path in paths]
+        lengths = {"axis": len(axis), "positions": len(positions), "values": len(values)}
+        if lengths != generation["lengths"]:
+            raise ValueError(f"Series store arrays {lengths} do not match their metadata {generation['lengths']}")
+        table = pd.read_parquet(meta_path)
+        meta = [SeriesMeta(*row) for row in table[META_COLUMNS].itertuples(index=False)]
+        return cls(axis, positions, values, meta)
+
+    def save(self, directory):
+        """Write a new generation of arrays, then swap in the metadata that points at it"""
+        os.makedirs(directory, exist_ok=True)
+        meta_path = os.path.join(directory, META_NAME)
+        previous = read_generation(meta_path)
+        generation = {"id": f"{time.time_ns():x}", "lengths": {a: len(getattr(self, a)) for a in ARRAYS}}
+        for array in ARRAYS:
+            with open(array_path(directory, array, generation["id"]), "wb") as f:
+                np.save(f, np.ascontiguousarray(getattr(self, array)))
+
+        table = pd.DataFrame([[getattr(m, c) for c in META_COLUMNS] for m in self.meta.values()], columns=META_COLUMNS)
+        table = pa.Table.from_pandas(table, preserve_index=False)
+        table = table.replace_schema_metadata({**table.schema.metadata, META_KEY: json.dumps(generation).encode()})
+        pq.write_table(table, meta_path + ".tmp")
+        os.replace(meta_path + ".tmp", meta_path)
+
+        # The previous generation is kept for readers that opened its metadata just before the
+        # swap; anything older is removed (files still mapped elsewhere stay readable on POSIX)
+        keep = {generation["id"]} | ({previous["id"]} if previous else set())
+        for entry in os.scandir(directory):
+            parts = entry.name.split(".")
+            if len(parts) == 4 and parts[0] == STORE_PREFIX and parts[3] == "npy" and parts[1] not in keep:
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+    def __len__(self):
+        return len(self.meta)
+
+    def __contains__(self, key):
+        return key in self.meta
+
+    def keys(self, domain=None):
+        return [k for k, m in self.meta.items() if domain is None or m.domain == domain]
+
+    # A series' values and dates; values are a view of the (mapped) array, not a copy
+    def values_of(self, key):
+        return self.values[self.meta[key].rows]
+
+    def dates_of(self, key):
+        return self.axis[self.positions[self.meta[key].rows]]
+
+    def series(self, key, start=None):
+        """One indicator as a date-indexed Series, optionally from `start` on"""
+        meta = self.meta[key]
+        dates = self.dates_of(key)
+        first = 0 if start is None else int(np.searchsorted(dates, np.datetime64(pd.Timestamp(start), "ns")))
+        return pd.Series(np.asarray(self.values_of(key)[first:]), index=pd.DatetimeIndex(dates[first:], name="date"),
+                         name=meta.name)
+
+    def frame(self, keys=None):
+        """Long (date, series, value) rows of the given series in series/date order; series is categorical"""
+        metas = list(self.meta.values()) if keys is None else [self.meta[k] for k in keys]
+        codes = np.repeat(np.arange(len(metas)), [m.length for m in metas])
+        # Only the selected blocks are read from the mapped arrays
+        positions = np.concatenate([self.positions[m.rows] for m in metas]) if metas else np.array([], dtype="int32")
+        values = np.concatenate([self.values[m.rows] for m in metas]) if metas else np.array([], dtype="float64")
+        return pd.DataFrame({
+            "date": self.axis[positions],
+            "series": pd.Categorical.from_codes(codes, categories=[m.key for m in metas]),
+            "value": values
+        })
@@ -0,0 +1,154 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+from datetime import datetime
+
+from artifact_manifest import file_sha256
+
+SERVING_PREFIX = "serving_"
+INDEX_NAME = "serving_index.json"
+
+
+# Percent change of each series from its first row, as the Industry page plotted it
+def relative_change(df, by, value="value"):
+    df = df.copy()
+    codes = df.groupby(by, sort=False).ngroup().to_numpy()
+    values = df[value].to_numpy(dtype="float64")
+    _, first_rows = np.unique(codes, return_index=True)
+    first = values[first_rows][codes]
+    df["relative_change"] = (values - first) / first * 100
+    return df
+
+
+# Per-column coverage of a wide table: non-null count, date span, min/max and latest value
+def coverage_stats(wide, date_col="date"):
+    dates = pd.to_datetime(wide[date_col])
+    rows = []
+    for col in [c for c in wide.columns if c != date_col]:
+        valid = wide[col].notna().to_numpy()
+        values = wide[col].to_numpy()[valid]
+        series_dates = dates.to_numpy()[valid]
+        count = int(valid.sum())
+        rows.append({
+            "indicator": col,
+            "data_points": count,
+            "total_rows": len(wide),
+            "coverage_pct": count / len(wide) * 100 if len(wide) else 0.0,
+            "first_date": series_dates.min() if count else pd.NaT,
+            "last_date": series_dates.max() if count else pd.NaT,
+            "min_value": values.min() if count else np.nan,
+            "max_value": values.max() if count else np.nan,
+            "latest_value": values[-1] if count else np.nan,
+            "latest_date": series_dates[-1] if count else pd.NaT
+        })
+    return pd.DataFrame(rows, columns=["indicator", "data_points", "total_rows", "coverage_pct", "first_date",
+                                       "last_date", "min_value", "max_value", "latest_value", "latest_date"])
+
+
+def read_source(sector_dir, filename, **kwargs):
+    return pd.read_csv(os.path.join(sector_dir, filename), encoding="utf-8-sig", **kwargs)
+
+
+def build_steel_relative_change(sector_dir):
+    steel = read_source(sector_dir, "steel_production_raw.csv")
+    return relative_change(steel, "region")
+
+
+def build_shipping_index_coverage(sector_dir):
+    return coverage_stats(read_source(sector_dir, "shipping_index_pivoted.csv"))
+
+
+def build_economic_indicators_wide(sector_dir):
+    indicators = read_source(sector_dir, "economic_indicators_raw.csv")
+    return indicators.pivot(index="date", columns="indicator", values="value").reset_index()
+
+
+def build_fx_volatility_table(sector_dir):
+    with open(os.path.join(sector_dir, "key_insights.json"), "r", encoding="utf-8") as f:
+        volatility = pd.DataFrame(json.load(f).get("fx_analysis", {}).get("volatility_data", []))
+    if volatility.empty:
+        return pd.DataFrame(columns=["pair"])
+    table = volatility.pivot(index="pair", columns="indicator", values="value").round(3)
+    table.columns = [col.replace(" Volatility (3M)", " (3M)").replace(" Volatility (12M)", " (12M)") for col in table.columns]
+    return table.reset_index()
+
+
+# Chart-ready frames per sector: (name, source files, builder). Each is written to
+# <sector>/serving_<name>.csv, so the manifest version covers it like any other artifact
+SERVING_FRAMES = {
+    "economy": [
+        ("economic_indicators_wide", ["economic_indicators_raw.csv"], build_economic_indicators_wide),
+        ("fx_volatility_table", ["key_insights.json"], build_fx_volatility_table)
+    ],
+    "global_trade": [
+        ("shipping_index_coverage", ["shipping_index_pivoted.csv"], build_shipping_index_coverage)
+    ],
+    "industry": [
+        ("steel_relative_change", ["steel_production_raw.csv"], build_steel_relative_change)
+    ]
+}
+
+
+def load_serving_index(outputs_dir):
+    try:
+        with open(os.path.join(outputs_dir, INDEX_NAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"sectors": {}}
+
+
+def update_serving_frames(sector_dir):
+    """Write the sector's chart-ready frames; a frame is rebuilt only when its sources changed"""
+    sector_dir = os.path.abspath(sector_dir)
+    outputs_dir = os.path.dirname(sector_dir)
+    sector = os.path.basename(sector_dir)
+
+    index = load_serving_index(outputs_dir)
+    previous = index.get("sectors", {}).get(sector, {})
+    entries = {}
+    for name, sources, build in SERVING_FRAMES.get(sector, []):
+        filename = f"{SERVING_PREFIX}{name}.csv"
+        path = os.path.join(sector_dir, filename)
+        try:
+            source_hashes = {source: file_sha256(os.path.join(sector_dir, source)) for source in sources}
+        except FileNotFoundError as e:
+            print(f"⚠️ Skipping serving frame {name}: {e}")
+            continue
+
+        entry = previous.get(name)
+        if entry and entry.get("sources") == source_hashes and os.path.exists(path):
+            entries[name] = entry
+            continue
+
+        frame = build(sector_dir)
+        tmp_path = path + ".tmp"
+        frame.to_csv(tmp_path, index=False, encoding="utf-8-sig")
+        os.replace(tmp_path, path)
+        entries[name] = {
+            "file": filename,
+            "sources": source_hashes,
+            "rows": len(frame),
+            "columns": [str(col) for col in frame.columns],
+            "built_at": datetime.now().isoformat(timespec="seconds")
+        }
+        print(f"🍽️ Serving frame {sector}/{filename} written ({len(frame)} rows)")
+
+    index.setdefault("sectors", {})[sector] = entries
+    index["generated_at"] = datetime.now().isoformat(timespec="seconds")
+
+    # Kept beside manifest.json rather than in the sector folder, so it never changes the sector version
+    path = os.path.join(outputs_dir, INDEX_NAME)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+    return entries
+
+
+if __name__ == "__main__":
+    # Rebuild the serving frames for every sector folder
+    outputs_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "outputs")
+    for entry in sorted(os.scandir(outputs_dir), key=lambda e: e.name):
+        if entry.is_dir():
+            update_serving_frames(entry.path)
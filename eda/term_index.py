@@ -0,0 +1,195 @@
+import os
+import numpy as np
+import pandas as pd
+
+# One Parquet file per table, next to the sector's other outputs
+INDEX_FILES = {
+    "contracts": "term_index_contracts.parquet",
+    "terms": "term_index_terms.parquet",
+    "postings": "term_index_postings.parquet",
+}
+
+
+# Month number (year * 12 + month - 1): postings group by month without touching dates
+def month_numbers(dates):
+    dates = pd.to_datetime(dates)
+    return (dates.dt.year * 12 + dates.dt.month - 1).astype("int32")
+
+
+def month_starts(months):
+    months = np.asarray(months, dtype="int64")
+    return pd.to_datetime({"year": months // 12, "month": months % 12 + 1, "day": 1})
+
+
+# A contract is one (date, name, value) bid; repeated rows of it count as `rows`
+def contract_keys(bids):
+    return pd.util.hash_pandas_object(bids[["date", "indicator", "value"]], index=False).to_numpy()
+
+
+class TermIndex:
+    """Inverted index of procurement terms: a term dictionary, the contracts, and postings.
+
+    contracts: contract_id, key, date, month, indicator (raw name), name (cleaned), value, rows
+    terms:     term_id, term, label, is_stop_word
+    postings:  term_id, contract_id, month, count, position, sorted by term_id
+
+    A term's postings are one contiguous slice, so frequency-over-time and
+    contracts-containing queries never scan other terms or re-tokenize any text.
+    """
+
+    def __init__(self, contracts=None, terms=None, postings=None):
+        self.contracts = contracts if contracts is not None else pd.DataFrame({
+            "contract_id": pd.Series(dtype="int32"), "key": pd.Series(dtype="uint64"),
+            "date": pd.Series(dtype="datetime64[ns]"), "month": pd.Series(dtype="int32"),
+            "indicator": pd.Series(dtype=object), "name": pd.Series(dtype=object),
+            "value": pd.Series(dtype="float64"), "rows": pd.Series(dtype="int32")})
+        self.terms = terms if terms is not None else pd.DataFrame({
+            "term_id": pd.Series(dtype="int32"), "term": pd.Series(dtype=object),
+            "label": pd.Series(dtype=object), "is_stop_word": pd.Series(dtype=bool)})
+        self.postings = postings if postings is not None else pd.DataFrame({
+            "term_id": pd.Series(dtype="int32"), "contract_id": pd.Series(dtype="int32"),
+            "month": pd.Series(dtype="int32"), "count": pd.Series(dtype="int16"),
+            "position": pd.Series(dtype="int16")})
+        self.refresh()
+
+    # Lookup structures derived from the tables
+    def refresh(self):
+        self.term_ids = dict(zip(self.terms["term"], self.terms["term_id"]))
+        self.bounds = np.searchsorted(self.postings["term_id"].to_numpy(), np.arange(len(self.terms) + 1))
+
+    @classmethod
+    def load(cls, index_dir):
+        """Index saved in index_dir, or None when it has not been built"""
+        paths = {name: os.path.join(index_dir, filename) for name, filename in INDEX_FILES.items()}
+        if not all(os.path.exists(path) for path in paths.values()):
+            return None
+        return cls(**{name: pd.read_parquet(path) for name, path in paths.items()})
+
+    def save(self, index_dir):
+        os.makedirs(index_dir, exist_ok=True)
+        for name, filename in INDEX_FILES.items():
+            getattr(self, name).to_parquet(os.path.join(index_dir, filename), index=False)
+
+    def add(self, bids, stop_words=(), labels=None):
+        """Index bids not seen before; bids need date, indicator, value, clean_indicator, tokens.
+
+        Returns the number of new contracts, or None when previously indexed contracts
+        are gone (a revised history), in which case the index must be rebuilt.
+        """
+        keys = contract_keys(bids)
+        seen = pd.Index(self.contracts["key"])
+        first = pd.Series(np.arange(len(bids))).groupby(keys, sort=False).first()
+        rows = pd.Series(keys).value_counts()
+        if not seen.isin(first.index).all():
+            return None
+
+        # Repeated rows of known contracts only change their row counts
+        self.contracts["rows"] = seen.map(rows).astype("int32")
+
+        new_keys = first.index[~first.index.isin(seen)]
+        if len(new_keys) == 0:
+            return 0
+        new = bids.iloc[first[new_keys].to_numpy()]
+        start = len(self.contracts)
+        contracts = pd.DataFrame({
+            "contract_id": np.arange(start, start + len(new), dtype="int32"),
+            "key": np.asarray(new_keys, dtype="uint64"),
+            "date": pd.to_datetime(new["date"]).to_numpy(),
+            "month": month_numbers(new["date"]).to_numpy(),
+            "indicator": new["indicator"].to_numpy(dtype=object),
+            "name": new["clean_indicator"].to_numpy(dtype=object),
+            "value": new["value"].to_numpy(dtype="float64"),
+            "rows": rows[new_keys].to_numpy(dtype="int32"),
+        })
+
+        # (token, contract, position) for every token of the new contracts, in text order
+        tokens = pd.Series(new["tokens"].to_numpy(), index=contracts["contract_id"]).explode().dropna()
+        occurrences = pd.DataFrame({
+            "term": tokens.to_numpy(dtype=object),
+            "contract_id": tokens.index.to_numpy(dtype="int32"),
+            "position": tokens.groupby(level=0).cumcount().to_numpy(),
+        })
+
+        # New terms extend the dictionary; existing term ids never change
+        unseen = pd.unique(occurrences.loc[~occurrences["term"].isin(list(self.term_ids)), "term"])
+        stop_words = set(stop_words)
+        labels = labels or {}
+        terms = pd.DataFrame({
+            "term_id": np.arange(len(self.terms), len(self.terms) + len(unseen), dtype="int32"),
+            "term": pd.Series(unseen, dtype=object),
+            "label": pd.Series([labels.get(t, t) for t in unseen], dtype=object),
+            "is_stop_word": [t in stop_words or t.isdigit() for t in unseen],
+        })
+        self.terms = pd.concat([self.terms, terms], ignore_index=True) if len(self.terms) else terms
+        self.term_ids.update(zip(terms["term"], terms["term_id"]))
+
+        occurrences["term_id"] = occurrences["term"].map(self.term_ids).astype("int32")
+        postings = occurrences.groupby(["term_id", "contract_id"], sort=False).agg(
+            count=("position", "size"), position=("position", "min")).reset_index()
+        postings["month"] = postings["contract_id"].map(contracts.set_index("contract_id")["month"]).astype("int32")
+        postings = postings.astype({"count": "int16", "position": "int16"})[list(self.postings.columns)]
+
+        self.contracts = pd.concat([self.contracts, contracts], ignore_index=True) if len(self.contracts) else contracts
+        combined = pd.concat([self.postings, postings], ignore_index=True) if len(self.postings) else postings
+        self.postings = combined.sort_values(["term_id", "contract_id"], kind="stable", ignore_index=True)
+        self.refresh()
+        return len(contracts)
+
+    # Postings of the given term ids, joined with their contracts' value and row count
+    def postings_for(self, term_ids=None, min_value=None, include_stop_words=False):
+        if term_ids is None:
+            postings = self.postings
+        else:
+            postings = pd.concat([self.postings.iloc[self.bounds[t]:self.bounds[t + 1]] for t in term_ids]) \
+                if len(term_ids) else self.postings.iloc[:0]
+        contracts = self.contracts.set_index("contract_id")
+        postings = postings.assign(value=postings["contract_id"].map(contracts["value"]),
+                                   rows=postings["contract_id"].map(contracts["rows"]))
+        if min_value is not None:
+            postings = postings[postings["value"] >= min_value]
+        if not include_stop_words:
+            postings = postings[~postings["term_id"].map(self.terms["is_stop_word"]).to_numpy(dtype=bool)]
+        return postings.assign(frequency=postings["count"] * postings["rows"])
+
+    def top_terms(self, n=10, min_value=None, include_stop_words=False):
+        """Most frequent terms (occurrences over every bid row), ties in first-seen order"""
+        postings = self.postings_for(None, min_value, include_stop_words)
+        stats = postings.groupby("term_id").agg(frequency=("frequency", "sum"), contracts=("contract_id", "nunique"),
+                                                first_contract=("contract_id", "min"))
+        first_position = postings.set_index(["term_id", "contract_id"])["position"]
+        stats["first_position"] = first_position.reindex(list(zip(stats.index, stats["first_contract"]))).to_numpy()
+        stats = stats.sort_values(["frequency", "first_contract", "first_position"], ascending=[False, True, True])
+        top = stats.head(n).join(self.terms.set_index("term_id")[["term", "label"]])
+        return top.reset_index()[["term", "label", "frequency", "contracts"]]
+
+    def term_frequency(self, terms, min_value=None):
+        """Monthly occurrences and contract counts of each term"""
+        ids = [self.term_ids[t] for t in terms if t in self.term_ids]
+        postings = self.postings_for(ids, min_value, include_stop_words=True)
+        monthly = postings.groupby(["term_id", "month"]).agg(
+            frequency=("frequency", "sum"), contracts=("contract_id", "nunique")).reset_index()
+        monthly["term"] = monthly["term_id"].map(self.terms["term"])
+        monthly["date"] = month_starts(monthly["month"]) if len(monthly) else pd.Series(dtype="datetime64[ns]")
+        return monthly[["date", "term", "frequency", "contracts"]]
+
+    def contracts_containing(self, term, min_value=None):
+        """Contracts whose cleaned name contains the term, newest first"""
+        if term not in self.term_ids:
+            return self.contracts.iloc[:0][["date", "name", "value", "rows"]]
+        postings = self.postings_for([self.term_ids[term]], min_value, include_stop_words=True)
+        found = self.contracts.set_index("contract_id").loc[postings["contract_id"]]
+        return found.sort_values("date", ascending=False)[["date", "name", "value", "rows"]].reset_index(drop=True)
+
+
+def update_term_index(bids, index_dir, stop_words=(), labels=None):
+    """Add new bids to the index saved in index_dir, rebuilding it if old bids were revised"""
+    index = TermIndex.load(index_dir) or TermIndex()
+    added = index.add(bids, stop_words, labels)
+    if added is None:
+        index = TermIndex()
+        added = index.add(bids, stop_words, labels)
+        print(f"♻️ term index rebuilt ({added:,} contracts)")
+    else:
+        print(f"♻️ term index: {added:,} new contracts ({len(index.contracts):,} total, {len(index.terms):,} terms)")
+    index.save(index_dir)
+    return index
@@ -0,0 +1,70 @@
+import re
+import pandas as pd
+
+# Contract names carry an administrative prefix: "<notice> - <category> - <item>"
+PREFIX_SEPARATOR = " - "
+
+# Year patterns (including quoted years and ranges), quotes and leftover artifacts, in order
+CLEANUP_PATTERNS = [
+    (re.compile(r"('?\d{2}년~'?\d{2}년)"), ""),  # 25년~27년
+    (re.compile(r"('?\d{2}~'?\d{2}년)"), ""),    # 25~27년
+    (re.compile(r"('?\d{2}~'?\d{2})"), ""),      # '25~'29
+    (re.compile(r"'?\d{2}년"), ""),               # '25년 or 25년
+    (re.compile(r"'?\d{2}\s"), " "),              # '25 (standalone)
+    (re.compile(r"['\"]"), ""),                   # quotation marks
+    (re.compile(r"\s*~\s*"), " "),                # ~ with spaces
+    (re.compile(r"\s+"), " "),                    # whitespace
+]
+
+# Korean words of 2+ syllables, or Latin words with optional digits (e.g. "KF21")
+TOKEN_PATTERN = re.compile(r"[가-힣]{2,}|[A-Za-z]{2,}\d*[A-Za-z]*")
+
+
+def clean_series(texts):
+    """Vectorized cleanup of raw contract names: drop the prefix, year ranges and quotes"""
+    s = texts.map(str).str.rsplit(PREFIX_SEPARATOR, n=1).str[-1]
+    for pattern, replacement in CLEANUP_PATTERNS:
+        s = s.str.replace(pattern, replacement, regex=True)
+    return s.str.strip()
+
+
+class TextNormalizer:
+    """Cleaned name and tokens of every raw contract name, computed once per distinct value.
+
+    Raw names repeat across rows and across the analyses that filter the same bids, so
+    each call only cleans values it has not seen, in one vectorized pass, and maps the
+    cached results back onto the rows.
+    """
+
+    def __init__(self):
+        self.clean_cache = {}
+        self.token_cache = {}
+
+    def update(self, texts):
+        raw = pd.Series(pd.unique(texts), dtype=object)
+        unseen = raw[~raw.isin(list(self.clean_cache))] if self.clean_cache else raw
+        if len(unseen):
+            cleaned = clean_series(unseen)
+            tokens = cleaned.str.findall(TOKEN_PATTERN)
+            self.clean_cache.update(zip(unseen, cleaned))
+            self.token_cache.update(zip(unseen, tokens))
+
+    # Missing names read as str() makes them ("None", "nan"), so they share one cache key
+    def rows(self, texts):
+        texts = pd.Series(texts, dtype=object)
+        missing = texts.isna()
+        if missing.any():
+            texts = texts.copy()
+            texts[missing] = texts[missing].map(str)
+        self.update(texts)
+        return texts
+
+    def clean(self, texts):
+        """Cleaned names, aligned with texts"""
+        texts = self.rows(texts)
+        return texts.map(self.clean_cache).astype(str)
+
+    def tokens(self, texts):
+        """Token lists of the cleaned names, aligned with texts"""
+        texts = self.rows(texts)
+        return texts.map(self.token_cache)
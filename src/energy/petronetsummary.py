@@ -1,152 +1,217 @@
 from bs4 import BeautifulSoup
 import pandas as pd
+import numpy as np
 from collections import OrderedDict
+from io import StringIO
 import re
 import os
+import sys
 from dotenv import load_dotenv
 
+# Add src/processed to Python path for the shared country dimension
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'processed'))
+from dimensions import korean_names_by_region
+
 load_dotenv()
 data_dir = os.getenv("DATA_DIR")
 
-# Continent mapping
-CONTINENT_MAPPING = {
-    'Asia': ['필리핀', '말레이시아', '인도네시아', '호주', '뉴질랜드', '파푸아뉴기니', '카자흐스탄'],
-    'Africa': ['알제리', '콩고', '나이지리아', '적도기니', '모잠비크'],
-    'America': ['캐나다', '미국', '멕시코', '브라질', '에콰도르'],
-    'MiddleEast': ['이라크', '쿠웨이트', '카타르', '아랍에미레이트', '사우디아라비아', '오만', '중립지대'],
-    'Europe': ['노르웨이', '영국']
-}
-
-# Load disguised .xls (actually HTML)
-with open(os.path.join(data_dir, "energy", "petronet_oil_imports_monthly.xls"), "r", encoding="utf-8") as f:
-    html = f.read()
-
-soup = BeautifulSoup(html, 'html.parser')
-all_tables = soup.find_all('table')
-wide_data = OrderedDict()
-current_year = None
-
-# Parse each data table
-for table in all_tables:
-    if table.get('border') != '1':
-        continue
-
-    rows = table.find_all('tr')
-    if len(rows) < 3:
-        continue
-
-    country_cells = rows[0].find_all('td')[2:]
-    countries = [td.get_text(strip=True) for td in country_cells]
-
-    for row in rows[2:]:
-        cells = row.find_all('td')
-        if len(cells) < 2:
+# Continent mapping (Korean PETRONET labels per region)
+CONTINENT_MAPPING = korean_names_by_region()
+
+METRICS = ['Vol', 'Value', 'Price']
+
+
+# Fast path: lxml-backed pd.read_html, one NumPy block per table
+def parse_wide_data(html):
+    tables = pd.read_html(StringIO(html), attrs={'border': '1'}, header=None, flavor='lxml')
+    parts = []
+
+    for table in tables:
+        if len(table) < 3:
             continue
 
-        raw_cell = cells[0].get_text(strip=True).replace('\xa0', '')
+        # Header row holds one country per 3 columns (Vol, Value, Price)
+        n_countries = (table.shape[1] - 2) // 3
+        countries = table.iloc[0, 2:2 + n_countries * 3:3].astype(str).str.strip().to_numpy()
 
-        if '년' in raw_cell:
-            match = re.match(r'(\d+)년\s*(\d+)월', raw_cell)
-            if match:
-                current_year = f"20{match.group(1)}"
-                current_month = match.group(2).zfill(2)
-            else:
-                continue
-        elif '월' in raw_cell and current_year:
-            match = re.match(r'(\d+)월', raw_cell)
-            if match:
-                current_month = match.group(1).zfill(2)
-            else:
-                continue
-        else:
+        # Month labels: "24년 01월" opens a year, "02월" continues it
+        labels = table.iloc[2:, 0].astype(str).str.replace('\xa0', '', regex=False).str.strip()
+        years = labels.str.extract(r'(\d+)년', expand=False).ffill()
+        months = labels.str.extract(r'(\d+)월', expand=False)
+        valid = (years.notna() & months.notna()).to_numpy()
+        if not valid.any():
+            continue
+
+        month_names = pd.to_datetime(
+            '20' + years[valid] + '-' + months[valid].str.zfill(2) + '-01', errors='coerce'
+        ).dt.strftime('%b %Y').to_numpy()
+
+        # Parse every numeric cell of the table in one pass ('-' means zero)
+        block = table.iloc[2:, 2:2 + n_countries * 3].to_numpy()[valid]
+        cells = pd.Series(block.ravel()).astype(str).str.replace(',', '', regex=False)
+        values = pd.to_numeric(cells.where(cells != '-', '0'), errors='coerce').to_numpy(dtype=np.float64)
+        values = values.reshape(len(month_names), n_countries * 3)
+
+        keep_countries = np.flatnonzero((countries != '') & (countries != 'nan'))
+        keep_cols = (keep_countries[:, None] * 3 + np.arange(3)).ravel()
+        columns = [f"{countries[i]} ({metric})" for i in keep_countries for metric in METRICS]
+
+        part = pd.DataFrame(values[:, keep_cols], index=month_names, columns=columns)
+        part = part[part.index.notna() & ~part.index.duplicated(keep='last')]
+        parts.append(part)
+
+    df_wide = pd.concat(parts, axis=1, sort=False) if parts else pd.DataFrame()
+    # A country repeated in a later table overrides its earlier cells, as in the row-by-row parser
+    if df_wide.columns.duplicated().any():
+        df_wide = df_wide.T.groupby(level=0, sort=False).last().T
+    df_wide.index.name = 'Month'
+    return df_wide.reset_index()
+
+
+# Reference parser (BeautifulSoup, row by row); used when lxml is unavailable and for benchmarking
+def parse_wide_data_bs4(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    all_tables = soup.find_all('table')
+    wide_data = OrderedDict()
+    current_year = None
+
+    # Parse each data table
+    for table in all_tables:
+        if table.get('border') != '1':
             continue
 
-        try:
-            month_name = pd.to_datetime(f"{current_year}-{current_month}-01").strftime('%b %Y')
-        except:
+        rows = table.find_all('tr')
+        if len(rows) < 3:
             continue
 
-        values = [cell.get_text(strip=True).replace(',', '') for cell in cells[1:]]
-        if month_name not in wide_data:
-            wide_data[month_name] = {}
+        country_cells = rows[0].find_all('td')[2:]
+        countries = [td.get_text(strip=True) for td in country_cells]
+
+        for row in rows[2:]:
+            cells = row.find_all('td')
+            if len(cells) < 2:
+                continue
+
+            raw_cell = cells[0].get_text(strip=True).replace('\xa0', '')
+
+            if '년' in raw_cell:
+                match = re.match(r'(\d+)년\s*(\d+)월', raw_cell)
+                if match:
+                    current_year = f"20{match.group(1)}"
+                    current_month = match.group(2).zfill(2)
+                else:
+                    continue
+            elif '월' in raw_cell and current_year:
+                match = re.match(r'(\d+)월', raw_cell)
+                if match:
+                    current_month = match.group(1).zfill(2)
+                else:
+                    continue
+            else:
+                continue
 
-        for i, country in enumerate(countries):
-            idx = i * 3
-            if idx + 2 >= len(values):
+            try:
+                month_name = pd.to_datetime(f"{current_year}-{current_month}-01").strftime('%b %Y')
+            except:
                 continue
 
-            vol = float(values[idx]) if values[idx] != '-' else 0
-            val = float(values[idx + 1]) if values[idx + 1] != '-' else 0
-            price = float(values[idx + 2]) if values[idx + 2] != '-' else 0
+            values = [cell.get_text(strip=True).replace(',', '') for cell in cells[1:]]
+            if month_name not in wide_data:
+                wide_data[month_name] = {}
+
+            for i, country in enumerate(countries):
+                idx = i * 3
+                if idx + 2 >= len(values):
+                    continue
+
+                vol = float(values[idx]) if values[idx] != '-' else 0
+                val = float(values[idx + 1]) if values[idx + 1] != '-' else 0
+                price = float(values[idx + 2]) if values[idx + 2] != '-' else 0
+
+                if country:
+                    wide_data[month_name][f"{country} (Vol)"] = vol
+                    wide_data[month_name][f"{country} (Value)"] = val
+                    wide_data[month_name][f"{country} (Price)"] = price
+
+    df_wide = pd.DataFrame.from_dict(wide_data, orient='index')
+    df_wide.index.name = 'Month'
+    return df_wide.reset_index()
 
-            if country:
-                wide_data[month_name][f"{country} (Vol)"] = vol
-                wide_data[month_name][f"{country} (Value)"] = val
-                wide_data[month_name][f"{country} (Price)"] = price
 
-# Convert to DataFrame
-df_wide = pd.DataFrame.from_dict(wide_data, orient='index')
-df_wide.index.name = 'Month'
-df_wide.reset_index(inplace=True)
+# Add Total row (sum for Vol/Value, mean for Price)
+def add_total_row(df_wide):
+    float_cols = df_wide.select_dtypes(include=['float64']).columns
+    is_price = float_cols.str.contains('Price', regex=False)
 
-# Add Total row
-float_cols = df_wide.select_dtypes(include=['float64'])
-sum_cols = [col for col in float_cols.columns if 'Price' not in col]
-mean_cols = [col for col in float_cols.columns if 'Price' in col]
+    total_data = pd.concat([
+        df_wide[float_cols[~is_price]].sum(),
+        df_wide[float_cols[is_price]].mean()
+    ])
+    total_data['Month'] = 'Total'
 
-total_data = {}
-for col in sum_cols:
-    total_data[col] = df_wide[col].sum()
-for col in mean_cols:
-    total_data[col] = df_wide[col].mean()
-total_data['Month'] = 'Total'
+    return pd.concat([df_wide, pd.DataFrame([total_data.to_dict()])], ignore_index=True)
 
-df_wide = pd.concat([df_wide, pd.DataFrame([total_data])], ignore_index=True)
 
-# ---- Optimized continent aggregation ----
-continent_df_parts = []
+# Continent aggregation in a single grouped pass over the country columns
+def add_continent_aggregates(df_wide):
+    country_to_continent = {country: continent for continent, countries in CONTINENT_MAPPING.items() for country in countries}
 
-for continent, countries in CONTINENT_MAPPING.items():
-    value_cols = [f"{country} (Value)" for country in countries if f"{country} (Value)" in df_wide.columns]
-    vol_cols = [f"{country} (Vol)" for country in countries if f"{country} (Vol)" in df_wide.columns]
-    price_cols = [f"{country} (Price)" for country in countries if f"{country} (Price)" in df_wide.columns]
+    parsed = df_wide.columns.to_series().str.extract(r'^(.*) \((Vol|Value|Price)\)$')
+    parsed['continent'] = parsed[0].map(country_to_continent)
+    mapped = parsed.dropna(subset=['continent'])
 
-    value_sum = df_wide[value_cols].sum(axis=1)
-    vol_sum = df_wide[vol_cols].sum(axis=1)
-    price_avg = df_wide[price_cols].mean(axis=1)
+    values = df_wide[mapped.index].astype(float).T
+    is_price = mapped[1] == 'Price'
+    grouped = pd.concat([
+        values[~is_price].groupby([mapped['continent'], mapped[1]], sort=False).sum(),
+        values[is_price].groupby([mapped['continent'], mapped[1]], sort=False).mean()
+    ]).T
 
     if '합 계 (Value)' in df_wide.columns:
-        total_values = df_wide['합 계 (Value)']
+        total_values = df_wide['합 계 (Value)'].astype(float)
     else:
-        total_values = df_wide[[col for col in df_wide.columns
-                                if '(Value)' in col and not any(c in col for c in CONTINENT_MAPPING.keys())]].sum(axis=1)
-
-    pct = (value_sum / total_values) * 100
-    pct_formatted = pct.round(2).astype(str) + '%'
-
-    continent_df = pd.DataFrame({
-        f"{continent} (Value)": value_sum,
-        f"{continent} (Vol)": vol_sum,
-        f"{continent} (Price)": price_avg,
-        f"{continent} (%)": pct_formatted
-    })
-
-    continent_df_parts.append(continent_df)
-
-# Combine all continent data and reorder
-continent_all = pd.concat(continent_df_parts, axis=1)
-
-# Reorder columns: Month → Continent → Country-level
-df_wide = pd.concat([
-    df_wide[['Month']].reset_index(drop=True),
-    continent_all.reset_index(drop=True),
-    df_wide.drop(columns=['Month']).reset_index(drop=True)
-], axis=1)
-
-filename = "oil_imports_with_continents.csv"
-save_path = os.path.join(data_dir, "energy", filename)
-os.makedirs(os.path.dirname(save_path), exist_ok=True)
-
-# Save final result
-df_wide.to_csv(save_path, index=False, encoding="utf-8-sig")
-print(f"Saved to: {save_path}")
\ No newline at end of file
+        value_cols = [col for col in df_wide.columns
+                      if '(Value)' in col and not any(c in col for c in CONTINENT_MAPPING.keys())]
+        total_values = df_wide[value_cols].astype(float).sum(axis=1)
+
+    continent_cols = {}
+    for continent in CONTINENT_MAPPING:
+        value_sum = grouped.get((continent, 'Value'), pd.Series(0.0, index=df_wide.index))
+        pct = (value_sum / total_values) * 100
+        continent_cols[f"{continent} (Value)"] = value_sum
+        continent_cols[f"{continent} (Vol)"] = grouped.get((continent, 'Vol'), pd.Series(0.0, index=df_wide.index))
+        continent_cols[f"{continent} (Price)"] = grouped.get((continent, 'Price'), pd.Series(np.nan, index=df_wide.index))
+        continent_cols[f"{continent} (%)"] = pct.round(2).astype(str) + '%'
+
+    # Reorder columns: Month → Continent → Country-level
+    return pd.concat([
+        df_wide[['Month']],
+        pd.DataFrame(continent_cols, index=df_wide.index),
+        df_wide.drop(columns=['Month'])
+    ], axis=1)
+
+
+def build_oil_imports_with_continents(html):
+    try:
+        df_wide = parse_wide_data(html)
+    except ImportError:
+        df_wide = parse_wide_data_bs4(html)
+
+    df_wide = add_total_row(df_wide)
+    return add_continent_aggregates(df_wide)
+
+
+if __name__ == "__main__":
+    # Load disguised .xls (actually HTML)
+    with open(os.path.join(data_dir, "energy", "petronet_oil_imports_monthly.xls"), "r", encoding="utf-8") as f:
+        html = f.read()
+
+    df_wide = build_oil_imports_with_continents(html)
+
+    filename = "oil_imports_with_continents.csv"
+    save_path = os.path.join(data_dir, "energy", filename)
+    os.makedirs(os.path.dirname(save_path), exist_ok=True)
+
+    # Save final result
+    df_wide.to_csv(save_path, index=False, encoding="utf-8-sig")
+    print(f"Saved to: {save_path}")
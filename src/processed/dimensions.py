@@ -0,0 +1,133 @@
+import pandas as pd
+from functools import lru_cache
+import pycountry
+from normalizers import on_uniques
+
+# Regions used by the PETRONET import breakdown (order is the column order downstream)
+REGIONS = ['Asia', 'Africa', 'America', 'MiddleEast', 'Europe']
+
+# Korean source labels -> (ISO2, region); ISO2 None means the entity has no ISO code. Regions are
+# PETRONET import regions; ECOS-only partners have none, so they stay out of its aggregates
+KOREAN_COUNTRIES = {
+    '필리핀': ('PH', 'Asia'), '말레이시아': ('MY', 'Asia'), '인도네시아': ('ID', 'Asia'),
+    '호주': ('AU', 'Asia'), '뉴질랜드': ('NZ', 'Asia'), '파푸아뉴기니': ('PG', 'Asia'),
+    '카자흐스탄': ('KZ', 'Asia'),
+    '알제리': ('DZ', 'Africa'), '콩고': ('CG', 'Africa'), '나이지리아': ('NG', 'Africa'),
+    '적도기니': ('GQ', 'Africa'), '모잠비크': ('MZ', 'Africa'), '가봉': ('GA', 'Africa'),
+    '캐나다': ('CA', 'America'), '미국': ('US', 'America'), '멕시코': ('MX', 'America'),
+    '브라질': ('BR', 'America'), '에콰도르': ('EC', 'America'),
+    '이라크': ('IQ', 'MiddleEast'), '쿠웨이트': ('KW', 'MiddleEast'), '카타르': ('QA', 'MiddleEast'),
+    '아랍에미레이트': ('AE', 'MiddleEast'), '사우디아라비아': ('SA', 'MiddleEast'), '오만': ('OM', 'MiddleEast'),
+    '노르웨이': ('NO', 'Europe'), '영국': ('GB', 'Europe'),
+    '중국': ('CN', None), '태국': ('TH', None), '싱가포르': ('SG', None), '인도': ('IN', None),
+    '독일': ('DE', None), '러시아': ('RU', None), '이탈리아': ('IT', None), '프랑스': ('FR', None),
+    '중립지대': (None, 'MiddleEast'),
+    '합 계': (None, 'Total')
+}
+
+# Preferred English names where pycountry's short name differs from what the dashboards show
+NAME_OVERRIDES = {'RU': 'Russia', 'TR': 'Turkey'}
+
+# Spellings seen in source files that are not pycountry names
+ALIASES = {
+    '말레이지아': 'MY', 'Türkiye': 'TR', 'UAE': 'AE', 'USA': 'US',
+    'Korea': 'KR', 'Republic of Korea': 'KR'
+}
+
+# Entities without an ISO code: (key, English name, Korean name, region).
+# Keys follow ISO 3166 numeric codes; 001 is the UN M49 world code, 900+ is user-assigned.
+NON_ISO_ENTITIES = [
+    (1, 'World', '세계', None),
+    (900, 'Neutral Zone', '중립지대', 'MiddleEast'),
+    (999, 'Total', '합 계', 'Total')
+]
+
+
+# One row per country: integer key (ISO numeric), ISO2/ISO3, English and Korean names, region
+@lru_cache(maxsize=None)
+def country_dimension():
+    korean_by_iso2 = {iso2: (name_ko, region) for name_ko, (iso2, region) in KOREAN_COUNTRIES.items() if iso2}
+
+    rows = []
+    for c in pycountry.countries:
+        name_ko, region = korean_by_iso2.get(c.alpha_2, (None, None))
+        rows.append({
+            'country_key': int(c.numeric),
+            'iso2': c.alpha_2,
+            'iso3': c.alpha_3,
+            'name': NAME_OVERRIDES.get(c.alpha_2, getattr(c, 'common_name', c.name)),
+            'name_ko': name_ko,
+            'region': region
+        })
+    for key, name, name_ko, region in NON_ISO_ENTITIES:
+        rows.append({'country_key': key, 'iso2': None, 'iso3': None, 'name': name, 'name_ko': name_ko, 'region': region})
+
+    return pd.DataFrame(rows).sort_values('country_key').reset_index(drop=True)
+
+
+# Every known spelling (codes, English short/common/official names, Korean names) -> country key
+@lru_cache(maxsize=None)
+def country_key_index():
+    dim = country_dimension()
+    key_by_iso2 = dict(zip(dim['iso2'], dim['country_key']))
+
+    index = {}
+    for c in pycountry.countries:
+        for label in (c.alpha_2, c.alpha_3, c.name, getattr(c, 'common_name', None), getattr(c, 'official_name', None)):
+            if label:
+                index[label] = int(c.numeric)
+    for name_ko, (iso2, _) in KOREAN_COUNTRIES.items():
+        if iso2:
+            index[name_ko] = key_by_iso2[iso2]
+    for alias, iso2 in ALIASES.items():
+        index[alias] = key_by_iso2[iso2]
+    for key, name, name_ko, _ in NON_ISO_ENTITIES:
+        index[name] = key
+        index[name_ko] = key
+    for key, name in zip(dim['country_key'], dim['name']):
+        index[name] = key
+    return index
+
+
+# Any spelling -> one column of the dimension, resolved once per label
+@lru_cache(maxsize=None)
+def _lookup(column):
+    dim = country_dimension()
+    by_key = dict(zip(dim['country_key'], dim[column]))
+    return {label: by_key[key] for label, key in country_key_index().items()}
+
+
+# Any country label or code -> integer country key (<NA> when unknown)
+def country_key(values):
+    return values.map(country_key_index()).astype('Int64')
+
+
+# Any country label or code -> canonical English name, unknown labels are kept as-is
+def country_name(values):
+    return values.map(_lookup('name')).fillna(values)
+
+
+# Any country label or code -> region, NaN when the country has no region assigned
+def country_region(values):
+    return values.map(_lookup('region'))
+
+
+# ISO2 codes -> English country names, unknown codes are kept as-is. Trade partner columns
+# repeat a few hundred codes over every row, so each code is looked up once
+@on_uniques
+def iso2_to_name(codes):
+    return country_name(codes)
+
+
+# {region: [Korean labels]} for the PETRONET regions
+def korean_names_by_region():
+    members = {region: [] for region in REGIONS}
+    for name_ko, (_, region) in KOREAN_COUNTRIES.items():
+        if region in members:
+            members[region].append(name_ko)
+    return members
+
+
+def save_country_dimension(output_path):
+    country_dimension().to_csv(output_path, index=False, encoding='utf-8-sig')
+    print(f'Saved country dimension to {output_path}')
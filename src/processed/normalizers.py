@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+from functools import wraps
+
+MONTH_ABBR_TO_NUM = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+# Last "(...)" group at the end of a label, e.g. "수출총액(독일)" -> "독일"
+PARTNER_PATTERN = r'\(([^(]*)\)[^()]*$'
+
+
+# Run a vectorized string transform on the distinct values only, then expand back.
+# Source columns repeat a handful of labels over many rows, so this is the memo.
+def on_uniques(func):
+    @wraps(func)
+    def wrapper(series, *args, **kwargs):
+        codes, uniques = pd.factorize(series)
+        result = func(pd.Series(uniques, dtype=object), *args, **kwargs)
+        out = result.iloc[np.where(codes >= 0, codes, 0)].set_axis(series.index)
+        if (codes < 0).any():
+            out.loc[codes < 0] = np.nan
+        if isinstance(out, pd.Series):
+            out.name = series.name
+        return out
+    return wrapper
+
+
+# Currency pairs: "USD/KRW" -> (USD, KRW); bare "USD" -> (KRW, USD)
+@on_uniques
+def split_currency(currency):
+    has_pair = currency.str.contains('/', regex=False)
+    parts = currency.str.split('/', n=1, expand=True).reindex(columns=[0, 1])
+    return pd.DataFrame({
+        'quote': parts[0].where(has_pair, 'KRW'),
+        'currency': parts[1].where(has_pair, currency)
+    })
+
+
+# Partner country from an ECOS trade label; customs totals and unlabelled rows are World
+@on_uniques
+def extract_partner(indicator):
+    partner = indicator.str.extract(PARTNER_PATTERN, expand=False)
+    partner = partner.where(~indicator.str.contains('관세청', regex=False), 'World')
+    return partner.fillna('World')
+
+
+# Month names/abbreviations ("January", "Jan") -> month number
+@on_uniques
+def month_number(month):
+    return month.str[:3].str.title().map(MONTH_ABBR_TO_NUM)
+
+
+# Labels starting with "<month> <year>" (e.g. "May 2025 YoY") -> first-of-month timestamps
+@on_uniques
+def month_label_to_date(label):
+    parts = label.str.split()
+    month_num = month_number(parts.str[0]).astype('Int64').astype(str).str.zfill(2)
+    return pd.to_datetime(parts.str[1] + '-' + month_num + '-01', errors='coerce')
+
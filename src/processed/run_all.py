@@ -7,6 +7,7 @@ DATA_DIR = os.getenv("DATA_DIR")
 from sector_process import crop_production, bid_info, confidence, fxrate, economic_indicator, \
     iea_oil_stocks, oil_import_summary, manufacture_inventory, steel_combined, global_trade_variation_top5, global_trade_trend, \
     global_export, korea_trade_trend, korea_export_import_items, ecos_trade_detail, ecos_trade_items, shipping_indices, wsts_billings
+from dimensions import save_country_dimension
 
 TASKS = [
     (crop_production, "agriculture", "crop_production"),
@@ -43,6 +44,11 @@ KOREA_EXPORT_IMPORT_ITEMS = [
 ]
 
 def run_all():
+    # Country dimension shared by the processed tables (joined on country_key / partner_key)
+    dimension_path = os.path.join(DATA_DIR, "processed", "reference", "country_dimension.csv")
+    os.makedirs(os.path.dirname(dimension_path), exist_ok=True)
+    save_country_dimension(dimension_path)
+
     for func, sector, name in TASKS:
         input_path = os.path.join(DATA_DIR, sector, name)
         output_path = os.path.join(DATA_DIR, "processed", sector, f"{os.path.splitext(name)[0]}_processed.csv")
@@ -0,0 +1,152 @@
+import os
+import pandas as pd
+from sqlalchemy.types import Date, Float, REAL, SmallInteger, Text
+
+DATE = 'datetime64[ns]'
+CATEGORY = 'category'
+
+# Labels repeated on every row of the long format
+LABELS = {
+    'country': CATEGORY, 'partner': CATEGORY, 'region': CATEGORY,
+    'sector': CATEGORY, 'source': CATEGORY, 'unit': CATEGORY,
+    'indicator': CATEGORY, 'category': CATEGORY,
+    'domain': CATEGORY, 'file_source': CATEGORY
+}
+
+# ISO numeric codes from the country dimension fit in int16
+KEYS = {'country_key': 'Int16', 'partner_key': 'Int16'}
+
+# Indexes, rates and percentages need ~7 significant digits; money and volumes stay float64
+INDEX_VALUE = {'value': 'float32'}
+PERCENT = {'yoy_change': 'float32', 'trade_yoy': 'float32', 'trade_share': 'float32'}
+
+
+def schema(*parts, **columns):
+    merged = {'date': DATE, **LABELS, **KEYS}
+    for part in parts:
+        merged.update(part)
+    merged.update(columns)
+    return merged
+
+
+CROP_PRODUCTION = schema(commodity=CATEGORY, value='float64')
+BID_INFO = schema(agency=CATEGORY, value='float64')
+INDEX_SERIES = schema(INDEX_VALUE)
+FX_RATES = schema(currency=CATEGORY, quote=CATEGORY, pair=CATEGORY, exchange_rate='float32')
+OIL_IMPORTS = schema(value='float64', metric_type=CATEGORY)
+TRADE_LONG = schema(value='float64', rank='int16', change_type=CATEGORY,
+                    commodity_name=CATEGORY, parent=CATEGORY, group=CATEGORY)
+TRADE_WIDE = schema(PERCENT, export_amount='float64', import_amount='float64', commodity_name=CATEGORY)
+ECOS_TRADE = schema(PERCENT, value='float64')
+ECOS_TRADE_ITEMS = schema(PERCENT, INDEX_VALUE)
+WSTS = schema(value='float64', period=CATEGORY, period_type=CATEGORY)
+
+# Processed datasets, keyed by file name without the "_processed.csv" suffix
+SCHEMAS = {
+    'crop_production': CROP_PRODUCTION,
+    'bid_info': BID_INFO,
+    'economy_confidence': INDEX_SERIES,
+    'fx_rates': FX_RATES,
+    'leading_vs_coincident_kospi': INDEX_SERIES,
+    'iea_oil_stocks': INDEX_SERIES,
+    'oil_imports_with_continents': OIL_IMPORTS,
+    'manufacture_inventory': INDEX_SERIES,
+    'steel_combined': INDEX_SERIES,
+    'global_trade_variation_top5': TRADE_LONG,
+    'global_trade': TRADE_LONG,
+    'global_export_increase_items_top5': TRADE_LONG,
+    'global_export_decrease_items_top5': TRADE_LONG,
+    'korea_export_country_variation': TRADE_WIDE,
+    'korea_import_country_variation': TRADE_WIDE,
+    'korea_export_increase_items': TRADE_WIDE,
+    'korea_import_increase_items': TRADE_WIDE,
+    'korea_trade_yoy': ECOS_TRADE,
+    'korea_trade_items_yoy': ECOS_TRADE_ITEMS,
+    'shipping_indices': INDEX_SERIES,
+    'wsts_billings_latest': WSTS,
+
+    # EDA outputs that carry a processed dataset through to the dashboard; like every key they
+    # are the name dataset_name gives the file ("sentiment_processed.csv" -> "sentiment")
+    'production_yoy_change': schema(CROP_PRODUCTION, yoy_change='float32'),
+    'streamlit_ready_data': CROP_PRODUCTION,
+    'economic_indicators_raw': INDEX_SERIES,
+    'key_indicators': schema(INDEX_SERIES, trend_3m='float32'),
+    'fx_raw': FX_RATES,
+    'sentiment_raw': INDEX_SERIES,
+    'sentiment': schema(INDEX_SERIES, momentum='float32', value_lag1='float32', value_change='float32',
+                        ma_3m='float32', ma_6m='float32', sentiment_strength=CATEGORY),
+    'iea_stocks_raw': INDEX_SERIES,
+    'oil_imports_raw': OIL_IMPORTS,
+    'import_regional_share_trends': OIL_IMPORTS,
+    'manufacturing_inventory_raw': INDEX_SERIES,
+    'steel_production_raw': INDEX_SERIES,
+    'shipping_index_pivoted': schema(BDI='float32', CCFI='float32', HRCI='float32', SCFI='float32'),
+    'wsts_yoy_monthly': schema(yoy_change='float32'),
+    'wsts_market_share_monthly': schema(market_share='float32'),
+    'trade_balance': schema(),
+
+    # Chart-ready frames written by eda/serving_layer.py
+    'serving_steel_relative_change': schema(INDEX_SERIES, relative_change='float32'),
+    'serving_economic_indicators_wide': schema()
+}
+
+
+# "data/processed/economy/fx_rates_processed.csv" -> "fx_rates"
+def dataset_name(path):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return stem[:-len('_processed')] if stem.endswith('_processed') else stem
+
+
+def get_schema(name):
+    return SCHEMAS.get(dataset_name(name))
+
+
+# Cast the columns a dataset declares; undeclared datasets and columns are left as they are
+def apply_schema(df, name):
+    columns = get_schema(name)
+    if columns is None or df.empty:
+        return df
+
+    df = df.copy()
+    for col, dtype in columns.items():
+        if col not in df.columns or df[col].dtype == dtype:
+            continue
+        if dtype == DATE:
+            df[col] = pd.to_datetime(df[col], errors='coerce')
+        elif dtype in ('float32', 'float64', 'Int16', 'int16'):
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype(dtype)
+        else:
+            df[col] = df[col].astype(dtype)
+    return df
+
+
+# read_csv dtypes so labels and floats are parsed straight into their compact types
+def read_dtypes(name):
+    columns = get_schema(name) or {}
+    return {col: dtype for col, dtype in columns.items() if dtype != DATE and dtype != 'int16'}
+
+
+def read_processed(path, name=None, **kwargs):
+    name = name or path
+    df = pd.read_csv(path, dtype=read_dtypes(name), **kwargs)
+    return apply_schema(df, name)
+
+
+# Postgres column types for to_sql; labels stay TEXT so re-uploads never fight over enum types
+def sql_dtypes(df, name):
+    sql_types = {DATE: Date(), CATEGORY: Text(), 'float32': REAL(), 'float64': Float(precision=53),
+                 'Int16': SmallInteger(), 'int16': SmallInteger()}
+    columns = get_schema(name) or {}
+    return {col: sql_types[dtype] for col, dtype in columns.items() if col in df.columns}
+
+
+if __name__ == "__main__":
+    # A key dataset_name can never produce is a schema no file will ever get
+    unreachable = [key for key in SCHEMAS if dataset_name(key) != key]
+    assert not unreachable, f"unreachable schema keys: {unreachable}"
+    outputs_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "eda", "outputs")
+    for path in ["economy/key_indicators_processed.csv", "economy/sentiment_processed.csv", "economy/fx_raw.csv"]:
+        columns = get_schema(os.path.join(outputs_dir, path))
+        assert columns is not None, f"no schema for {path}"
+        df = read_processed(os.path.join(outputs_dir, path))
+        print(f"{path:40s} {len(columns):3d} declared columns   {df.memory_usage(deep=True).sum() / 1e3:8.1f} KB")
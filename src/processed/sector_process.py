@@ -1,6 +1,11 @@
+import os
+import re
+import hashlib
+import numpy as np
 import pandas as pd
-from datetime import datetime
-import pycountry
+from normalizers import split_currency, extract_partner, month_label_to_date
+from dimensions import country_key, country_name, country_region, iso2_to_name
+from schema import apply_schema
 
 ## Agriculture Sector
 def crop_production(input_path, output_path):
@@ -20,7 +25,7 @@ def crop_production(input_path, output_path):
         .sort_values(by=['commodity', 'country', 'date']))
 
     # Save
-    final_df.to_csv(output_path, index=False)
+    apply_schema(final_df, output_path).to_csv(output_path, index=False)
     print(f'Saved cleaned data to {output_path}')
 
 ## Defence Sector
@@ -46,7 +51,7 @@ def bid_info(input_path, output_path):
     ]].sort_values(by=['date', 'agency', 'value'])
 
     # Save
-    final_df.to_csv(output_path, index=False, encoding='utf-8-sig')
+    apply_schema(final_df, output_path).to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f'Saved cleaned data to {output_path}')
 
 ## Economy Sector
@@ -72,7 +77,7 @@ def confidence(input_path, output_path):
                 .sort_values(by=['date', 'category','indicator']))
 
     # Save
-    final_df.to_csv(output_path, index=False, encoding='utf-8-sig')
+    apply_schema(final_df, output_path).to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f'Saved cleaned data to {output_path}')
 
 def fxrate(input_path, output_path):
@@ -85,9 +90,7 @@ def fxrate(input_path, output_path):
         'UNIT_NAME': 'unit'
     })
 
-    df[['quote', 'currency']] = df['CURRENCY'].apply(
-        lambda x: pd.Series(x.split('/') if '/' in x else ['KRW', x])
-    )
+    df[['quote', 'currency']] = split_currency(df['CURRENCY'])
 
     df['date'] = pd.to_datetime(df['date'])
     df['country'] = 'South Korea'
@@ -99,7 +102,7 @@ def fxrate(input_path, output_path):
                 .sort_values(by=['date', 'currency']))
 
     # Save
-    final_df.to_csv(output_path, index=False, encoding='utf-8-sig')
+    apply_schema(final_df, output_path).to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f'Saved cleaned data to {output_path}')
 
 def economic_indicator(input_path, output_path):
@@ -128,7 +131,7 @@ def economic_indicator(input_path, output_path):
 
     final_df = (df_long[['date', 'country', 'sector', 'indicator', 'value', 'unit', 'source']].sort_values(by=['date', 'indicator']))
 
-    final_df.to_csv(output_path, index=False, encoding='utf-8-sig')
+    apply_schema(final_df, output_path).to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f'Saved cleaned data to {output_path}')
 
 ## Energy Sector
@@ -148,7 +151,7 @@ def iea_oil_stocks(input_path, output_path):
 
     final_df = df[['date', 'country', 'sector', 'source', 'value', 'unit']].sort_values(by=['date', 'country', 'value'])
 
-    final_df.to_csv(output_path, index=False, encoding='utf-8-sig')
+    apply_schema(final_df, output_path).to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f'Saved cleaned data to {output_path}')
 
 def oil_import_summary(input_path, output_path):
@@ -166,28 +169,10 @@ def oil_import_summary(input_path, output_path):
 
     df_long[['country', 'unit']] = df_long['country_unit'].str.extract(r'^(.*?)\s*\((.*?)\)$')
 
-    # Region mapping
-    region_map = {
-        'Asia': ['필리핀', '말레이시아', '인도네시아', '호주', '뉴질랜드', '파푸아뉴기니', '카자흐스탄'],
-        'Africa': ['알제리', '콩고', '나이지리아', '적도기니', '모잠비크', '가봉'],
-        'America': ['캐나다', '미국', '멕시코', '브라질', '에콰도르'],
-        'MiddleEast': ['이라크', '쿠웨이트', '카타르', '아랍에미레이트', '사우디아라비아', '오만', '중립지대'],
-        'Europe': ['노르웨이', '영국'],
-        'Total': ['합 계']
-    }
-    country_to_region = {country: region for region, countries in region_map.items() for country in countries}
-    df_long['region'] = df_long['country'].map(country_to_region).fillna(df_long['country'])
-
-    # English
-    country_name_map = {'필리핀': 'Philippines','말레이시아': 'Malaysia','인도네시아': 'Indonesia',
-        '호주': 'Australia','뉴질랜드': 'New Zealand','파푸아뉴기니': 'Papua New Guinea',
-        '카자흐스탄': 'Kazakhstan','알제리': 'Algeria','콩고': 'Congo','나이지리아': 'Nigeria','적도기니': 'Equatorial Guinea',
-        '모잠비크': 'Mozambique','캐나다': 'Canada','미국': 'United States','멕시코': 'Mexico','브라질': 'Brazil',
-        '에콰도르': 'Ecuador','이라크': 'Iraq','쿠웨이트': 'Kuwait','카타르': 'Qatar','아랍에미레이트': 'UAE',
-        '사우디아라비아': 'Saudi Arabia','오만': 'Oman','중립지대': 'Neutral Zone',
-        '노르웨이': 'Norway','영국': 'United Kingdom', '가봉': 'Gabon', '합 계': 'Total'
-    }
-    df_long['country'] = df_long['country'].map(country_name_map).fillna(df_long['country'])
+    # Region and English name from the country dimension
+    df_long['region'] = country_region(df_long['country']).fillna(df_long['country'])
+    df_long['country_key'] = country_key(df_long['country'])
+    df_long['country'] = country_name(df_long['country'])
 
     # Convert % strings to float
     mask_percent = df_long['unit'] == '%'
@@ -211,13 +196,13 @@ def oil_import_summary(input_path, output_path):
     }
     df_long['unit'] = df_long['unit'].map(unit_map)
 
-    df_long = df_long[['date', 'region', 'country', 'value', 'unit', 'sector', 'source']].sort_values(by=['date', 'country', 'unit'])
+    df_long = df_long[['date', 'region', 'country', 'country_key', 'value', 'unit', 'sector', 'source']].sort_values(by=['date', 'country', 'unit'])
 
     # Drop rows where both 'region' and 'country' columns are missing or empty
     if 'region' in df_long.columns and 'country' in df_long.columns:
         df_long = df_long[~(df_long['region'].fillna('').eq('') & df_long['country'].fillna('').eq(''))]
 
-    df_long.to_csv(output_path, index=False, encoding='utf-8-sig')
+    apply_schema(df_long, output_path).to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f'Saved cleaned data to: {output_path}')
 
 # Industry Sector
@@ -248,7 +233,7 @@ def manufacture_inventory(input_path, output_path):
                 .sort_values(by=['date', 'category']))
 
     # Save
-    final_df.to_csv(output_path, index=False, encoding='utf-8-sig')
+    apply_schema(final_df, output_path).to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f'Saved cleaned data to {output_path}')
 
 def steel_combined(input_path, output_path):
@@ -261,8 +246,8 @@ def steel_combined(input_path, output_path):
     df['unit'] = 'percentage'
     df['region'] = df['Region']
 
-    # Rename Turkey
-    df['region'] = df['region'].replace('Türkiye', 'Turkey')
+    # Canonical country names (e.g. Türkiye -> Turkey); aggregates such as World are kept
+    df['region'] = country_name(df['region'])
 
     # Melt the DataFrame first
     yoy_cols = [col for col in df.columns if 'YoY' in col]
@@ -275,17 +260,13 @@ def steel_combined(input_path, output_path):
     )
 
     # Now extract date from melted 'indicator' column
-    month_strs = df_long['indicator'].str.split().str[0]
-    year_strs = df_long['indicator'].str.split().str[1]
-    month_nums = month_strs.str[:3].apply(lambda x: datetime.strptime(x, '%b').month)
-
-    df_long['date'] = pd.to_datetime(year_strs + '-' + month_nums.astype(str).str.zfill(2) + '-01', errors='coerce')
+    df_long['date'] = month_label_to_date(df_long['indicator'])
 
     # Final cleanup and save
     final_df = df_long[['date', 'region', 'sector', 'indicator', 'value', 'unit', 'source']]
     final_df = final_df.sort_values(by=['date', 'region'])
 
-    final_df.to_csv(output_path, index=False, encoding='utf-8-sig')
+    apply_schema(final_df, output_path).to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f'Saved cleaned data to: {output_path}')
 
 
@@ -301,9 +282,10 @@ def global_trade_variation_top5(input_path, output_path):
     df.drop(columns=['expItcNatCd', 'impItcNatCd', 'expCountryNm', 'impCountryNm', 'hscd', 'cmdltDisplayNm', 'rank'], inplace=True)
 
     # Convert ISO codes to country names
-    ISO2_TO_COUNTRY = {c.alpha_2: c.name for c in pycountry.countries} # type: ignore
-    df['country'] = df['expIsoWd2NatCd'].map(ISO2_TO_COUNTRY).fillna(df['expIsoWd2NatCd'])
-    df['partner'] = df['impIsoWd2NatCd'].map(ISO2_TO_COUNTRY).fillna(df['impIsoWd2NatCd'])
+    df['country'] = iso2_to_name(df['expIsoWd2NatCd'])
+    df['partner'] = iso2_to_name(df['impIsoWd2NatCd'])
+    df['country_key'] = country_key(df['expIsoWd2NatCd'])
+    df['partner_key'] = country_key(df['impIsoWd2NatCd'])
 
     # Rename indicators
     indicator_rename = {
@@ -318,7 +300,7 @@ def global_trade_variation_top5(input_path, output_path):
     melt_cols = list(indicator_rename.values())
 
     df_long = df.melt(
-        id_vars=['date', 'country', 'partner'],
+        id_vars=['date', 'country', 'partner', 'country_key', 'partner_key'],
         value_vars=melt_cols,
         var_name='indicator',
         value_name='value'
@@ -339,7 +321,7 @@ def global_trade_variation_top5(input_path, output_path):
 
     # Sort and save
     df_long = df_long.sort_values(by=['date', 'country', 'partner', 'indicator'])
-    df_long.to_csv(output_path, index=False, encoding='utf-8-sig')
+    apply_schema(df_long, output_path).to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f"Saved cleaned file to: {output_path}")
 
 # Global Trade
@@ -358,9 +340,10 @@ def global_trade_trend(input_path, output_path):
     df['rank'] = df['rank'].astype(int)
 
     # Convert ISO codes to country names
-    ISO2_TO_COUNTRY = {c.alpha_2: c.name for c in pycountry.countries}  # type: ignore
-    df['country'] = df['expIsoWd2NatCd'].map(ISO2_TO_COUNTRY).fillna(df['expIsoWd2NatCd'])
-    df['partner'] = df['impIsoWd2NatCd'].map(ISO2_TO_COUNTRY).fillna(df['impIsoWd2NatCd'])
+    df['country'] = iso2_to_name(df['expIsoWd2NatCd'])
+    df['partner'] = iso2_to_name(df['impIsoWd2NatCd'])
+    df['country_key'] = country_key(df['expIsoWd2NatCd'])
+    df['partner_key'] = country_key(df['impIsoWd2NatCd'])
 
     # Rename indicators
     indicator_rename = {
@@ -374,7 +357,7 @@ def global_trade_trend(input_path, output_path):
     # Melt indicators
     melt_cols = list(indicator_rename.values())
     df_long = df.melt(
-        id_vars=['date', 'country', 'partner', 'rank'],
+        id_vars=['date', 'country', 'partner', 'country_key', 'partner_key', 'rank'],
         value_vars=melt_cols,
         var_name='indicator',
         value_name='value'
@@ -395,7 +378,7 @@ def global_trade_trend(input_path, output_path):
 
     # Sort and save
     df_long = df_long.sort_values(by=['date', 'rank', 'country', 'partner', 'indicator'])
-    df_long.to_csv(output_path, index=False, encoding='utf-8-sig')
+    apply_schema(df_long, output_path).to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f"Saved cleaned file to: {output_path}")
 
 # Global Export Increase and Decrease Items Top 5
@@ -441,7 +424,7 @@ def global_export(input_path, output_path, direction):
 
     # Sort and save
     df_long = df_long.sort_values(by=['date', 'country', 'indicator'])
-    df_long.to_csv(output_path, index=False, encoding='utf-8-sig')
+    apply_schema(df_long, output_path).to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f"Saved cleaned file to: {output_path}")
 
 # Korea Trade Trend
@@ -467,9 +450,9 @@ def korea_trade_trend(input_path, output_path, direction):
     df = df.rename(columns={k: v for k, v in rename_map.items() if k in df.columns})
     
     # Convert ISO codes to country names
-    ISO2_TO_COUNTRY = {c.alpha_2: c.name for c in pycountry.countries}  # type: ignore
-    df['partner'] = df['isoWd2NatCd'].map(ISO2_TO_COUNTRY).fillna(df['isoWd2NatCd'])
+    df['partner'] = iso2_to_name(df['isoWd2NatCd'])
     df['partner'] = df['partner'].replace('ALL', 'World')
+    df['partner_key'] = country_key(df['partner'])
 
     # Add static info
     df['country'] = 'South Korea'
@@ -478,7 +461,7 @@ def korea_trade_trend(input_path, output_path, direction):
     df['indicator'] = direction
     
     # Select columns dynamically based on existing data
-    base_cols = ['date', 'country', 'partner', 'indicator']
+    base_cols = ['date', 'country', 'partner', 'partner_key', 'indicator']
     value_cols = [col for col in ['export_amount', 'import_amount', 'trade_yoy', 'trade_share'] if col in df.columns]
     static_cols = ['sector', 'source']
     final_cols = base_cols + value_cols + static_cols
@@ -486,7 +469,7 @@ def korea_trade_trend(input_path, output_path, direction):
     df = df[final_cols]
 
     # Save
-    df.to_csv(output_path, index=False, encoding='utf-8-sig')
+    apply_schema(df, output_path).to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f"Saved cleaned file to: {output_path}")
 
 # Korea Export and Import Items
@@ -524,7 +507,7 @@ def korea_export_import_items(input_path, output_path, direction):
     df = df[final_cols]
 
     # Save
-    df.to_csv(output_path, index=False, encoding='utf-8-sig')
+    apply_schema(df, output_path).to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f"Saved cleaned file to: {output_path}")
 
 # ECOS Trade Overview
@@ -556,33 +539,11 @@ def ecos_trade_detail(input_path, output_path):
     # Extract partner from indicator:
     # If contains "(관세청)" → 'World'
     # If format is like "수출총액(독일)" → extract "독일"
-    df['partner'] = df['indicator'].apply(
-    lambda x: 'World' if '관세청' in x 
-    else (x[x.rfind('(')+1:x.rfind(')')] if '(' in x and ')' in x and x.rfind('(') < x.rfind(')') 
-    else 'World')
-    )
+    df['partner'] = extract_partner(df['indicator'])
 
-    # Rename partner
-    korean_to_english = {
-    '독일': 'Germany',
-    '러시아': 'Russia',
-    '미국': 'United States',
-    '인도네시아': 'Indonesia',
-    '중국': 'China',
-    '캐나다': 'Canada',
-    '태국': 'Thailand',
-    '필리핀': 'Philippines',
-    '호주': 'Australia',
-    '말레이지아': 'Malaysia',
-    '싱가포르': 'Singapore',
-    '아랍에미레이트': 'United Arab Emirates',
-    '이탈리아': 'Italy',
-    '인도': 'India',
-    '프랑스': 'France'
-    }
-
-    # Apply to the `partner` column
-    df['partner'] = df['partner'].replace(korean_to_english)
+    # Korean partner names -> English
+    df['partner'] = country_name(df['partner'])
+    df['partner_key'] = country_key(df['partner'])
 
     # Add static metadata
     df['country'] = 'South Korea'
@@ -590,11 +551,11 @@ def ecos_trade_detail(input_path, output_path):
     df['source'] = 'ECOS'
 
     # Reorder and sort
-    df = df[['date', 'country', 'partner', 'sector', 'category', 'indicator', 'value', 'unit', 'yoy_change', 'source']]
+    df = df[['date', 'country', 'partner', 'partner_key', 'sector', 'category', 'indicator', 'value', 'unit', 'yoy_change', 'source']]
     df = df.sort_values(by=['date', 'category', 'indicator'])
 
     # Save
-    df.to_csv(output_path, index=False, encoding='utf-8-sig')
+    apply_schema(df, output_path).to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f"Saved cleaned file to {output_path}")
 
 def ecos_trade_items(input_path, output_path):
@@ -632,7 +593,7 @@ def ecos_trade_items(input_path, output_path):
     df = df.sort_values(by=['date', 'category', 'indicator'])
 
     # Save
-    df.to_csv(output_path, index=False, encoding='utf-8-sig')
+    apply_schema(df, output_path).to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f"Saved cleaned file to {output_path}")
 
 # Shipping indcies
@@ -664,141 +625,84 @@ def shipping_indices(input_path, output_path):
     df_long = df_long.sort_values(by=['date', 'indicator'])
 
     # Save
-    df_long.to_csv(output_path, index=False, encoding='utf-8-sig')
+    apply_schema(df_long, output_path).to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f"Saved cleaned file to {output_path}")
 
 # WSTS Billings Semiconductors
-def wsts_billings(input_path, output_path):
-    df = pd.read_excel(input_path, sheet_name='Monthly Data', header=3)
+WSTS_MONTHS = ['January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December']
+WSTS_QUARTERS = ['Q1', 'Q2', 'Q3', 'Q4']
+WSTS_TOTAL_YEAR = 'Total Year'
+WSTS_REGIONS = ['Americas', 'Europe', 'Japan', 'Asia Pacific', 'Worldwide']
+
+# Month-day used as the date of each period (quarters mid-quarter, annual mid-year)
+WSTS_PERIOD_DATES = {
+    **{month: f"{i:02d}-01" for i, month in enumerate(WSTS_MONTHS, start=1)},
+    'Q1': '02-15', 'Q2': '05-15', 'Q3': '08-15', 'Q4': '11-15',
+    WSTS_TOTAL_YEAR: '07-01'
+}
+
+# Read an Excel sheet through a Parquet cache keyed by the workbook's content hash
+def read_excel_cached(input_path, sheet_name, header, cache_dir=None):
+    with open(input_path, 'rb') as f:
+        file_hash = hashlib.sha256(f.read()).hexdigest()[:16]
+
+    cache_dir = cache_dir or os.path.join(os.path.dirname(input_path), '.cache')
+    stem = os.path.splitext(os.path.basename(input_path))[0]
+    sheet_key = re.sub(r'\W+', '_', str(sheet_name))
+    cache_path = os.path.join(cache_dir, f"{stem}_{sheet_key}_h{header}_{file_hash}.parquet")
+
+    if os.path.exists(cache_path):
+        return pd.read_parquet(cache_path)
+
+    df = pd.read_excel(input_path, sheet_name=sheet_name, header=header)
+
+    # Mixed object columns are not Parquet-safe; store every cell as nullable string
+    df.columns = [str(col) for col in df.columns]
+    df = df.astype('string')
+
+    os.makedirs(cache_dir, exist_ok=True)
+    df.to_parquet(cache_path, index=False)
+    return df
 
-    # Define the columns
-    months = ['January', 'February', 'March', 'April', 'May', 'June', 
-              'July', 'August', 'September', 'October', 'November', 'December']
-    quarters = ['Q1', 'Q2', 'Q3', 'Q4']
-    total_year = 'Total Year'
+def wsts_billings(input_path, output_path):
+    df = read_excel_cached(input_path, sheet_name='Monthly Data', header=3)
+
+    period_cols = WSTS_MONTHS + WSTS_QUARTERS + [WSTS_TOTAL_YEAR]
+    period_types = ['month'] * len(WSTS_MONTHS) + ['quarter'] * len(WSTS_QUARTERS) + ['annual']
+
+    # Carry the year marker rows down onto the region rows below them
+    first_col = df.iloc[:, 0].astype('string').str.strip()
+    is_year = first_col.str.fullmatch(r'\d{4}').fillna(False).astype(bool)
+    year = first_col.where(is_year).ffill()
+    is_region = first_col.isin(WSTS_REGIONS).fillna(False).astype(bool) & year.notna() & ~is_year
+
+    # Parse all period cells of all region rows in one pass
+    block = df.loc[is_region, period_cols].astype('string').to_numpy().ravel()
+    cells = pd.Series(block, dtype='string').str.replace(',', '', regex=False).str.replace('$', '', regex=False)
+    values = pd.to_numeric(cells.str.strip(), errors='coerce').to_numpy(dtype=float)
+
+    n_rows, n_periods = int(is_region.sum()), len(period_cols)
+    df_long = pd.DataFrame({
+        'year': np.repeat(year[is_region].astype(int).to_numpy(), n_periods),
+        'period': np.tile(period_cols, n_rows),
+        'period_type': np.tile(period_types, n_rows),
+        'region': np.repeat(first_col[is_region].to_numpy(dtype=object), n_periods),
+        'value': values
+    })
+    df_long = df_long.dropna(subset=['value'])
 
-    # Create a clean dataframe with year and region info
-    result_rows = []
-    current_year = None
-    
-    for idx, row in df.iterrows():
-        first_col = str(row.iloc[0]).strip()
-        
-        # Check if this row contains a year
-        if first_col.isdigit() and len(first_col) == 4:
-            current_year = int(first_col)
-            continue
-            
-        # Check if this row contains region data
-        regions = ['Americas', 'Europe', 'Japan', 'Asia Pacific', 'Worldwide']
-        if first_col in regions and current_year is not None:
-            region = first_col
-            
-            # Extract monthly values
-            for month in months:
-                value = row[month]
-                if pd.notna(value) and value != '':
-                    try:
-                        # Convert value to numeric, handling potential formatting
-                        if isinstance(value, str):
-                            value = value.replace(',', '').replace('$', '')
-                        value = float(value)
-                        
-                        result_rows.append({
-                            'year': current_year,
-                            'period': month,
-                            'period_type': 'month',
-                            'region': region,
-                            'value': value
-                        })
-                    except (ValueError, TypeError):
-                        # Skip invalid values
-                        continue
-            
-            # Extract quarterly values
-            for quarter in quarters:
-                value = row[quarter]
-                if pd.notna(value) and value != '':
-                    try:
-                        # Convert value to numeric, handling potential formatting
-                        if isinstance(value, str):
-                            value = value.replace(',', '').replace('$', '')
-                        value = float(value)
-                        
-                        result_rows.append({
-                            'year': current_year,
-                            'period': quarter,
-                            'period_type': 'quarter',
-                            'region': region,
-                            'value': value
-                        })
-                    except (ValueError, TypeError):
-                        # Skip invalid values
-                        continue
-            
-            # Extract total year value
-            if total_year:
-                value = row[total_year]
-                if pd.notna(value) and value != '':
-                    try:
-                        # Convert value to numeric, handling potential formatting
-                        if isinstance(value, str):
-                            value = value.replace(',', '').replace('$', '')
-                        value = float(value)
-                        
-                        result_rows.append({
-                            'year': current_year,
-                            'period': 'Total Year',
-                            'period_type': 'annual',
-                            'region': region,
-                            'value': value
-                        })
-                    except (ValueError, TypeError):
-                        # Skip invalid values
-                        continue
-    
-    # Create DataFrame from results
-    df_long = pd.DataFrame(result_rows)
-
-    # Create proper date column for monthly data only
-    df_long['date'] = None
-    monthly_mask = df_long['period_type'] == 'month'
-    df_long.loc[monthly_mask, 'date'] = pd.to_datetime(
-        df_long.loc[monthly_mask, 'year'].astype(str) + '-' + 
-        df_long.loc[monthly_mask, 'period'] + '-01',
-        errors='coerce'
-    )
-    
-    # For quarterly data, create approximate dates (middle of quarter)
-    quarterly_mask = df_long['period_type'] == 'quarter'
-    quarter_to_month = {'Q1': '02-15', 'Q2': '05-15', 'Q3': '08-15', 'Q4': '11-15'}
-    for quarter, month_day in quarter_to_month.items():
-        mask = quarterly_mask & (df_long['period'] == quarter)
-        df_long.loc[mask, 'date'] = pd.to_datetime(
-            df_long.loc[mask, 'year'].astype(str) + '-' + month_day,
-            errors='coerce'
-        )
-    
-    # For annual data, use middle of year
-    annual_mask = df_long['period_type'] == 'annual'
-    df_long.loc[annual_mask, 'date'] = pd.to_datetime(
-        df_long.loc[annual_mask, 'year'].astype(str) + '-07-01',
-        errors='coerce'
-    )
-    df_long['date'] = pd.to_datetime(df_long['date'], errors='coerce')
-    df_long['date'] = df_long['date'].dt.strftime('%Y-%m-%d')
+    # Monthly dates on the 1st, quarterly mid-quarter, annual mid-year
+    df_long['date'] = pd.to_datetime(
+        df_long['year'].astype(str) + '-' + df_long['period'].map(WSTS_PERIOD_DATES),
+        format='%Y-%m-%d', errors='coerce'
+    ).dt.strftime('%Y-%m-%d')
 
     # Clean up and rename columns
     df_long = df_long.rename(columns={'region': 'country'})
     
     # Standardise country names
-    df_long['country'] = df_long['country'].replace({
-        'Americas': 'Americas',
-        'Europe': 'Europe', 
-        'Japan': 'Japan',
-        'Asia Pacific': 'Asia Pacific',
-        'Worldwide': 'World'
-    })
+    df_long['country'] = df_long['country'].replace({'Worldwide': 'World'})
     
     # Add metadata columns
     df_long['sector'] = 'semiconductors'
@@ -814,6 +718,5 @@ def wsts_billings(input_path, output_path):
     df_long = df_long.sort_values(by=['date', 'country'])
     
     # Save to CSV
-    df_long.to_csv(output_path, index=False, encoding='utf-8-sig')
+    apply_schema(df_long, output_path).to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f"Saved cleaned file to {output_path}")
- 
\ No newline at end of file
@@ -2,62 +2,22 @@ import streamlit as st
 from datetime import datetime
 import sys
 import os
-import pandas as pd
-from functools import lru_cache
 
 # Add the parent directory to Python path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from utils.data_loader import (
-    load_agriculture_data,
-    load_defence_data,
-    load_economy_data,
-    load_energy_data,
-    load_industry_data,
-    load_global_trade_data,
-    load_korea_trade_data,
-)
+from utils.data_loader import load_home_summary, last_refreshed
 
 # --- Data Loading and Preprocessing ---
-# Manually set total records and indicators (adjust if you want these dynamic)
-total_records = 160721
-total_indicators = 92
-
-@lru_cache
-def get_all_sector_data():
-    sector_dates = []
-    all_data = {}
-    for df_loader in [
-        load_agriculture_data,
-        load_defence_data,
-        load_economy_data,
-        load_energy_data,
-        load_industry_data,
-        load_global_trade_data,
-        load_korea_trade_data,
-    ]:
-        data = df_loader()
-        for key in data:
-            df = data[key]
-            all_data[key] = df
-            if isinstance(df, pd.DataFrame) and not df.empty and "date" in df.columns:
-                try:
-                    df["date"] = pd.to_datetime(df["date"])
-                    sector_dates.append(df["date"].max())
-                except Exception as e:
-                    st.warning(f"Could not convert 'date' column to datetime for a dataframe from {df_loader.__name__}: {e}")
-                    pass
-
-    if sector_dates:
-        last_update = max(sector_dates)
-        if hasattr(last_update, 'strftime'):
-            last_update = last_update.strftime('%Y-%m-%d')
-        else:
-            last_update = str(last_update)
-    else:
-        last_update = "N/A"
+# Everything on this page comes from eda/outputs/home_summary.json, written by the EDA run
+home_summary = load_home_summary()
+summary_totals = home_summary.get("totals", {})
+sector_summaries = home_summary.get("sectors", {})
 
-    return all_data, last_update
+total_sectors = summary_totals.get("sectors", 7)
+total_records = summary_totals.get("records", 0)
+total_indicators = summary_totals.get("indicators", 0)
+last_update = summary_totals.get("latest_date") or "N/A"
 
 # --- Streamlit Page Configuration ---
 st.set_page_config(
@@ -78,15 +38,6 @@ def create_metric_card(title, value, subtitle="", color="#007bff"):
     </div>
     """
 
-def extract_section(text, start, end=None):
-    """Extract section between start and end markers from AI insight text."""
-    if start not in text:
-        return ""
-    section = text.split(start)[1]
-    if end and end in section:
-        section = section.split(end)[0]
-    return section.strip()
-
 def format_insight_text(text):
     """Clean AI text for better markdown rendering in Streamlit, including custom bullet formatting."""
     if not text:
@@ -446,65 +397,60 @@ st.markdown(f"""
 
 
 
-# Load all Gemini insights for display in tabs
-agri_gemini = load_agriculture_data().get("gemini_insight", "No AI insights found for Agriculture.")
-defence_gemini = load_defence_data().get("gemini_insight", "No AI insights found for Defence.")
-economy_gemini = load_economy_data().get("gemini_insight", "No AI insights found for Economy.")
-energy_gemini = load_energy_data().get("gemini_insight", "No AI insights found for Energy.")
-industry_gemini = load_industry_data().get("gemini_insight", "No AI insights found for Industry.")
-global_trade_gemini = load_global_trade_data().get("gemini_insight", "No AI insights found for Global Trade.")
-korea_trade_gemini = load_korea_trade_data().get("gemini_insight", "No AI insights found for Korea Trade.")
-
-# Define insights mapping to tab labels with emojis
-all_sector_insights = {
-    "🌾 Agriculture": agri_gemini,
-    "🛡️ Defence": defence_gemini,
-    "💹 Economy": economy_gemini,
-    "⚡ Energy": energy_gemini,
-    "🏭 Industry": industry_gemini,
-    "🌍 Global Trade": global_trade_gemini,
-    "🇰🇷 Korea Trade": korea_trade_gemini,
+# Actionable insight per sector, keyed by tab label
+SECTOR_TABS = {
+    "🌾 Agriculture": "agriculture",
+    "🛡️ Defence": "defence",
+    "💹 Economy": "economy",
+    "⚡ Energy": "energy",
+    "🏭 Industry": "industry",
+    "🌍 Global Trade": "global_trade",
+    "🇰🇷 Korea Trade": "korea_trade",
 }
 
 # --- Actionable Insights Section ---
 st.markdown('<div class="section-header"><h2>💡 Actionable Insights</h2></div>', unsafe_allow_html=True)
 
 # Create tabs for each sector's actionable insights
-sector_tab_labels = [sector for sector in all_sector_insights.keys()]
+sector_tab_labels = list(SECTOR_TABS.keys())
 sector_tabs = st.tabs(sector_tab_labels)
 
 # Iterate through tabs and display actionable insight
-for i, sector_name in enumerate(all_sector_insights.keys()):
+for i, sector_name in enumerate(sector_tab_labels):
     with sector_tabs[i]:
-        gemini_insight_for_sector = all_sector_insights[sector_name]
-        
-        if gemini_insight_for_sector and "No AI insights found" not in gemini_insight_for_sector:
-            # Extract and format the specific actionable insight
-            actionable_insight = extract_section(gemini_insight_for_sector, "### Top 1 actionable insight", "### Key risks")
-            if actionable_insight:
-                st.markdown(f"""
-                    <div style="
-                            background: linear-gradient(135deg, #fff9e6 0%, #fefbe9 100%);
-                            padding: 1.5rem 2rem;
-                            border-left: 6px solid #e0a800;
-                            border-radius: 12px;
-                            box-shadow: 0 4px 12px rgba(0,0,0,0.04);
-                            margin-top: 1.2rem;
-                            font-size: 1.05rem;
-                            line-height: 1.7;
-                            color: #4a3f0e;
-                        ">
-                        <div style="padding-left: 0.3rem;">
-                            {format_insight_text(actionable_insight)}
-                        </div>
+        sector_summary = sector_summaries.get(SECTOR_TABS[sector_name], {})
+        actionable_insight = sector_summary.get("actionable_insight", "")
+        sector_name_clean = sector_name.split(' ', 1)[1] if ' ' in sector_name else sector_name
+
+        # Headline KPIs precomputed by the EDA run
+        kpis = sector_summary.get("kpis", [])
+        if kpis:
+            kpi_cols = st.columns(len(kpis))
+            for kpi_col, kpi in zip(kpi_cols, kpis):
+                value = kpi["value"]
+                kpi_col.metric(kpi["label"], f"{value:,.2f}" if isinstance(value, float) else value)
+
+        if actionable_insight:
+            st.markdown(f"""
+                <div style="
+                        background: linear-gradient(135deg, #fff9e6 0%, #fefbe9 100%);
+                        padding: 1.5rem 2rem;
+                        border-left: 6px solid #e0a800;
+                        border-radius: 12px;
+                        box-shadow: 0 4px 12px rgba(0,0,0,0.04);
+                        margin-top: 1.2rem;
+                        font-size: 1.05rem;
+                        line-height: 1.7;
+                        color: #4a3f0e;
+                    ">
+                    <div style="padding-left: 0.3rem;">
+                        {format_insight_text(actionable_insight)}
                     </div>
-                """, unsafe_allow_html=True)
-
-            else:
-                sector_name_clean = sector_name.split(' ', 1)[1] if ' ' in sector_name else sector_name
-                st.info(f"No actionable insight available for {sector_name_clean}.")
+                </div>
+            """, unsafe_allow_html=True)
+        elif sector_summary:
+            st.info(f"No actionable insight available for {sector_name_clean}.")
         else:
-            sector_name_clean = sector_name.split(' ', 1)[1] if ' ' in sector_name else sector_name
             st.info(f"No AI insights found for {sector_name_clean}.")
 
 
@@ -612,24 +558,15 @@ with col3:
 st.markdown('<div class="section-header"><h2>🌟 Strategic Implications</h2></div>', unsafe_allow_html=True)
 
 # Create tabs for each sector's detailed strategic implications
-sector_tab_labels_2 = [sector for sector in all_sector_insights.keys()]
-sector_tabs_2 = st.tabs(sector_tab_labels_2)
+sector_tabs_2 = st.tabs(sector_tab_labels)
 
 # Iterate through tabs and display detailed strategic implications
-for i, sector_name in enumerate(all_sector_insights.keys()):
+for i, sector_name in enumerate(sector_tab_labels):
     with sector_tabs_2[i]:
-        gemini_insight_for_sector = all_sector_insights[sector_name]
-        
-        if gemini_insight_for_sector and "No AI insights found" not in gemini_insight_for_sector:
-            # Extract and format sections for the current sector's insight
-            sections = {
-                "Core Trend": extract_section(gemini_insight_for_sector, "### Core Trend", "### Hidden Effects"),
-                "Hidden Effects": extract_section(gemini_insight_for_sector, "### Hidden Effects", "### Strategic Recommendations"),
-                "Strategic Recommendations": extract_section(gemini_insight_for_sector, "### Strategic Recommendations", "### Risk Assessment"),
-                "Risk Assessment": extract_section(gemini_insight_for_sector, "### Risk Assessment", "### Market Intelligence"),
-                "Market Intelligence": extract_section(gemini_insight_for_sector, "### Market Intelligence")
-            }
+        sections = sector_summaries.get(SECTOR_TABS[sector_name], {}).get("insight_sections", {})
+        sector_name_clean = sector_name.split(' ', 1)[1] if ' ' in sector_name else sector_name
 
+        if any(sections.values()):
             # Display sub-tabs within each sector tab for detailed insights
             insight_sub_tab_labels = ["📊 Core Trends", "🔍 Hidden Effects", "🎯 Strategic Recommendations", "⚠️ Risk Assessment", "📈 Market Intelligence"]
             insight_sub_tabs = st.tabs(insight_sub_tab_labels)
@@ -640,10 +577,8 @@ for i, sector_name in enumerate(all_sector_insights.keys()):
                         st.markdown(f"**{label}**") 
                         st.markdown(format_insight_text(content))
                     else:
-                        sector_name_clean = sector_name.split(' ', 1)[1] if ' ' in sector_name else sector_name
                         st.info(f"No {label} insights available for {sector_name_clean}.")
         else:
-            sector_name_clean = sector_name.split(' ', 1)[1] if ' ' in sector_name else sector_name
             st.info(f"No AI insights found for {sector_name_clean}.")
 
 # How It Works
@@ -714,7 +649,7 @@ col1, col2, col3, col4 = st.columns(4)
 with col1:
     st.markdown(create_metric_card(
         "📂 Sector Dashboards",
-        "7",
+        f"{total_sectors}",
         "",
         "#1e3c72"
     ), unsafe_allow_html=True)
@@ -735,14 +670,15 @@ with col3:
         "#1e3c72"
     ), unsafe_allow_html=True)
 
-# Before using last_update in the metric card, get it from the function:
-_, last_update = get_all_sector_data()
+# True refresh time comes from the EDA artifact manifest; latest data point shown underneath
+refreshed_at = last_refreshed()
+refreshed_label = datetime.fromisoformat(refreshed_at).strftime('%Y-%m-%d %H:%M') if refreshed_at else last_update
 
 with col4:
     st.markdown(create_metric_card(
-        "📅 Last Update",
-        last_update,
-        "",
+        "📅 Last Refreshed",
+        refreshed_label,
+        f"Latest data: {last_update}" if refreshed_at else "",
         "#1e3c72"
     ), unsafe_allow_html=True)
 
@@ -10,7 +10,11 @@ warnings.filterwarnings('ignore')
 
 # Add the parent directory to Python path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from utils.data_loader import load_agriculture_data
+from utils.data_loader import load_agriculture_data, load_alerts, load_series_history
+from utils.charts import alert_history_chart
+from utils.filter_engine import SectorFilter
+from utils.search_index import search_rows
+from utils.exports import export_buttons
 
 # Page Config
 st.set_page_config(
@@ -150,7 +154,7 @@ def format_dates_for_display(df):
 # (Will be created after data is loaded)
 
 # Cache data loading for better performance
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+# Shared process-wide store (utils.data_loader); no per-session copy
 def load_cached_agriculture_data():
     """Load and cache agriculture data with error handling"""
     try:
@@ -262,54 +266,6 @@ def analyze_performance_tiers(growth_data):
         }
     }
 
-def generate_alerts(growth_data, corr_data):
-    """Generate data-driven alerts based on available data"""
-    alerts = []
-    
-    if not growth_data.empty and 'CAGR (%)' in growth_data.columns:
-        mean_growth = growth_data['CAGR (%)'].mean()
-        std_growth = growth_data['CAGR (%)'].std()
-        max_growth = growth_data['CAGR (%)'].max()
-        min_growth = growth_data['CAGR (%)'].min()
-        
-        # High growth alert
-        if max_growth > mean_growth + 2 * std_growth:
-            top_commodity = growth_data.loc[growth_data['CAGR (%)'].idxmax(), 'Commodity']
-            alerts.append({
-                'type': 'warning',
-                'title': 'EXTREME GROWTH DETECTED',
-                'message': f'{top_commodity} shows {max_growth:.1f}% growth (vs {mean_growth:.1f}% average). Monitor for potential volatility.'
-            })
-        
-        # Low/negative growth alert
-        if min_growth < 0:
-            worst_commodity = growth_data.loc[growth_data['CAGR (%)'].idxmin(), 'Commodity']
-            alerts.append({
-                'type': 'danger',
-                'title': 'NEGATIVE GROWTH ALERT',
-                'message': f'{worst_commodity} shows {min_growth:.1f}% decline. Consider diversification away from this commodity.'
-            })
-    
-    # High correlation alert
-    if not corr_data.empty:
-        # Find pairs with very high correlation (>0.9)
-        high_corr_pairs = []
-        for i in range(len(corr_data.columns)):
-            for j in range(i+1, len(corr_data.columns)):
-                corr_val = corr_data.iloc[i, j]
-                if abs(corr_val) > 0.9:
-                    high_corr_pairs.append((corr_data.columns[i], corr_data.columns[j], corr_val))
-        
-        if high_corr_pairs:
-            pair_info = high_corr_pairs[0]  # Show first high correlation pair
-            alerts.append({
-                'type': 'warning',
-                'title': 'HIGH CORRELATION RISK',
-                'message': f'{pair_info[0]} and {pair_info[1]} are {pair_info[2]:.2f} correlated. Consider diversification to reduce portfolio risk.'
-            })
-    
-    return alerts
-
 # Load Data
 with st.spinner("Loading agriculture intelligence data..."):
     data = load_cached_agriculture_data()
@@ -388,11 +344,22 @@ st.markdown("""
 
 # Create combined analysis dataframe for filtering
 combined_analysis = pd.DataFrame()
+combined_key = None
 if not ready_data.empty:
     combined_analysis = ready_data.copy()
+    combined_key = "ready"
 elif not trend_data.empty:
     # If ready_data is empty, use trend_data as base
     combined_analysis = trend_data.copy()
+    combined_key = "trend"
+
+# Sidebar filters run on the shared, date-indexed frames and are memoized per selection
+filters = SectorFilter("agriculture")
+start_date = end_date = None
+
+def filtered_combined_analysis(**selections):
+    df = filters.apply(combined_key, start_date, end_date, **selections)
+    return format_dates_for_display(df) if combined_key == "trend" else df
 
 # Store original data for filtering
 original_trend_data = trend_data.copy()
@@ -406,8 +373,7 @@ st.sidebar.markdown("## 🎛️ Dashboard Controls")
 # Date range filter
 if not combined_analysis.empty and 'date' in combined_analysis.columns:
     try:
-        min_date = pd.to_datetime(combined_analysis['date']).min()
-        max_date = pd.to_datetime(combined_analysis['date']).max()
+        min_date, max_date = filters.date_bounds(combined_key)
         
         st.sidebar.markdown("### 📅 Date Range")
         date_range = st.sidebar.date_input(
@@ -420,31 +386,22 @@ if not combined_analysis.empty and 'date' in combined_analysis.columns:
         if len(date_range) == 2:
             start_date, end_date = date_range
             # Apply date filter to all relevant datasets
-            combined_analysis = combined_analysis[
-                (pd.to_datetime(combined_analysis['date']).dt.date >= start_date) &
-                (pd.to_datetime(combined_analysis['date']).dt.date <= end_date)
-            ]
+            combined_analysis = filtered_combined_analysis()
             
             # Filter trend data
             if not trend_data.empty and 'date' in trend_data.columns:
-                trend_data = trend_data[
-                    (pd.to_datetime(trend_data['date']).dt.date >= start_date) &
-                    (pd.to_datetime(trend_data['date']).dt.date <= end_date)
-                ]
+                trend_data = format_dates_for_display(filters.apply("trend", start_date, end_date))
             
             # Filter YoY data
             if not yoy_data.empty and 'date' in yoy_data.columns:
-                yoy_data = yoy_data[
-                    (pd.to_datetime(yoy_data['date']).dt.date >= start_date) &
-                    (pd.to_datetime(yoy_data['date']).dt.date <= end_date)
-                ]
+                yoy_data = format_dates_for_display(filters.apply("yoy", start_date, end_date))
     except Exception as e:
         st.sidebar.warning(f"Date filtering error: {str(e)}")
 
 # Commodity filter
 if not combined_analysis.empty and 'commodity' in combined_analysis.columns:
     st.sidebar.markdown("### 🌾 Commodity Filter")
-    all_commodities = list(combined_analysis['commodity'].unique())
+    all_commodities = filters.options(combined_key, "commodity", start_date, end_date)
     select_all_label = "Select All"
     multiselect_options = [select_all_label] + all_commodities
 
@@ -467,15 +424,15 @@ if not combined_analysis.empty and 'commodity' in combined_analysis.columns:
 
     if selected_commodities:
         # Apply commodity filter to all relevant datasets
-        combined_analysis = combined_analysis[combined_analysis['commodity'].isin(selected_commodities)]
+        combined_analysis = filtered_combined_analysis(commodity=selected_commodities)
         
         # Filter YoY data by commodity
         if not yoy_data.empty and 'commodity' in yoy_data.columns:
-            yoy_data = yoy_data[yoy_data['commodity'].isin(selected_commodities)]
+            yoy_data = format_dates_for_display(filters.apply("yoy", start_date, end_date, commodity=selected_commodities))
         
         # Filter growth data by commodity
         if not growth_data.empty and 'Commodity' in growth_data.columns:
-            growth_data = growth_data[growth_data['Commodity'].isin(selected_commodities)]
+            growth_data = filters.apply("growth", Commodity=selected_commodities)
         
         # Filter correlation data (keep only selected commodities and their correlations)
         if not corr_data.empty:
@@ -628,7 +585,11 @@ with col5:
 
 # Data-Driven Alerts
 performance_tiers = analyze_performance_tiers(growth_data)
-alerts = generate_alerts(growth_data, corr_data)
+# Anomaly and regime-shift alerts detected by the EDA run across every agriculture series
+alerts = [
+    {**alert, 'type': 'danger' if alert['severity'] == 'high' else 'warning'}
+    for alert in load_alerts("agriculture")
+]
 
 if alerts or performance_tiers:
     st.markdown('<div class="section-header"><h2>🚨 Agriculture Sector Signals</h2></div>', unsafe_allow_html=True)
@@ -662,6 +623,13 @@ if alerts or performance_tiers:
                                 <p style="margin: 0; color: #4a5568; font-size: 12px; line-height: 1.4;">{alert['message']}</p>
                             </div>
                             """, unsafe_allow_html=True)
+
+        # Recent history of a flagged series, read from the memory-mapped series store
+        flagged = {alert['name']: alert for alert in alerts}
+        history_choice = st.selectbox("Show history of:", list(flagged), key="agriculture_alert_history")
+        history = load_series_history(flagged[history_choice]['series'])
+        if not history.empty:
+            st.plotly_chart(alert_history_chart(history, flagged[history_choice]), use_container_width=True)
     
     # Show performance tiers
     if performance_tiers:
@@ -1009,23 +977,14 @@ if not ready_data.empty:
     # Format data
     ready_data_display = format_dates_for_display(ready_data)
 
-    # Export CSV
-    csv = ready_data_display.to_csv(index=False)
-    st.download_button(
-        label="📥 Export Data",
-        data=csv,
-        file_name=f"agriculture_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-        mime="text/csv",
-        type="primary"
-    )
+    # Export (serialized only once requested)
+    export_buttons(ready_data_display, "agriculture", "ready_data_display", "agriculture_data", key="export_agriculture_data")
 
     # Search
     search_term = st.text_input("🔍 Search data:", placeholder="Enter commodity name...")
 
     if search_term:
-        filtered_data = ready_data_display[
-            ready_data_display.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-        ]
+        filtered_data = search_rows("agriculture", "ready", ready_data_display, search_term)
     else:
         filtered_data = ready_data_display
 
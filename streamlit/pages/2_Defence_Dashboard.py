@@ -11,7 +11,11 @@ warnings.filterwarnings('ignore')
 
 # Add the parent directory to Python path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from utils.data_loader import load_defence_data
+from utils.data_loader import load_defence_data, load_alerts, load_series_history
+from utils.charts import alert_history_chart
+from utils.filter_engine import SectorFilter
+from utils.search_index import search_rows
+from utils.exports import export_buttons
 
 # Page Config
 st.set_page_config(
@@ -86,6 +90,13 @@ st.markdown("""
         padding: 1rem;
         margin: 1rem 0;
     }
+    .warning-box {
+        background: #fffbeb;
+        border: 1px solid #f6e05e;
+        border-radius: 8px;
+        padding: 1rem;
+        margin: 1rem 0;
+    }
     .success-box {
         background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
         border: 1px solid #28a745;
@@ -116,7 +127,7 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Cache data loading for better performance
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+# Shared process-wide store (utils.data_loader); no per-session copy
 def load_cached_defence_data():
     """Load and cache defence data with error handling"""
     try:
@@ -354,17 +365,24 @@ emergency_contracts = data.get("emergency", pd.DataFrame())
 frequent_items = data.get("frequent", pd.DataFrame())
 combined_analysis = data.get("combined", pd.DataFrame())
 word_frequency = data.get("word_freq", pd.DataFrame())
+term_index = data.get("term_index")
+rollup_cube = data.get("rollup_cube")
 comprehensive_insights = data.get("insights", {})
 gemini_insight = data.get("gemini_insight", "No AI insights found.")
 sipri_insight = data.get("sipri_insight", "No SIPRI insights found.")
 
+# Sidebar filters run on the shared, date-indexed frames and are memoized per selection
+filters = SectorFilter("defence")
+start_date = end_date = None
+full_date_range = True
+selected_category = "All"
+
 # Sidebar for filters and controls
 st.sidebar.markdown("## 🎛️ Dashboard Controls")
 
 # Date range filter
 if not combined_analysis.empty:
-    min_date = combined_analysis['date'].min()
-    max_date = combined_analysis['date'].max()
+    min_date, max_date = filters.date_bounds("combined")
     
     st.sidebar.markdown("### 📅 Date Range")
     date_range = st.sidebar.date_input(
@@ -376,10 +394,8 @@ if not combined_analysis.empty:
     
     if len(date_range) == 2:
         start_date, end_date = date_range
-        combined_analysis = combined_analysis[
-            (combined_analysis['date'].dt.date >= start_date) &
-            (combined_analysis['date'].dt.date <= end_date)
-        ]
+        full_date_range = (start_date, end_date) == (min_date.date(), max_date.date())
+        combined_analysis = filters.apply("combined", start_date, end_date)
 
 # Value threshold filter
 st.sidebar.markdown("### 💰 Value Threshold")
@@ -401,7 +417,9 @@ if not combined_analysis.empty and 'category' in combined_analysis.columns:
     selected_category = st.sidebar.selectbox("Select category:", all_categories)
     
     if selected_category != "All":
-        combined_analysis = combined_analysis[combined_analysis['category'] == selected_category]
+        combined_analysis = filters.apply("combined", start_date, end_date, category=[selected_category])
+        if min_value > 0:
+            combined_analysis = combined_analysis[combined_analysis['value'] >= min_value]
 
 
 # Create sections dictionary after data is loaded
@@ -511,32 +529,6 @@ else:
     </div>
     """, unsafe_allow_html=True)
 
-# Add after metrics calculation
-def generate_alerts(data):
-    alerts = []
-    
-    # Emergency contract threshold
-    emergency_pct = (len(emergency_contracts) / len(combined_analysis) * 100) if not combined_analysis.empty else 0
-    if emergency_pct > 15:
-        alerts.append({
-            "type": "warning",
-            "title": "High Emergency Procurement Rate",
-            "message": f"{emergency_pct:.1f}% of contracts are emergency procurements. This may indicate planning issues.",
-            "action": "Review procurement planning processes and identify systemic causes."
-        })
-    
-    # Concentration risk
-    top_10_pct = combined_analysis.nlargest(10, 'value')['value'].sum() / combined_analysis['value'].sum() * 100
-    if top_10_pct > 70:
-        alerts.append({
-            "type": "info",
-            "title": "High Value Concentration",
-            "message": f"Top 10 contracts represent {top_10_pct:.1f}% of total value.",
-            "action": "Monitor these high-value contracts closely for performance and compliance."
-        })
-    
-    return alerts
-
 # Key Performance Metrics
 st.markdown('<div class="section-header"><h2>📊 Key Indicators</h2></div>', unsafe_allow_html=True)
 
@@ -638,20 +630,27 @@ else:
     </div>
     """, unsafe_allow_html=True)
 
-# Display alerts
-alerts = generate_alerts(combined_analysis)
+# Display anomaly alerts detected by the EDA run (monthly procurement totals and counts)
+alerts = load_alerts("defence")
 if alerts:
     st.markdown('<div class="section-header"><h2>🚨 Defence Sector Signals</h2></div>', unsafe_allow_html=True)
     for alert in alerts:
-        alert_class = "alert-box" if alert["type"] == "warning" else "success-box"
+        alert_class, alert_emoji = ("alert-box", "🔴") if alert["severity"] == "high" else ("warning-box", "⚠️")
         st.markdown(f"""
         <div class="{alert_class}">
-            <h4>{alert["title"]}</h4>
+            <h4>{alert_emoji} {alert["title"]}</h4>
             <p><strong>Finding:</strong> {alert["message"]}</p>
-            <p><strong>Recommended Action:</strong> {alert["action"]}</p>
+            <p><strong>Detected By:</strong> {alert["basis"]}</p>
         </div>
         """, unsafe_allow_html=True)
 
+    # Recent history of a flagged series, read from the memory-mapped series store
+    flagged = {alert["name"]: alert for alert in alerts}
+    history_choice = st.selectbox("Show history of:", list(flagged), key="defence_alert_history")
+    history = load_series_history(flagged[history_choice]["series"])
+    if not history.empty:
+        st.plotly_chart(alert_history_chart(history, flagged[history_choice]), use_container_width=True)
+
 def create_contextual_metric_card(title, value, subtitle="", context="", color="#007bff"):
     """Create a metric card with business context"""
     return f"""
@@ -834,21 +833,26 @@ if not combined_analysis.empty:
         index=0
     )
     
-    # Prepare time series data
-    if time_granularity == "Monthly":
-        combined_analysis['time_period'] = combined_analysis['date'].dt.to_period('M')
-    elif time_granularity == "Quarterly":
-        combined_analysis['time_period'] = combined_analysis['date'].dt.to_period('Q')
-    else:  # Yearly
-        combined_analysis['time_period'] = combined_analysis['date'].dt.to_period('Y')
-    
-    time_series = combined_analysis.groupby('time_period').agg({
-        'value': ['sum', 'count', 'mean'],
-        'date': 'min'
-    }).reset_index()
-    
-    time_series.columns = ['period', 'total_value', 'contract_count', 'avg_value', 'period_start']
-    time_series['period_str'] = time_series['period'].astype(str)
+    grain, freq = {"Monthly": ("month", "M"), "Quarterly": ("quarter", "Q"), "Yearly": ("year", "Y")}[time_granularity]
+
+    # Unfiltered views read the pre-aggregated cube; custom date ranges and thresholds aggregate the rows
+    if rollup_cube is not None and full_date_range and min_value == 0:
+        rows = rollup_cube.select(grain, "All contracts" if selected_category == "All" else selected_category)
+        time_series = pd.DataFrame({
+            'period_str': rows['period'].dt.to_period(freq).astype(str),
+            'total_value': rows['sum'],
+            'contract_count': rows['count'],
+            'avg_value': rows['mean']
+        })
+    else:
+        combined_analysis['time_period'] = combined_analysis['date'].dt.to_period(freq)
+        time_series = combined_analysis.groupby('time_period').agg({
+            'value': ['sum', 'count', 'mean'],
+            'date': 'min'
+        }).reset_index()
+
+        time_series.columns = ['period', 'total_value', 'contract_count', 'avg_value', 'period_start']
+        time_series['period_str'] = time_series['period'].astype(str)
     
     col1, col2 = st.columns(2)
     
@@ -981,6 +985,13 @@ else:
 # Word Frequency Analysis
 st.markdown('<div class="section-header"><h2>🔍 Procurement Terms Analysis</h2></div>', unsafe_allow_html=True)
 
+# Terms are counted over medium-value and larger contracts (≥ 500M KRW), as in the EDA
+TERM_MIN_VALUE = 500000000
+
+# Query the persistent term index; the saved top-10 table is the fallback before it is built
+if term_index is not None and len(term_index.terms):
+    word_frequency = term_index.top_terms(10, min_value=TERM_MIN_VALUE).rename(columns={"label": "word"})
+
 if not word_frequency.empty:
     col1, col2 = st.columns([2, 1])
     
@@ -1013,6 +1024,52 @@ if not word_frequency.empty:
         st.metric("Total Term Occurrences", f"{total_terms:,}")
         st.metric("Unique Terms", f"{unique_terms:,}")
         st.metric("Average Frequency", f"{avg_frequency:.1f}")
+
+    if term_index is not None and len(term_index.terms):
+        col1, col2 = st.columns([2, 1])
+
+        with col1:
+            # Monthly frequency of the selected terms, straight from the index postings
+            term_labels = dict(zip(word_frequency["word"], word_frequency["term"]))
+            selected_terms = st.multiselect(
+                "📈 Terms over time:",
+                options=list(term_labels),
+                default=list(term_labels)[:3],
+                key="defence_term_trend"
+            )
+            if selected_terms:
+                term_trend = term_index.term_frequency([term_labels[t] for t in selected_terms], min_value=TERM_MIN_VALUE)
+                term_trend["term"] = term_trend["term"].map({v: k for k, v in term_labels.items()})
+                fig_term_trend = px.bar(
+                    term_trend,
+                    x="date",
+                    y="frequency",
+                    color="term",
+                    title="Monthly Mentions in Contracts (≥ 500M KRW)",
+                    labels={"frequency": "Mentions", "date": "Month", "term": "Term"},
+                    template="plotly_white"
+                )
+                fig_term_trend = apply_chart_styling(fig_term_trend)
+                st.plotly_chart(fig_term_trend, use_container_width=True)
+
+        with col2:
+            st.subheader("🔎 Contracts Containing a Term")
+            lookup_term = st.text_input("Term:", value=word_frequency["term"].iloc[0], key="defence_term_lookup").strip()
+            if lookup_term:
+                # Same value threshold as the top-terms table and trend beside it
+                containing = term_index.contracts_containing(lookup_term, min_value=TERM_MIN_VALUE)
+                st.metric("Contracts (≥ 500M KRW)", f"{len(containing):,}")
+                st.dataframe(
+                    containing.head(50),
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config={
+                        "date": st.column_config.DateColumn("Date"),
+                        "name": st.column_config.TextColumn("Contract"),
+                        "value": st.column_config.NumberColumn("Value (KRW)", format="%.0f"),
+                        "rows": st.column_config.NumberColumn("Bids")
+                    }
+                )
 else:
     st.info("No word frequency data available.")
 
@@ -1048,14 +1105,7 @@ if not combined_analysis.empty:
         # Export functionality in top right corner
         col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
         with col4:
-            csv = combined_analysis.to_csv(index=False)
-            st.download_button(
-                label="📥 Export Data",
-                data=csv,
-                file_name=f"defence_contracts_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv",
-                type="primary"
-            )
+            export_buttons(combined_analysis, "defence", "combined_analysis", "defence_contracts", key="export_defence_contracts")
         # Advanced filtering options
         st.subheader("🔍 Advanced Filters")
         
@@ -1103,9 +1153,7 @@ if not combined_analysis.empty:
         search_term = st.text_input("🔍 Search in contract descriptions:", placeholder="Enter keywords...")
         
         if search_term:
-            filtered_data = filtered_data[
-                filtered_data.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-            ]
+            filtered_data = search_rows("defence", "combined", filtered_data, search_term)
         
         # Display filtered data
         st.subheader(f"📊 Filtered Results ({len(filtered_data):,} contracts)")
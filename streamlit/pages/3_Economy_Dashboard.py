@@ -11,7 +11,11 @@ warnings.filterwarnings('ignore')
 
 # Add the parent directory to Python path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from utils.data_loader import load_economy_data
+from utils.data_loader import load_economy_data, load_alerts, load_series_history
+from utils.filter_engine import SectorFilter
+from utils.charts import line_chart, cached_figure, alert_history_chart
+from utils.search_index import search_rows
+from utils.exports import export_buttons
 
 # Page Config
 st.set_page_config(
@@ -116,7 +120,7 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Cache data loading for better performance
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+# Shared process-wide store (utils.data_loader); no per-session copy
 def load_cached_economy_data():
     """Load and cache economy data with error handling"""
     try:
@@ -248,6 +252,8 @@ fx_raw = format_dates_for_display(data.get("fx_raw", pd.DataFrame()))
 economic_indicators_raw = format_dates_for_display(data.get("economic_indicators_raw", pd.DataFrame()))
 key_indicators_processed = format_dates_for_display(data.get("key_indicators_processed", pd.DataFrame()))
 cross_correlations = data.get("cross_correlations", pd.DataFrame())
+lead_lag_table = data.get("lead_lag_table", pd.DataFrame())
+fx_volatility_table = data.get("fx_volatility_table", pd.DataFrame())
 key_insights = data.get("insights", {})
 gemini_insight = data.get("gemini_insight", "No AI insights found.")
 
@@ -263,6 +269,12 @@ combined_analysis = pd.DataFrame()
 if not economic_indicators_raw.empty:
     combined_analysis = economic_indicators_raw.copy()
 
+# Sidebar filters run on the shared, date-indexed frames and are memoized per selection
+filters = SectorFilter("economy")
+start_date = end_date = None
+selected_indicators = None
+selected_currency_pairs = None
+
 # Store original data for filtering
 original_fx_raw = fx_raw.copy()
 original_economic_indicators_raw = economic_indicators_raw.copy()
@@ -274,8 +286,7 @@ st.sidebar.markdown("## 🎛️ Dashboard Controls")
 # Date range filter
 if not combined_analysis.empty and 'date' in combined_analysis.columns:
     try:
-        min_date = pd.to_datetime(combined_analysis['date']).min()
-        max_date = pd.to_datetime(combined_analysis['date']).max()
+        min_date, max_date = filters.date_bounds("economic_indicators_raw")
         
         st.sidebar.markdown("### 📅 Date Range")
         date_range = st.sidebar.date_input(
@@ -288,45 +299,30 @@ if not combined_analysis.empty and 'date' in combined_analysis.columns:
         if len(date_range) == 2:
             start_date, end_date = date_range
             # Apply date filter to all relevant datasets except sentiment
-            combined_analysis = combined_analysis[
-                (pd.to_datetime(combined_analysis['date']).dt.date >= start_date) &
-                (pd.to_datetime(combined_analysis['date']).dt.date <= end_date)
-            ]
+            combined_analysis = format_dates_for_display(filters.apply("economic_indicators_raw", start_date, end_date))
             
             # Filter FX data
             if not fx_raw.empty and 'date' in fx_raw.columns:
-                fx_raw = fx_raw[
-                    (pd.to_datetime(fx_raw['date']).dt.date >= start_date) &
-                    (pd.to_datetime(fx_raw['date']).dt.date <= end_date)
-                ]
+                fx_raw = format_dates_for_display(filters.apply("fx_raw", start_date, end_date))
             
             # Filter economic indicators
             if not economic_indicators_raw.empty and 'date' in economic_indicators_raw.columns:
-                economic_indicators_raw = economic_indicators_raw[
-                    (pd.to_datetime(economic_indicators_raw['date']).dt.date >= start_date) &
-                    (pd.to_datetime(economic_indicators_raw['date']).dt.date <= end_date)
-                ]
+                economic_indicators_raw = combined_analysis
             
             # Filter sentiment data
             if not sentiment_raw.empty and 'date' in sentiment_raw.columns:
-                sentiment_raw = sentiment_raw[
-                    (pd.to_datetime(sentiment_raw['date']).dt.date >= start_date) &
-                    (pd.to_datetime(sentiment_raw['date']).dt.date <= end_date)
-                ]
+                sentiment_raw = format_dates_for_display(filters.apply("sentiment_raw", start_date, end_date))
             
             # Filter processed sentiment data
             if not sentiment_processed.empty and 'date' in sentiment_processed.columns:
-                sentiment_processed = sentiment_processed[
-                    (pd.to_datetime(sentiment_processed['date']).dt.date >= start_date) &
-                    (pd.to_datetime(sentiment_processed['date']).dt.date <= end_date)
-                ]
+                sentiment_processed = format_dates_for_display(filters.apply("sentiment_processed", start_date, end_date))
     except Exception as e:
         st.sidebar.warning(f"Date filtering error: {str(e)}")
 
 # Indicator filter (only for economic indicators, not sentiment)
 if not combined_analysis.empty and 'indicator' in combined_analysis.columns:
     st.sidebar.markdown("### 📊 Economic Indicator Filter")
-    all_indicators = list(combined_analysis['indicator'].unique())
+    all_indicators = filters.options("economic_indicators_raw", "indicator", start_date, end_date)
     select_all_label = "Select All"
     multiselect_options = [select_all_label] + all_indicators
 
@@ -347,16 +343,17 @@ if not combined_analysis.empty and 'indicator' in combined_analysis.columns:
 
     if selected_indicators:
         # Apply indicator filter to economic indicators only
-        combined_analysis = combined_analysis[combined_analysis['indicator'].isin(selected_indicators)]
+        combined_analysis = format_dates_for_display(
+            filters.apply("economic_indicators_raw", start_date, end_date, indicator=selected_indicators))
         
         # Filter economic indicators
         if not economic_indicators_raw.empty and 'indicator' in economic_indicators_raw.columns:
-            economic_indicators_raw = economic_indicators_raw[economic_indicators_raw['indicator'].isin(selected_indicators)]
+            economic_indicators_raw = combined_analysis
 
 # Currency pair filter for FX data
 if not fx_raw.empty and 'pair' in fx_raw.columns:
     st.sidebar.markdown("### 💱 Currency Pair Filter")
-    all_pairs = list(fx_raw['pair'].unique())
+    all_pairs = filters.options("fx_raw", "pair", start_date, end_date)
     select_all_pairs_label = "Select All Pairs"
     pair_options = [select_all_pairs_label] + all_pairs
 
@@ -373,7 +370,7 @@ if not fx_raw.empty and 'pair' in fx_raw.columns:
         selected_currency_pairs = [p for p in selected_pairs if p in all_pairs]
 
     if selected_currency_pairs:
-        fx_raw = fx_raw[fx_raw['pair'].isin(selected_currency_pairs)]
+        fx_raw = format_dates_for_display(filters.apply("fx_raw", start_date, end_date, pair=selected_currency_pairs))
 
 # Filter status indicator
 st.sidebar.markdown("### 📊 Filter Status")
@@ -594,149 +591,52 @@ with col5:
         "#17a2b8"
     ), unsafe_allow_html=True)
 
-def detect_economic_signals(economic_data, fx_data, sentiment_data):
-    """Detect important economic signals from the data"""
-    signals = []
-    
-    # Economic Indicators Analysis
-    if not economic_data.empty and 'indicator' in economic_data.columns:
-        # Pivot data for analysis
-        pivot_data = economic_data.pivot(index='date', columns='indicator', values='value')
-        
-        if not pivot_data.empty:
-            # Leading-Coincident divergence
-            if 'Leading Index' in pivot_data.columns and 'Coincident Index' in pivot_data.columns:
-                latest_leading = pivot_data['Leading Index'].dropna().iloc[-1]
-                latest_coincident = pivot_data['Coincident Index'].dropna().iloc[-1] 
-                spread = latest_leading - latest_coincident
-                
-                if spread > 2:
-                    signals.append({
-                        "type": "bullish",
-                        "signal": "Strong Economic Expansion Signal",
-                        "description": f"Leading Index is {spread:.1f} points above Coincident Index",
-                        "implication": "Economy likely to accelerate in next 3-6 months",
-                        "confidence": "High"
-                    })
-                elif spread < -2:
-                    signals.append({
-                        "type": "bearish", 
-                        "signal": "Economic Slowdown Warning",
-                        "description": f"Leading Index is {abs(spread):.1f} points below Coincident Index",
-                        "implication": "Potential economic deceleration ahead",
-                        "confidence": "High"
-                    })
-            
-            # KOSPI momentum
-            if 'KOSPI' in pivot_data.columns:
-                kospi_data = pivot_data['KOSPI'].dropna()
-                if len(kospi_data) >= 5:
-                    recent_change = (kospi_data.iloc[-1] / kospi_data.iloc[-5] - 1) * 100
-                    if recent_change > 10:
-                        signals.append({
-                            "type": "bullish",
-                            "signal": "Strong Market Momentum", 
-                            "description": f"KOSPI up {recent_change:.1f}% in recent period",
-                            "implication": "High investor confidence, consider taking profits",
-                            "confidence": "Medium"
-                        })
-                    elif recent_change < -10:
-                        signals.append({
-                            "type": "bearish",
-                            "signal": "Market Correction Underway",
-                            "description": f"KOSPI down {abs(recent_change):.1f}% in recent period", 
-                            "implication": "Potential buying opportunity emerging",
-                            "confidence": "Medium"
-                        })
-    
-    # FX Rate Analysis
-    if not fx_data.empty and 'pair' in fx_data.columns and 'exchange_rate' in fx_data.columns:
-        # USD/KRW analysis
-        usd_krw_data = fx_data[fx_data['pair'] == 'USD/KRW']
-        if not usd_krw_data.empty:
-            latest_rate = usd_krw_data['exchange_rate'].iloc[-1]
-            if len(usd_krw_data) >= 5:
-                recent_change = (latest_rate / usd_krw_data['exchange_rate'].iloc[-5] - 1) * 100
-                
-                if recent_change > 5:  # Strong KRW depreciation
-                    signals.append({
-                        "type": "bearish",
-                        "signal": "KRW Depreciation Pressure",
-                        "description": f"USD/KRW up {recent_change:.1f}% in recent period",
-                        "implication": "Import costs rising, potential inflation pressure",
-                        "confidence": "Medium"
-                    })
-                elif recent_change < -5:  # Strong KRW appreciation
-                    signals.append({
-                        "type": "bullish",
-                        "signal": "KRW Appreciation Trend",
-                        "description": f"USD/KRW down {abs(recent_change):.1f}% in recent period",
-                        "implication": "Lower import costs, improved purchasing power",
-                        "confidence": "Medium"
-                    })
-    
-    # Sentiment Analysis
-    if not sentiment_data.empty and 'indicator' in sentiment_data.columns:
-        # Get latest sentiment values
-        latest_sentiment = sentiment_data.groupby('indicator')['value'].last()
-        
-        if not latest_sentiment.empty:
-            avg_sentiment = latest_sentiment.mean()
-            
-            if avg_sentiment > 60:  # High sentiment
-                signals.append({
-                    "type": "bullish",
-                    "signal": "High Economic Sentiment",
-                    "description": f"Average sentiment index at {avg_sentiment:.1f}",
-                    "implication": "Strong consumer and business confidence",
-                    "confidence": "Medium"
-                })
-            elif avg_sentiment < 40:  # Low sentiment
-                signals.append({
-                    "type": "bearish",
-                    "signal": "Low Economic Sentiment",
-                    "description": f"Average sentiment index at {avg_sentiment:.1f}",
-                    "implication": "Weak consumer and business confidence",
-                    "confidence": "Medium"
-                })
-    
-    return signals
-
 # Signal Detection
 st.markdown('<div class="section-header"><h2>🚨 Economic Sector Signals</h2></div>', unsafe_allow_html=True)
 
-# Generate and display economy-specific signals
-signals = detect_economic_signals(economic_indicators_raw, fx_raw, sentiment_raw)
+# Anomaly and regime-shift alerts detected by the EDA run across every economy indicator
+signals = load_alerts("economy")
 
 if signals:
     for signal in signals:
-        if signal["type"] == "bullish":
-            signal_color = "#28a745"
-            signal_emoji = "🟢"
-        elif signal["type"] == "bearish":
+        if signal["severity"] == "high":
             signal_color = "#dc3545"
             signal_emoji = "🔴"
-        else:  # neutral
+        else:  # medium
             signal_color = "#ffc107"
             signal_emoji = "🟡"
         
         st.markdown(f"""
         <div class="insight-card" style="border-left-color: {signal_color};">
-            <h4>{signal_emoji} {signal["signal"]}</h4>
-            <p><strong>📊 What We See:</strong> {signal["description"]}</p>
-            <p><strong>💡 What This Means:</strong> {signal["implication"]}</p>
-            <p><strong>🎯 Confidence Level:</strong> {signal["confidence"]}</p>
+            <h4>{signal_emoji} {signal["title"]}</h4>
+            <p><strong>📊 What We See:</strong> {signal["message"]}</p>
+            <p><strong>🔍 How It Was Found:</strong> {signal["basis"]}</p>
+            <p><strong>🎯 Severity:</strong> {signal["severity"].title()}</p>
         </div>
         """, unsafe_allow_html=True)
+
+    # Recent history of a flagged series, read from the memory-mapped series store
+    flagged = {signal["name"]: signal for signal in signals}
+    history_choice = st.selectbox("Show history of:", list(flagged), key="economy_alert_history")
+    history = load_series_history(flagged[history_choice]["series"])
+    if not history.empty:
+        st.plotly_chart(alert_history_chart(history, flagged[history_choice]), use_container_width=True)
 else:
     st.info("No significant economic market signals detected at this time.")
 
 # Economic Indicators Trends
 st.markdown('<div class="section-header"><h2>📈 Economic Indicators Trends</h2></div>', unsafe_allow_html=True)
 
+# Date x indicator view written by the EDA serving layer, narrowed to the sidebar filters
+indicator_pivot = format_dates_for_display(filters.apply("economic_indicators_wide", start_date, end_date))
+if not indicator_pivot.empty:
+    indicator_pivot = indicator_pivot.set_index('date')
+    if selected_indicators:
+        indicator_pivot = indicator_pivot[[col for col in indicator_pivot.columns if col in selected_indicators]]
+    indicator_pivot = indicator_pivot.dropna(how='all').dropna(axis=1, how='all')
+
 if not economic_indicators_raw.empty and 'indicator' in economic_indicators_raw.columns:
-    # Pivot data for plotting
-    pivot_data = economic_indicators_raw.pivot(index='date', columns='indicator', values='value')
+    pivot_data = indicator_pivot
     
     if not pivot_data.empty:
         # Add "All Indicators" option
@@ -921,23 +821,25 @@ else:
 st.markdown('<div class="section-header"><h2>💱 Foreign Exchange Analysis</h2></div>', unsafe_allow_html=True)
 
 if not fx_raw.empty and 'pair' in fx_raw.columns:
-    # Normalize FX rates for better comparison
-    fx_norm = fx_raw.copy()
-    fx_norm['normalized'] = fx_norm.groupby('pair')['exchange_rate'].transform(lambda x: x / x.iloc[0])
-    
-    # FX rates over time (normalized)
-    fig_fx = px.line(
-        fx_norm,
-        x="date",
-        y="normalized",
-        color="pair",
-        title="Normalized Foreign Exchange Rates (Relative to First Value)",
-        labels={"normalized": "Normalized Exchange Rate", "date": "Date"},
-        color_discrete_sequence=px.colors.qualitative.Pastel,
-        template="plotly_white"
-    )
+    def build_fx_chart():
+        # Normalize FX rates for better comparison
+        fx_norm = fx_raw.copy()
+        fx_norm['normalized'] = fx_norm.groupby('pair')['exchange_rate'].transform(lambda x: x / x.iloc[0])
+        
+        # FX rates over time (normalized), downsampled for the browser
+        fig_fx = line_chart(
+            fx_norm,
+            x="date",
+            y="normalized",
+            color="pair",
+            title="Normalized Foreign Exchange Rates (Relative to First Value)",
+            labels={"normalized": "Normalized Exchange Rate", "date": "Date"},
+            color_discrete_sequence=px.colors.qualitative.Pastel,
+            template="plotly_white"
+        )
+        return apply_chart_styling(fig_fx)
     
-    fig_fx = apply_chart_styling(fig_fx)
+    fig_fx = cached_figure("economy", "fx_normalized", (start_date, end_date, selected_currency_pairs), build_fx_chart)
     st.plotly_chart(fig_fx, use_container_width=True)
     
     # FX statistics
@@ -956,26 +858,13 @@ if not fx_raw.empty and 'pair' in fx_raw.columns:
         })
         st.dataframe(latest_fx_df, use_container_width=True)
         
-        # FX Volatility Analysis from insights
-        if key_insights and "fx_analysis" in key_insights:
-            fx_analysis = key_insights["fx_analysis"]
-            volatility_data = fx_analysis.get("volatility_data", [])
+        # FX Volatility Analysis: 3M vs 12M per pair, pivoted by the EDA serving layer
+        if not fx_volatility_table.empty:
+            st.subheader("📊 FX Volatility Analysis")
+            st.dataframe(fx_volatility_table, use_container_width=True)
             
-            if volatility_data:
-                st.subheader("📊 FX Volatility Analysis")
-                volatility_df = pd.DataFrame(volatility_data)
-                
-                # Display 3M and 12M volatility comparison
-                if not volatility_df.empty:
-                    # Pivot to show 3M vs 12M volatility
-                    volatility_pivot = volatility_df.pivot(index='pair', columns='indicator', values='value')
-                    volatility_pivot = volatility_pivot.round(3)
-                    volatility_pivot.columns = [col.replace(' Volatility (3M)', ' (3M)').replace(' Volatility (12M)', ' (12M)') for col in volatility_pivot.columns]
-                    
-                    st.dataframe(volatility_pivot, use_container_width=True)
-                    
-                    # Volatility insights
-                    st.info("💡 **Volatility Insights**: Higher 3M volatility compared to 12M suggests recent increase in currency market uncertainty.")
+            # Volatility insights
+            st.info("💡 **Volatility Insights**: Higher 3M volatility compared to 12M suggests recent increase in currency market uncertainty.")
 else:
     st.markdown("""
     <div class="alert-box">
@@ -1120,6 +1009,53 @@ else:
     </div>
     """, unsafe_allow_html=True)
 
+# Lead-Lag Analysis (precomputed by the EDA over every sector's indicators)
+st.markdown('<div class="section-header"><h2>⏱️ Lead–Lag Relationships Across Sectors</h2></div>', unsafe_allow_html=True)
+
+if not lead_lag_table.empty:
+    lead_lag_summary = key_insights.get("lead_lag", {})
+    significant_lead_lag = lead_lag_table[lead_lag_table['significance'] == 'Significant']
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Indicators Compared", f"{lead_lag_summary.get('series_tested', 0):,}")
+    with col2:
+        st.metric("Pairs Tested", f"{len(lead_lag_table):,}")
+    with col3:
+        st.metric("Significant Pairs", f"{len(significant_lead_lag):,}")
+
+    top_pairs = (significant_lead_lag if not significant_lead_lag.empty else lead_lag_table).head(15).copy()
+    top_pairs['pair'] = top_pairs['leader'] + ' → ' + top_pairs['follower'] + \
+        ' (' + top_pairs['lead_months'].astype(str) + 'M)'
+    fig_lead_lag = px.bar(
+        top_pairs.iloc[::-1],
+        x='correlation',
+        y='pair',
+        orientation='h',
+        color='lead_months',
+        color_continuous_scale='Viridis',
+        title="Strongest Lead–Lag Relationships (monthly changes, lags −12 to +12 months)",
+        template="plotly_white",
+        hover_data=['same_month_correlation', 'data_points', 'q_value']
+    )
+    fig_lead_lag = apply_chart_styling(fig_lead_lag)
+    fig_lead_lag.update_layout(height=600, yaxis_title="", xaxis_title="Correlation at best lag",
+                               coloraxis_colorbar_title="Lead (months)")
+    st.plotly_chart(fig_lead_lag, use_container_width=True)
+
+    st.info("💡 **Reading the table**: the leader's monthly change correlates with the follower's change "
+            "`lead_months` later. Significance is controlled for testing every lag and every pair (q-value < 0.05).")
+
+    st.subheader("📋 Ranked Lead–Lag Table")
+    st.dataframe(lead_lag_table.head(200), use_container_width=True, hide_index=True)
+else:
+    st.markdown("""
+    <div class="alert-box">
+        <h4>⚠️ No Lead–Lag Data Available</h4>
+        <p>No lead–lag analysis data is currently available.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
 # Data Explorer
 st.markdown('<div class="section-header"><h2>📄 Data Explorer</h2></div>', unsafe_allow_html=True)
 
@@ -1133,23 +1069,13 @@ if not economic_indicators_raw.empty or not fx_raw.empty or not sentiment_raw.em
                 # Export functionality
                 col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
                 with col4:
-                    csv = economic_indicators_raw.to_csv(index=False)
-                    st.download_button(
-                        label="📥 Export Data",
-                        data=csv,
-                        file_name=f"economic_indicators_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv",
-                        type="primary",
-                        key="export_economic"
-                    )
+                    export_buttons(economic_indicators_raw, "economy", "economic_indicators_raw", "economic_indicators", key="export_economic")
                 
                 # Search functionality
                 search_term = st.text_input("🔍 Search indicators:", placeholder="Enter indicator name...", key="search_economic")
                 
                 if search_term:
-                    filtered_data = economic_indicators_raw[
-                        economic_indicators_raw.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-                    ]
+                    filtered_data = search_rows("economy", "economic_indicators_raw", economic_indicators_raw, search_term)
                 else:
                     filtered_data = economic_indicators_raw
                 
@@ -1164,21 +1090,13 @@ if not economic_indicators_raw.empty or not fx_raw.empty or not sentiment_raw.em
                 col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
                 with col4:
                     if st.button("📥 Export Data", type="primary", key="export_fx"):
-                        csv = fx_raw.to_csv(index=False)
-                        st.download_button(
-                            label="Download CSV",
-                            data=csv,
-                            file_name=f"fx_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                            mime="text/csv"
-                        )
+                        export_buttons(fx_raw, "economy", "fx_raw", "fx_data", key="export_fx_data")
                 
                 # Search functionality
                 search_term = st.text_input("🔍 Search currency pairs:", placeholder="Enter currency pair...", key="search_fx")
                 
                 if search_term:
-                    filtered_data = fx_raw[
-                        fx_raw.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-                    ]
+                    filtered_data = search_rows("economy", "fx_raw", fx_raw, search_term)
                 else:
                     filtered_data = fx_raw
                 
@@ -1193,21 +1111,13 @@ if not economic_indicators_raw.empty or not fx_raw.empty or not sentiment_raw.em
                 col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
                 with col4:
                     if st.button("📥 Export Data", type="primary", key="export_sentiment"):
-                        csv = sentiment_raw.to_csv(index=False)
-                        st.download_button(
-                            label="Download CSV",
-                            data=csv,
-                            file_name=f"sentiment_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                            mime="text/csv"
-                        )
+                        export_buttons(sentiment_raw, "economy", "sentiment_raw", "sentiment_data", key="export_sentiment_data")
                 
                 # Search functionality
                 search_term = st.text_input("🔍 Search sentiment indicators:", placeholder="Enter indicator name...", key="search_sentiment")
                 
                 if search_term:
-                    filtered_data = sentiment_raw[
-                        sentiment_raw.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-                    ]
+                    filtered_data = search_rows("economy", "sentiment_raw", sentiment_raw, search_term)
                 else:
                     filtered_data = sentiment_raw
                 
@@ -10,7 +10,11 @@ warnings.filterwarnings('ignore')
 
 # Add the parent directory to Python path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from utils.data_loader import load_energy_data
+from utils.data_loader import load_energy_data, load_alerts, load_series_history
+from utils.filter_engine import SectorFilter
+from utils.charts import line_chart, cached_figure, alert_history_chart
+from utils.search_index import search_rows
+from utils.exports import export_buttons
 
 # Page Config
 st.set_page_config(
@@ -115,7 +119,7 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Cache data loading for better performance
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+# Shared process-wide store (utils.data_loader); no per-session copy
 def load_cached_energy_data():
     try:
         data = load_energy_data()
@@ -306,14 +310,18 @@ import_metric_breakdown = data.get("import_metric_breakdown", pd.DataFrame())
 key_insights = data.get("insights", {})
 gemini_insight = data.get("gemini_insight", "No AI insights found.")
 
+# Sidebar filters run on the shared, date-indexed frames and are memoized per selection
+filters = SectorFilter("energy")
+start_date = end_date = None
+selected_countries = None
+
 # Sidebar for filters and controls
 st.sidebar.markdown("## 🎛️ Dashboard Controls")
 
 # Date range filter (for IEA stocks)
 if not iea_stocks_raw.empty and 'date' in iea_stocks_raw.columns:
     try:
-        min_date = pd.to_datetime(iea_stocks_raw['date']).min()
-        max_date = pd.to_datetime(iea_stocks_raw['date']).max()
+        min_date, max_date = filters.date_bounds("iea_stocks_raw")
         st.sidebar.markdown("### 📅 Date Range")
         date_range = st.sidebar.date_input(
             "Select date range:",
@@ -323,15 +331,15 @@ if not iea_stocks_raw.empty and 'date' in iea_stocks_raw.columns:
         )
         if len(date_range) == 2:
             start_date, end_date = date_range
-            iea_stocks_raw = iea_stocks_raw[(pd.to_datetime(iea_stocks_raw['date']).dt.date >= start_date) & (pd.to_datetime(iea_stocks_raw['date']).dt.date <= end_date)]
-            stock_country_ranking = stock_country_ranking[(pd.to_datetime(stock_country_ranking['date']).dt.date >= start_date) & (pd.to_datetime(stock_country_ranking['date']).dt.date <= end_date)] if 'date' in stock_country_ranking.columns else stock_country_ranking
+            iea_stocks_raw = format_dates_for_display(filters.apply("iea_stocks_raw", start_date, end_date))
+            stock_country_ranking = filters.apply("stock_country_ranking", start_date, end_date)
     except Exception as e:
         st.sidebar.warning(f"Date filtering error: {str(e)}")
 
 # Country filter for IEA stocks
 if not iea_stocks_raw.empty and 'country' in iea_stocks_raw.columns:
     st.sidebar.markdown("### 🌍 Country Filter")
-    all_countries = list(iea_stocks_raw['country'].unique())
+    all_countries = filters.options("iea_stocks_raw", "country", start_date, end_date)
     select_all_label = "Select All"
     multiselect_options = [select_all_label] + all_countries
     selected = st.sidebar.multiselect(
@@ -345,8 +353,8 @@ if not iea_stocks_raw.empty and 'country' in iea_stocks_raw.columns:
     else:
         selected_countries = [c for c in selected if c in all_countries]
     if selected_countries:
-        iea_stocks_raw = iea_stocks_raw[iea_stocks_raw['country'].isin(selected_countries)]
-        stock_country_ranking = stock_country_ranking[stock_country_ranking['country'].isin(selected_countries)] if 'country' in stock_country_ranking.columns else stock_country_ranking
+        iea_stocks_raw = format_dates_for_display(filters.apply("iea_stocks_raw", start_date, end_date, country=selected_countries))
+        stock_country_ranking = filters.apply("stock_country_ranking", start_date, end_date, country=selected_countries)
 
 # Filter status indicator
 st.sidebar.markdown("### 📊 Filter Status")
@@ -544,102 +552,36 @@ with col6:
     ), unsafe_allow_html=True)
 
 
-def detect_energy_signals(iea_stocks_data, oil_imports_data, import_price_data):
-    """Detect important energy market signals from the data"""
-    signals = []
-    
-    # IEA Stocks Analysis
-    if not iea_stocks_data.empty and 'value' in iea_stocks_data.columns:
-        # Get latest stocks data
-        latest_stocks = iea_stocks_data.groupby('country')['value'].last()
-        if not latest_stocks.empty:
-            total_stocks = latest_stocks.sum()
-            
-            # Check for low stock levels (below 60 days of consumption)
-            if total_stocks < 3000000:  # Threshold for low stocks
-                signals.append({
-                    "type": "bearish",
-                    "signal": "Low Global Oil Stocks Warning",
-                    "description": f"Total IEA stocks at {total_stocks:,.0f} thousand bbl",
-                    "implication": "Increased price volatility and supply risk ahead",
-                    "confidence": "High"
-                })
-            elif total_stocks > 5000000:  # High stock levels
-                signals.append({
-                    "type": "bullish",
-                    "signal": "Adequate Global Oil Stocks",
-                    "description": f"Total IEA stocks at {total_stocks:,.0f} thousand bbl",
-                    "implication": "Stable supply conditions, reduced price pressure",
-                    "confidence": "Medium"
-                })
-    
-    # Oil Import Price Analysis
-    if not import_price_data.empty and 'value' in import_price_data.columns:
-        latest_prices = import_price_data.groupby('region')['value'].last()
-        if not latest_prices.empty:
-            avg_price = latest_prices.mean()
-            
-            if avg_price > 80:  # High price threshold
-                signals.append({
-                    "type": "bearish",
-                    "signal": "High Oil Import Prices",
-                    "description": f"Average import price at ${avg_price:.2f}/bbl",
-                    "implication": "Increased energy costs, potential inflation pressure",
-                    "confidence": "High"
-                })
-            elif avg_price < 50:  # Low price threshold
-                signals.append({
-                    "type": "bullish",
-                    "signal": "Favorable Oil Import Prices",
-                    "description": f"Average import price at ${avg_price:.2f}/bbl",
-                    "implication": "Lower energy costs, economic relief",
-                    "confidence": "Medium"
-                })
-    
-    # Import Volume Analysis
-    if not oil_imports_data.empty and 'value' in oil_imports_data.columns:
-        latest_imports = oil_imports_data.groupby('region')['value'].last()
-        if not latest_imports.empty:
-            total_imports = latest_imports.sum()
-            
-            # Check for significant changes in import patterns
-            if total_imports > 100000:  # High import volume
-                signals.append({
-                    "type": "neutral",
-                    "signal": "High Oil Import Volume",
-                    "description": f"Total imports at {total_imports:,.0f} thousand bbl",
-                    "implication": "Strong energy demand, monitor supply security",
-                    "confidence": "Medium"
-                })
-    
-    return signals
-
 # Signal Detection
 st.markdown('<div class="section-header"><h2>🚨 Energy Sector Signals</h2></div>', unsafe_allow_html=True)
 
-# Generate and display energy-specific signals
-signals = detect_energy_signals(iea_stocks_raw, oil_imports_raw, import_price_by_region)
+# Anomaly and regime-shift alerts detected by the EDA run across every energy indicator
+signals = load_alerts("energy")
 
 if signals:
     for signal in signals:
-        if signal["type"] == "bullish":
-            signal_color = "#28a745"
-            signal_emoji = "🟢"
-        elif signal["type"] == "bearish":
+        if signal["severity"] == "high":
             signal_color = "#dc3545"
             signal_emoji = "🔴"
-        else:  # neutral
+        else:  # medium
             signal_color = "#ffc107"
             signal_emoji = "🟡"
         
         st.markdown(f"""
         <div class="insight-card" style="border-left-color: {signal_color};">
-            <h4>{signal_emoji} {signal["signal"]}</h4>
-            <p><strong>📊 What We See:</strong> {signal["description"]}</p>
-            <p><strong>💡 What This Means:</strong> {signal["implication"]}</p>
-            <p><strong>🎯 Confidence Level:</strong> {signal["confidence"]}</p>
+            <h4>{signal_emoji} {signal["title"]}</h4>
+            <p><strong>📊 What We See:</strong> {signal["message"]}</p>
+            <p><strong>🔍 How It Was Found:</strong> {signal["basis"]}</p>
+            <p><strong>🎯 Severity:</strong> {signal["severity"].title()}</p>
         </div>
         """, unsafe_allow_html=True)
+
+    # Recent history of a flagged series, read from the memory-mapped series store
+    flagged = {signal["name"]: signal for signal in signals}
+    history_choice = st.selectbox("Show history of:", list(flagged), key="energy_alert_history")
+    history = load_series_history(flagged[history_choice]["series"])
+    if not history.empty:
+        st.plotly_chart(alert_history_chart(history, flagged[history_choice]), use_container_width=True)
 else:
     st.info("No significant energy market signals detected at this time.")
 
@@ -755,17 +697,19 @@ if not iea_stocks_raw.empty:
     top_8_data = filtered_stocks[filtered_stocks['country'].isin(top_8_countries)]
     
     if not top_8_data.empty:
-        fig_stocks = px.line(
-            top_8_data,
-            x="date",
-            y="value",
-            color="country",
-            title="IEA Oil Stocks by Country (Top 8)",
-            labels={"value": "Stock (thousand bbl)", "date": "Date"},
-            color_discrete_sequence=px.colors.qualitative.Set3,
-            template="plotly_white"
-        )
-        fig_stocks = apply_chart_styling(fig_stocks)
+        def build_stocks_chart():
+            fig_stocks = line_chart(
+                top_8_data,
+                x="date",
+                y="value",
+                color="country",
+                title="IEA Oil Stocks by Country (Top 8)",
+                labels={"value": "Stock (thousand bbl)", "date": "Date"},
+                color_discrete_sequence=px.colors.qualitative.Set3,
+                template="plotly_white"
+            )
+            return apply_chart_styling(fig_stocks)
+        fig_stocks = cached_figure("energy", "iea_stocks_top8", (start_date, end_date, selected_countries), build_stocks_chart)
         st.plotly_chart(fig_stocks, use_container_width=True)
     else:
         st.markdown("""
@@ -934,20 +878,10 @@ if not iea_stocks_raw.empty or not oil_imports_raw.empty or not opec_summary_raw
             with st.expander("🛢️ IEA Oil Stocks Data", expanded=False):
                 col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
                 with col4:
-                    csv = iea_stocks_raw.to_csv(index=False)
-                    st.download_button(
-                        label="📥 Export Data",
-                        data=csv,
-                        file_name=f"iea_stocks_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv",
-                        type="primary",
-                        key="export_iea"
-                    )
+                    export_buttons(iea_stocks_raw, "energy", "iea_stocks_raw", "iea_stocks", key="export_iea")
                 search_term = st.text_input("🔍 Search countries:", placeholder="Enter country name...", key="search_iea")
                 if search_term:
-                    filtered_data = iea_stocks_raw[
-                        iea_stocks_raw.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-                    ]
+                    filtered_data = search_rows("energy", "iea_stocks_raw", iea_stocks_raw, search_term)
                 else:
                     filtered_data = iea_stocks_raw
                 st.dataframe(filtered_data, use_container_width=True)
@@ -958,20 +892,10 @@ if not iea_stocks_raw.empty or not oil_imports_raw.empty or not opec_summary_raw
             with st.expander("🚢 Oil Imports Data", expanded=False):
                 col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
                 with col4:
-                    csv = oil_imports_raw.to_csv(index=False)
-                    st.download_button(
-                        label="📥 Export Data",
-                        data=csv,
-                        file_name=f"oil_imports_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv",
-                        type="primary",
-                        key="export_imports"
-                    )
+                    export_buttons(oil_imports_raw, "energy", "oil_imports_raw", "oil_imports", key="export_imports")
                 search_term = st.text_input("🔍 Search regions/countries:", placeholder="Enter region or country...", key="search_imports")
                 if search_term:
-                    filtered_data = oil_imports_raw[
-                        oil_imports_raw.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-                    ]
+                    filtered_data = search_rows("energy", "oil_imports_raw", oil_imports_raw, search_term)
                 else:
                     filtered_data = oil_imports_raw
                 st.dataframe(filtered_data, use_container_width=True)
@@ -982,20 +906,10 @@ if not iea_stocks_raw.empty or not oil_imports_raw.empty or not opec_summary_raw
             with st.expander("🛢️ OPEC Insights Data", expanded=False):
                 col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
                 with col4:
-                    csv = opec_summary_raw.to_csv(index=False)
-                    st.download_button(
-                        label="📥 Export Data",
-                        data=csv,
-                        file_name=f"opec_insights_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv",
-                        type="primary",
-                        key="export_opec"
-                    )
+                    export_buttons(opec_summary_raw, "energy", "opec_summary_raw", "opec_insights", key="export_opec")
                 search_term = st.text_input("🔍 Search topics/insights:", placeholder="Enter topic or keyword...", key="search_opec")
                 if search_term:
-                    filtered_data = opec_summary_raw[
-                        opec_summary_raw.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-                    ]
+                    filtered_data = search_rows("energy", "opec_summary_raw", opec_summary_raw, search_term)
                 else:
                     filtered_data = opec_summary_raw
                 st.dataframe(filtered_data, use_container_width=True)
@@ -11,6 +11,9 @@ warnings.filterwarnings('ignore')
 # Add the parent directory to Python path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from utils.data_loader import load_industry_data
+from utils.filter_engine import SectorFilter
+from utils.search_index import search_rows
+from utils.exports import export_buttons
 
 # Page Config
 st.set_page_config(
@@ -115,7 +118,7 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Cache data loading for better performance
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+# Shared process-wide store (utils.data_loader); no per-session copy
 def load_cached_industry_data():
     try:
         data = load_industry_data()
@@ -209,17 +212,21 @@ steel_vs_world_current = data.get("steel_vs_world_current", pd.DataFrame())
 steel_vs_world_jan_current = data.get("steel_vs_world_jan_current", pd.DataFrame())
 steel_major_economies_current = data.get("steel_major_economies_current", pd.DataFrame())
 steel_major_economies_jan_current = data.get("steel_major_economies_jan_current", pd.DataFrame())
+steel_relative_change = data.get("steel_relative_change", pd.DataFrame())
 key_insights = data.get("insights", {})
 gemini_insight = data.get("gemini_insight", "No AI insights found.")
 
+# Sidebar filters run on the shared, date-indexed frames and are memoized per selection
+filters = SectorFilter("industry")
+start_date = end_date = None
+
 # Sidebar for filters and controls
 st.sidebar.markdown("## 🎛️ Dashboard Controls")
 
 # Date range filter for manufacturing inventory
 if not manufacturing_inventory_raw.empty and 'date' in manufacturing_inventory_raw.columns:
     try:
-        min_date = pd.to_datetime(manufacturing_inventory_raw['date']).min()
-        max_date = pd.to_datetime(manufacturing_inventory_raw['date']).max()
+        min_date, max_date = filters.date_bounds("manufacturing_inventory_raw")
         st.sidebar.markdown("### 📅 Date Range")
         date_range = st.sidebar.date_input(
             "Select date range:",
@@ -229,15 +236,15 @@ if not manufacturing_inventory_raw.empty and 'date' in manufacturing_inventory_r
         )
         if len(date_range) == 2:
             start_date, end_date = date_range
-            manufacturing_inventory_raw = manufacturing_inventory_raw[(pd.to_datetime(manufacturing_inventory_raw['date']).dt.date >= start_date) & (pd.to_datetime(manufacturing_inventory_raw['date']).dt.date <= end_date)]
-            manufacturing_inventory_processed = manufacturing_inventory_processed[(pd.to_datetime(manufacturing_inventory_processed['date']).dt.date >= start_date) & (pd.to_datetime(manufacturing_inventory_processed['date']).dt.date <= end_date)] if 'date' in manufacturing_inventory_processed.columns else manufacturing_inventory_processed
+            manufacturing_inventory_raw = filters.apply("manufacturing_inventory_raw", start_date, end_date)
+            manufacturing_inventory_processed = filters.apply("manufacturing_inventory_processed", start_date, end_date)
     except Exception as e:
         st.sidebar.warning(f"Date filtering error: {str(e)}")
 
 # Category filter for manufacturing inventory
 if not manufacturing_inventory_raw.empty and 'category' in manufacturing_inventory_raw.columns:
     st.sidebar.markdown("### 🏷️ Category Filter")
-    all_categories = list(manufacturing_inventory_raw['category'].unique())
+    all_categories = filters.options("manufacturing_inventory_raw", "category", start_date, end_date)
     select_all_label = "Select All"
     multiselect_options = [select_all_label] + all_categories
     selected = st.sidebar.multiselect(
@@ -251,8 +258,8 @@ if not manufacturing_inventory_raw.empty and 'category' in manufacturing_invento
     else:
         selected_categories = [c for c in selected if c in all_categories]
     if selected_categories:
-        manufacturing_inventory_raw = manufacturing_inventory_raw[manufacturing_inventory_raw['category'].isin(selected_categories)]
-        manufacturing_inventory_processed = manufacturing_inventory_processed[manufacturing_inventory_processed['category'].isin(selected_categories)] if 'category' in manufacturing_inventory_processed.columns else manufacturing_inventory_processed
+        manufacturing_inventory_raw = filters.apply("manufacturing_inventory_raw", start_date, end_date, category=selected_categories)
+        manufacturing_inventory_processed = filters.apply("manufacturing_inventory_processed", start_date, end_date, category=selected_categories)
 
 # Filter status indicator
 st.sidebar.markdown("### 📊 Filter Status")
@@ -597,15 +604,10 @@ col1, col2 = st.columns(2)
 
 with col1:
     # Steel Production Trends - Relative Change
-    if not steel_production_raw.empty:
-        # Calculate relative change (percentage change from first value for each region)
-        steel_relative = steel_production_raw.copy()
-        steel_relative['relative_change'] = steel_relative.groupby('region')['value'].transform(
-            lambda x: ((x - x.iloc[0]) / x.iloc[0]) * 100
-        )
-        
+    if not steel_relative_change.empty:
+        # Percentage change from each region's first value, precomputed by the EDA serving layer
         fig_steel = px.line(
-            steel_relative,
+            steel_relative_change,
             x="date",
             y="relative_change",
             color="region",
@@ -861,20 +863,10 @@ with tab1:
         with st.expander("📦 Manufacturing Inventory Raw Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = manufacturing_inventory_raw.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"manufacturing_inventory_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="export_inventory"
-                )
+                export_buttons(manufacturing_inventory_raw, "industry", "manufacturing_inventory_raw", "manufacturing_inventory", key="export_inventory")
             search_term = st.text_input("🔍 Search categories:", placeholder="Enter category name...", key="search_inventory")
             if search_term:
-                filtered_data = manufacturing_inventory_raw[
-                    manufacturing_inventory_raw.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-                ]
+                filtered_data = search_rows("industry", "manufacturing_inventory_raw", manufacturing_inventory_raw, search_term)
             else:
                 filtered_data = manufacturing_inventory_raw
             st.dataframe(filtered_data, use_container_width=True)
@@ -886,20 +878,10 @@ with tab2:
         with st.expander("🏭 Steel Production Raw Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = steel_production_raw.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"steel_production_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="export_steel"
-                )
+                export_buttons(steel_production_raw, "industry", "steel_production_raw", "steel_production", key="export_steel")
             search_term = st.text_input("🔍 Search regions:", placeholder="Enter region name...", key="search_steel")
             if search_term:
-                filtered_data = steel_production_raw[
-                    steel_production_raw.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-                ]
+                filtered_data = search_rows("industry", "steel_production_raw", steel_production_raw, search_term)
             else:
                 filtered_data = steel_production_raw
             st.dataframe(filtered_data, use_container_width=True)
@@ -911,15 +893,7 @@ with tab3:
         with st.expander("📊 Volatility Analysis Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = inventory_volatility_analysis.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"volatility_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="export_volatility"
-                )
+                export_buttons(inventory_volatility_analysis, "industry", "inventory_volatility_analysis", "volatility_analysis", key="export_volatility")
             st.dataframe(inventory_volatility_analysis, use_container_width=True)
     else:
         st.info("No volatility analysis data available.")
@@ -929,15 +903,7 @@ with tab4:
         with st.expander("📈 Trend Statistics Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = inventory_trend_statistics.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"trend_statistics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="export_trend_stats"
-                )
+                export_buttons(inventory_trend_statistics, "industry", "inventory_trend_statistics", "trend_statistics", key="export_trend_stats")
             st.dataframe(inventory_trend_statistics, use_container_width=True)
     else:
         st.info("No trend statistics data available.")
@@ -961,14 +927,7 @@ with tab6:
         with st.expander("🌍 World Comparison Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                if st.button("📥 Export Data", type="primary", key="export_world"):
-                    csv = steel_vs_world_current.to_csv(index=False)
-                    st.download_button(
-                        label="Download CSV",
-                        data=csv,
-                        file_name=f"world_comparison_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv"
-                    )
+                export_buttons(steel_vs_world_current, "industry", "steel_vs_world_current", "world_comparison", key="export_world")
             st.dataframe(steel_vs_world_current, use_container_width=True)
     else:
         st.info("No world comparison data available.")
@@ -12,6 +12,14 @@ warnings.filterwarnings('ignore')
 # Add the parent directory to Python path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from utils.data_loader import load_global_trade_data
+from utils.filter_engine import SectorFilter
+from utils.charts import DEFAULT_WIDTH_PX, downsample_positions, to_webgl, cached_figure
+from utils.search_index import search_rows
+from utils.exports import export_buttons
+
+# Add eda/ to Python path for the serving-layer helpers
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'eda'))
+from serving_layer import coverage_stats
 
 # Page Config
 st.set_page_config(
@@ -130,7 +138,7 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Cache data loading for better performance
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+# Shared process-wide store (utils.data_loader); no per-session copy
 def load_cached_global_trade_data():
     try:
         data = load_global_trade_data()
@@ -352,9 +360,14 @@ trade_partners_top5 = data.get("trade_partners_top5", pd.DataFrame())
 shipping_index_pivoted = data.get("shipping_index_pivoted", pd.DataFrame())
 shipping_index_correlation = data.get("shipping_index_correlation", pd.DataFrame())
 shipping_index_3m_volatility = data.get("shipping_index_3m_volatility", pd.DataFrame())
+shipping_index_coverage = data.get("shipping_index_coverage", pd.DataFrame())
 key_insights = data.get("insights", {})
 gemini_insight = data.get("gemini_insight", "No AI insights found.")
 
+# Sidebar filters run on the shared, date-indexed frames and are memoized per selection
+filters = SectorFilter("global_trade")
+start_date = end_date = None
+
 # Sidebar for filters and controls
 st.sidebar.markdown("## 🎛️ Dashboard Controls")
 
@@ -363,8 +376,7 @@ if not shipping_index_pivoted.empty and 'date' in shipping_index_pivoted.index:
     shipping_index_pivoted = shipping_index_pivoted.reset_index()
 if not shipping_index_pivoted.empty and 'date' in shipping_index_pivoted.columns:
     try:
-        min_date = pd.to_datetime(shipping_index_pivoted['date']).min()
-        max_date = pd.to_datetime(shipping_index_pivoted['date']).max()
+        min_date, max_date = filters.date_bounds("shipping_index_pivoted")
         st.sidebar.markdown("### 📅 Date Range")
         date_range = st.sidebar.date_input(
             "Select date range:",
@@ -374,7 +386,7 @@ if not shipping_index_pivoted.empty and 'date' in shipping_index_pivoted.columns
         )
         if len(date_range) == 2:
             start_date, end_date = date_range
-            shipping_index_pivoted = shipping_index_pivoted[(pd.to_datetime(shipping_index_pivoted['date']).dt.date >= start_date) & (pd.to_datetime(shipping_index_pivoted['date']).dt.date <= end_date)]
+            shipping_index_pivoted = filters.apply("shipping_index_pivoted", start_date, end_date)
     except Exception as e:
         st.sidebar.warning(f"Date filtering error: {str(e)}")
 
@@ -810,7 +822,7 @@ if not trade_partners_top5.empty:
     
     # Create country pair labels
     partners_data = partners_data.copy()
-    partners_data['country_pair'] = partners_data['country'] + ' → ' + partners_data['partner']
+    partners_data['country_pair'] = partners_data['country'].astype(str) + ' → ' + partners_data['partner'].astype(str)
     
     # Create horizontal bar chart for top 5 trading partners
     fig_partners = px.bar(
@@ -890,22 +902,22 @@ st.markdown('<div class="section-header"><h2>🚢 Shipping Index Trends</h2></di
 if not shipping_index_pivoted.empty:
     indicators = [col for col in shipping_index_pivoted.columns if col != "date"]
     
+    # Coverage over the full history is precomputed by the EDA serving layer;
+    # only a narrowed date range is summarised here
+    coverage = shipping_index_coverage
+    if coverage.empty or len(shipping_index_pivoted) != coverage['total_rows'].iloc[0]:
+        coverage = coverage_stats(shipping_index_pivoted)
+    coverage = coverage.set_index('indicator')
+    
     # Check data availability and latest values for each indicator
     data_availability = {}
     for indicator in indicators:
-        non_null_count = shipping_index_pivoted[indicator].dropna().shape[0]
-        total_count = shipping_index_pivoted.shape[0]
-        availability_pct = (non_null_count / total_count) * 100
-        
-        # Get the latest value for this indicator
-        latest_value = shipping_index_pivoted[indicator].dropna().iloc[-1] if non_null_count > 0 else None
-        latest_date = shipping_index_pivoted.loc[shipping_index_pivoted[indicator].dropna().index[-1], 'date'] if non_null_count > 0 else None
-        
+        has_data = indicator in coverage.index and coverage.loc[indicator, 'data_points'] > 0
         data_availability[indicator] = {
-            'count': non_null_count,
-            'percentage': availability_pct,
-            'latest_value': latest_value,
-            'latest_date': latest_date
+            'count': int(coverage.loc[indicator, 'data_points']) if has_data else 0,
+            'percentage': coverage.loc[indicator, 'coverage_pct'] if has_data else 0.0,
+            'latest_value': coverage.loc[indicator, 'latest_value'] if has_data else None,
+            'latest_date': coverage.loc[indicator, 'latest_date'] if has_data else None
         }
     
     # Display latest values info
@@ -949,83 +961,91 @@ if not shipping_index_pivoted.empty:
         tab1, tab2, tab3 = st.tabs(["📈 Relative Change", "📊 Absolute Values", "🔍 Data Points"])
         
         with tab1:
-            # Calculate relative changes (percentage change from first available value)
-            shipping_relative = shipping_index_pivoted.copy()
-            
-            fig_relative = go.Figure()
-            
             colors = px.colors.qualitative.Set3
             
-            for i, indicator in enumerate(indices_to_plot):
-                # Get only non-null values
-                indicator_data = shipping_relative[[indicator, 'date']].dropna()
+            def build_relative_chart():
+                # Calculate relative changes (percentage change from first available value)
+                fig_relative = go.Figure()
                 
-                if not indicator_data.empty:
-                    # Get the first non-null value for this indicator
-                    first_value = indicator_data[indicator].iloc[0]
+                for i, indicator in enumerate(indices_to_plot):
+                    # Get only non-null values
+                    indicator_data = shipping_index_pivoted[[indicator, 'date']].dropna()
                     
-                    # Calculate percentage change from the first value
-                    relative_values = ((indicator_data[indicator] - first_value) / first_value) * 100
-                    
-                    fig_relative.add_trace(go.Scatter(
-                        x=indicator_data['date'],
-                        y=relative_values,
-                        mode='lines+markers',
-                        name=indicator,
-                        line=dict(color=colors[i % len(colors)], width=3),
-                        marker=dict(size=6),
-                        hovertemplate=f'<b>{indicator}</b><br>' +
-                                    'Date: %{x}<br>' +
-                                    'Relative Change: %{y:.1f}%<br>' +
-                                    '<extra></extra>'
-                    ))
-            
-            # Add horizontal line at 0% for reference
-            fig_relative.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.5)
-            
-            fig_relative.update_layout(
-                title="Shipping Indices Relative Change Over Time",
-                xaxis_title="Date",
-                yaxis_title="Relative Change (%)",
-                template="plotly_white",
-                height=600,
-                hovermode='x unified'
-            )
+                    if not indicator_data.empty:
+                        # Get the first non-null value for this indicator
+                        first_value = indicator_data[indicator].iloc[0]
+                        
+                        # Calculate percentage change from the first value
+                        relative_values = ((indicator_data[indicator] - first_value) / first_value) * 100
+                        
+                        # Long histories are thinned to about one point per pixel (LTTB)
+                        keep = downsample_positions(indicator_data['date'], relative_values, DEFAULT_WIDTH_PX)
+                        
+                        fig_relative.add_trace(go.Scatter(
+                            x=indicator_data['date'].iloc[keep],
+                            y=relative_values.iloc[keep],
+                            mode='lines+markers',
+                            name=indicator,
+                            line=dict(color=colors[i % len(colors)], width=3),
+                            marker=dict(size=6),
+                            hovertemplate=f'<b>{indicator}</b><br>' +
+                                        'Date: %{x}<br>' +
+                                        'Relative Change: %{y:.1f}%<br>' +
+                                        '<extra></extra>'
+                        ))
+                
+                # Add horizontal line at 0% for reference
+                fig_relative.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.5)
+                
+                fig_relative.update_layout(
+                    title="Shipping Indices Relative Change Over Time",
+                    xaxis_title="Date",
+                    yaxis_title="Relative Change (%)",
+                    template="plotly_white",
+                    height=600,
+                    hovermode='x unified'
+                )
+                return to_webgl(fig_relative)
             
+            fig_relative = cached_figure("global_trade", "shipping_relative", (start_date, end_date, indices_to_plot), build_relative_chart)
             st.plotly_chart(fig_relative, use_container_width=True)
             st.info("📊 **Relative Change**: Shows percentage change from the first available value for each index. A value of 0% represents the starting point, positive values show growth, and negative values show decline.")
         
         with tab2:
-            # Show absolute values
-            fig_absolute = go.Figure()
-            
-            for i, indicator in enumerate(indices_to_plot):
-                # Get only non-null values
-                indicator_data = shipping_index_pivoted[[indicator, 'date']].dropna()
+            def build_absolute_chart():
+                # Show absolute values
+                fig_absolute = go.Figure()
                 
-                if not indicator_data.empty:
-                    fig_absolute.add_trace(go.Scatter(
-                        x=indicator_data['date'],
-                        y=indicator_data[indicator],
-                        mode='lines+markers',
-                        name=indicator,
-                        line=dict(color=colors[i % len(colors)], width=3),
-                        marker=dict(size=6),
-                        hovertemplate=f'<b>{indicator}</b><br>' +
-                                    'Date: %{x}<br>' +
-                                    'Value: %{y:.2f}<br>' +
-                                    '<extra></extra>'
-                    ))
-            
-            fig_absolute.update_layout(
-                title="Shipping Indices Absolute Values Over Time",
-                xaxis_title="Date",
-                yaxis_title="Index Value",
-                template="plotly_white",
-                height=600,
-                hovermode='x unified'
-            )
+                for i, indicator in enumerate(indices_to_plot):
+                    # Get only non-null values
+                    indicator_data = shipping_index_pivoted[[indicator, 'date']].dropna()
+                    
+                    if not indicator_data.empty:
+                        keep = downsample_positions(indicator_data['date'], indicator_data[indicator], DEFAULT_WIDTH_PX)
+                        fig_absolute.add_trace(go.Scatter(
+                            x=indicator_data['date'].iloc[keep],
+                            y=indicator_data[indicator].iloc[keep],
+                            mode='lines+markers',
+                            name=indicator,
+                            line=dict(color=colors[i % len(colors)], width=3),
+                            marker=dict(size=6),
+                            hovertemplate=f'<b>{indicator}</b><br>' +
+                                        'Date: %{x}<br>' +
+                                        'Value: %{y:.2f}<br>' +
+                                        '<extra></extra>'
+                        ))
+                
+                fig_absolute.update_layout(
+                    title="Shipping Indices Absolute Values Over Time",
+                    xaxis_title="Date",
+                    yaxis_title="Index Value",
+                    template="plotly_white",
+                    height=600,
+                    hovermode='x unified'
+                )
+                return to_webgl(fig_absolute)
             
+            fig_absolute = cached_figure("global_trade", "shipping_absolute", (start_date, end_date, indices_to_plot), build_absolute_chart)
             st.plotly_chart(fig_absolute, use_container_width=True)
             st.info("📊 **Absolute Values**: Shows the actual index values without normalization.")
         
@@ -1035,17 +1055,17 @@ if not shipping_index_pivoted.empty:
             
             summary_data = []
             for indicator in indices_to_plot:
-                indicator_data = shipping_index_pivoted[[indicator, 'date']].dropna()
-                if not indicator_data.empty:
+                if data_availability.get(indicator, {}).get('count'):
+                    stats = coverage.loc[indicator]
                     summary_data.append({
                         'Index': indicator,
-                        'Data Points': len(indicator_data),
-                        'First Date': indicator_data['date'].min().strftime('%Y-%m-%d'),
-                        'Last Date': indicator_data['date'].max().strftime('%Y-%m-%d'),
-                        'Min Value': indicator_data[indicator].min(),
-                        'Max Value': indicator_data[indicator].max(),
-                        'Latest Value': indicator_data[indicator].iloc[-1],
-                        'Data Coverage': f"{(len(indicator_data) / len(shipping_index_pivoted)) * 100:.1f}%"
+                        'Data Points': int(stats['data_points']),
+                        'First Date': stats['first_date'].strftime('%Y-%m-%d'),
+                        'Last Date': stats['last_date'].strftime('%Y-%m-%d'),
+                        'Min Value': stats['min_value'],
+                        'Max Value': stats['max_value'],
+                        'Latest Value': stats['latest_value'],
+                        'Data Coverage': f"{stats['coverage_pct']:.1f}%"
                     })
             
             if summary_data:
@@ -1273,20 +1293,10 @@ with tab1:
         with st.expander("📊 Export Decrease Items Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = export_decrease_items_top5.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"export_decrease_items_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="export_decrease_items"
-                )
+                export_buttons(export_decrease_items_top5, "global_trade", "export_decrease_items_top5", "export_decrease_items", key="export_decrease_items")
             search_term = st.text_input("🔍 Search items:", placeholder="Enter item name...", key="search_decrease_items")
             if search_term:
-                filtered_data = export_decrease_items_top5[
-                    export_decrease_items_top5.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-                ]
+                filtered_data = search_rows("global_trade", "export_decrease_items_top5", export_decrease_items_top5, search_term)
             else:
                 filtered_data = export_decrease_items_top5
             st.dataframe(filtered_data, use_container_width=True)
@@ -1298,20 +1308,10 @@ with tab2:
         with st.expander("📈 Export Increase Items Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = export_increase_items_top5.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"export_increase_items_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="export_increase_items"
-                )
+                export_buttons(export_increase_items_top5, "global_trade", "export_increase_items_top5", "export_increase_items", key="export_increase_items")
             search_term = st.text_input("🔍 Search items:", placeholder="Enter item name...", key="search_increase_items")
             if search_term:
-                filtered_data = export_increase_items_top5[
-                    export_increase_items_top5.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-                ]
+                filtered_data = search_rows("global_trade", "export_increase_items_top5", export_increase_items_top5, search_term)
             else:
                 filtered_data = export_increase_items_top5
             st.dataframe(filtered_data, use_container_width=True)
@@ -1323,20 +1323,10 @@ with tab3:
         with st.expander("🌍 Export Increase Countries Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = export_increase_countries_top5.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"export_increase_countries_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="export_increase_countries"
-                )
+                export_buttons(export_increase_countries_top5, "global_trade", "export_increase_countries_top5", "export_increase_countries", key="export_increase_countries")
             search_term = st.text_input("🔍 Search countries:", placeholder="Enter country name...", key="search_increase_countries")
             if search_term:
-                filtered_data = export_increase_countries_top5[
-                    export_increase_countries_top5.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-                ]
+                filtered_data = search_rows("global_trade", "export_increase_countries_top5", export_increase_countries_top5, search_term)
             else:
                 filtered_data = export_increase_countries_top5
             st.dataframe(filtered_data, use_container_width=True)
@@ -1348,20 +1338,10 @@ with tab4:
         with st.expander("🤝 Trade Partners Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = trade_partners_top5.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"trade_partners_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="export_trade_partners"
-                )
+                export_buttons(trade_partners_top5, "global_trade", "trade_partners_top5", "trade_partners", key="export_trade_partners")
             search_term = st.text_input("🔍 Search partners:", placeholder="Enter partner name...", key="search_trade_partners")
             if search_term:
-                filtered_data = trade_partners_top5[
-                    trade_partners_top5.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-                ]
+                filtered_data = search_rows("global_trade", "trade_partners_top5", trade_partners_top5, search_term)
             else:
                 filtered_data = trade_partners_top5
             st.dataframe(filtered_data, use_container_width=True)
@@ -1373,20 +1353,10 @@ with tab5:
         with st.expander("🚢 Shipping Index Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = shipping_index_pivoted.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"shipping_index_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="export_shipping_index"
-                )
+                export_buttons(shipping_index_pivoted, "global_trade", "shipping_index_pivoted", "shipping_index", key="export_shipping_index")
             search_term = st.text_input("🔍 Search indices:", placeholder="Enter index name...", key="search_shipping_index")
             if search_term:
-                filtered_data = shipping_index_pivoted[
-                    shipping_index_pivoted.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-                ]
+                filtered_data = search_rows("global_trade", "shipping_index_pivoted", shipping_index_pivoted, search_term)
             else:
                 filtered_data = shipping_index_pivoted
             st.dataframe(filtered_data, use_container_width=True)
@@ -1400,20 +1370,10 @@ with tab6:
             with st.expander("📊 Volatility Analysis Data", expanded=False):
                 col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
                 with col4:
-                    csv = volatility_display.to_csv(index=False)
-                    st.download_button(
-                        label="📥 Export Data",
-                        data=csv,
-                        file_name=f"volatility_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv",
-                        type="primary",
-                        key="export_volatility"
-                    )
+                    export_buttons(volatility_display, "global_trade", "volatility_display", "volatility_analysis", key="export_volatility")
                 search_term = st.text_input("🔍 Search volatility data:", placeholder="Enter search term...", key="search_volatility")
                 if search_term:
-                    filtered_data = volatility_display[
-                        volatility_display.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-                    ]
+                    filtered_data = search_rows("global_trade", "shipping_index_3m_volatility", volatility_display, search_term)
                 else:
                     filtered_data = volatility_display
                 st.dataframe(filtered_data, use_container_width=True)
@@ -11,6 +11,11 @@ warnings.filterwarnings('ignore')
 # Add the parent directory to Python path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from utils.data_loader import load_korea_trade_data
+from utils.filter_engine import SectorFilter
+from utils.query_engine import select, top_n, grouped_top_n, unpivot
+from utils.charts import line_chart, cached_figure
+from utils.search_index import search_rows
+from utils.exports import export_buttons
 
 # Page Config
 st.set_page_config(
@@ -115,7 +120,7 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Cache data loading for better performance
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+# Shared process-wide store (utils.data_loader); no per-session copy
 def load_cached_korea_trade_data():
     try:
         data = load_korea_trade_data()
@@ -304,26 +309,25 @@ trade_balance = data.get("trade_balance", pd.DataFrame())
 value_index_top_yoy = data.get("value_index_top_yoy", pd.DataFrame())
 value_index_bottom_yoy = data.get("value_index_bottom_yoy", pd.DataFrame())
 value_index_volatility = data.get("value_index_volatility", pd.DataFrame())
-wsts_top_monthly_regions = data.get("wsts_top_monthly_regions", pd.DataFrame())
-wsts_top_annual_regions = data.get("wsts_top_annual_regions", pd.DataFrame())
-wsts_volatility = data.get("wsts_volatility", pd.DataFrame())
 wsts_trend_monthly = data.get("wsts_trend_monthly", pd.DataFrame())
-wsts_trend_annual = data.get("wsts_trend_annual", pd.DataFrame())
 wsts_yoy_monthly = data.get("wsts_yoy_monthly", pd.DataFrame())
-wsts_yoy_annual = data.get("wsts_yoy_annual", pd.DataFrame())
 wsts_market_share_monthly = data.get("wsts_market_share_monthly", pd.DataFrame())
 key_insights = data.get("insights", {})
 gemini_insight = data.get("gemini_insight", "No AI insights found.")
 gemini_insights_data = data.get("gemini_insights_data", {})
 
+# Sidebar filters run on the shared, date-indexed frames and are memoized per selection
+filters = SectorFilter("korea_trade")
+start_date = end_date = None
+selected_partners = None
+
 # Sidebar for filters and controls
 st.sidebar.markdown("## 🎛️ Dashboard Controls")
 
 # Date range filter for trade balance
 if not trade_balance.empty and 'date' in trade_balance.columns:
     try:
-        min_date = pd.to_datetime(trade_balance['date']).min()
-        max_date = pd.to_datetime(trade_balance['date']).max()
+        min_date, max_date = filters.date_bounds("trade_balance")
         st.sidebar.markdown("### 📅 Date Range")
         date_range = st.sidebar.date_input(
             "Select date range:",
@@ -333,14 +337,14 @@ if not trade_balance.empty and 'date' in trade_balance.columns:
         )
         if len(date_range) == 2:
             start_date, end_date = date_range
-            trade_balance = trade_balance[(pd.to_datetime(trade_balance['date']).dt.date >= start_date) & (pd.to_datetime(trade_balance['date']).dt.date <= end_date)]
+            trade_balance = filters.apply("trade_balance", start_date, end_date)
     except Exception as e:
         st.sidebar.warning(f"Date filtering error: {str(e)}")
 
 # Partner filter
 if not export_top_partners.empty and 'partner' in export_top_partners.columns:
     st.sidebar.markdown("### 🤝 Partner Filter")
-    all_partners = list(export_top_partners['partner'].unique())
+    all_partners = filters.options("export_top_partners", "partner")
     select_all_label = "Select All"
     multiselect_options = [select_all_label] + all_partners
     selected = st.sidebar.multiselect(
@@ -354,8 +358,8 @@ if not export_top_partners.empty and 'partner' in export_top_partners.columns:
     else:
         selected_partners = [c for c in selected if c in all_partners]
     if selected_partners:
-        export_top_partners = export_top_partners[export_top_partners['partner'].isin(selected_partners)]
-        import_top_partners = import_top_partners[import_top_partners['partner'].isin(selected_partners)]
+        export_top_partners = filters.apply("export_top_partners", partner=selected_partners)
+        import_top_partners = filters.apply("import_top_partners", partner=selected_partners)
 
 # Filter status indicator
 st.sidebar.markdown("### 📊 Filter Status")
@@ -613,11 +617,12 @@ else:
 st.markdown('<div class="section-header"><h2>🤝 Trade Partners Analysis</h2></div>', unsafe_allow_html=True)
 col1, col2 = st.columns(2)
 with col1:
-    if not export_top_partners.empty:
-        export_top_partners = export_top_partners.copy()
-        export_top_partners['export_amount_label'] = export_top_partners['export_amount'].round(0).astype(int).astype(str)
+    # Ranking is computed in DuckDB; only the plotted rows come back
+    export_partner_ranking = top_n("korea_trade", "export_top_partners", "export_amount", n=10,
+                                   include={"partner": selected_partners or None})
+    if not export_partner_ranking.empty:
         fig_export = px.bar(
-            export_top_partners.head(10),
+            export_partner_ranking,
             x="export_amount",
             y="partner",
             orientation='h',
@@ -631,11 +636,11 @@ with col1:
     else:
         st.info("No export partners data available.")
 with col2:
-    if not import_top_partners.empty:
-        import_top_partners = import_top_partners.copy()
-        import_top_partners['import_amount_label'] = import_top_partners['import_amount'].round(0).astype(int).astype(str)
+    import_partner_ranking = top_n("korea_trade", "import_top_partners", "import_amount", n=10,
+                                   include={"partner": selected_partners or None})
+    if not import_partner_ranking.empty:
         fig_import = px.bar(
-            import_top_partners.head(10),
+            import_partner_ranking,
             x="import_amount",
             y="partner",
             orientation='h',
@@ -868,12 +873,12 @@ st.markdown('<div class="section-header"><h2>🔌 Semiconductor Industry Analysi
 
 # Monthly Trend
 if not wsts_trend_monthly.empty:
-    # Melt the data for plotting and exclude 'index' and 'World'
-    wsts_melted = wsts_trend_monthly.reset_index().melt(id_vars=['date'], var_name='region', value_name='value')
-    wsts_melted = wsts_melted[~wsts_melted['region'].isin(['index', 'World'])]
+    # Unpivot in DuckDB and exclude 'index' and 'World'
+    wsts_melted = unpivot("korea_trade", "wsts_trend_monthly", exclude=['index', 'World'])
     
     if not wsts_melted.empty:
-        fig_semiconductor = px.line(
+        # Downsampled, WebGL above the point threshold, built once per artifact version
+        fig_semiconductor = cached_figure("korea_trade", "wsts_trend_monthly", (), lambda: apply_chart_styling(line_chart(
             wsts_melted,
             x="date",
             y="value",
@@ -882,8 +887,7 @@ if not wsts_trend_monthly.empty:
             labels={"value": "Billings (USD)", "date": "Date"},
             color_discrete_sequence=px.colors.qualitative.Set3,
             template="plotly_white"
-        )
-        fig_semiconductor = apply_chart_styling(fig_semiconductor)
+        )))
         st.plotly_chart(fig_semiconductor, use_container_width=True)
     else:
         st.info("No semiconductor monthly trend data available (excluding World and index).")
@@ -896,107 +900,79 @@ else:
     """, unsafe_allow_html=True)
 
 # Annual Trend
-if not wsts_trend_annual.empty:
-    wsts_annual_melted = wsts_trend_annual.reset_index().melt(id_vars=['date'], var_name='region', value_name='value')
-    wsts_annual_melted = wsts_annual_melted[~wsts_annual_melted['region'].isin(['index', 'World'])]
-    
-    if not wsts_annual_melted.empty:
-        fig_semiconductor_annual = px.line(
-            wsts_annual_melted,
-            x="date",
-            y="value",
-            color="region",
-            title="Semiconductor Billings Trend (Annual)",
-            labels={"value": "Billings (USD)", "date": "Date"},
-            color_discrete_sequence=px.colors.qualitative.Set2,
-            template="plotly_white"
-        )
-        fig_semiconductor_annual = apply_chart_styling(fig_semiconductor_annual)
-        st.plotly_chart(fig_semiconductor_annual, use_container_width=True)
-    else:
-        st.info("No semiconductor annual trend data available (excluding World and index).")
+wsts_annual_melted = unpivot("korea_trade", "wsts_trend_annual", exclude=['index', 'World'])
+if not wsts_annual_melted.empty:
+    fig_semiconductor_annual = cached_figure("korea_trade", "wsts_trend_annual", (), lambda: apply_chart_styling(line_chart(
+        wsts_annual_melted,
+        x="date",
+        y="value",
+        color="region",
+        title="Semiconductor Billings Trend (Annual)",
+        labels={"value": "Billings (USD)", "date": "Date"},
+        color_discrete_sequence=px.colors.qualitative.Set2,
+        template="plotly_white"
+    )))
+    st.plotly_chart(fig_semiconductor_annual, use_container_width=True)
+else:
+    st.info("No semiconductor annual trend data available (excluding World and index).")
 # Semiconductor YoY Growth (Monthly/Annual)
 with st.container():
     col1, col2 = st.columns(2)
     with col1:
-        if not wsts_yoy_monthly.empty:
-            wsts_yoy_monthly_filtered = wsts_yoy_monthly[
-                (~wsts_yoy_monthly['country'].isin(['World', 'index'])) &
-                (wsts_yoy_monthly['yoy_change'].notna()) &
-                (wsts_yoy_monthly['country'].notna())
-            ]
-            wsts_yoy_monthly_grouped = (
-                wsts_yoy_monthly_filtered
-                .groupby('country', as_index=False)['yoy_change']
-                .mean()
-            )
-            wsts_yoy_monthly_grouped = wsts_yoy_monthly_grouped.sort_values('yoy_change', ascending=False).head(10)
+        # Mean YoY per region and top 10, pushed down to DuckDB
+        wsts_yoy_monthly_grouped = grouped_top_n("korea_trade", "wsts_yoy_monthly", "country", "yoy_change", "avg", n=10,
+                                                exclude={"country": ['World', 'index']})
+        if not wsts_yoy_monthly_grouped.empty:
             wsts_yoy_monthly_grouped = wsts_yoy_monthly_grouped.iloc[::-1]
             wsts_yoy_monthly_grouped['yoy_label'] = wsts_yoy_monthly_grouped['yoy_change'].round(1).astype(str) + '%'
-
-            if not wsts_yoy_monthly_grouped.empty:
-                fig_yoy_monthly = px.bar(
-                    wsts_yoy_monthly_grouped,
-                    x="yoy_change",
-                    y="country",
-                    orientation='h',
-                    title="Semiconductor YoY Growth (Monthly)",
-                    labels={"yoy_change": "YoY Change (%)", "country": "Region"},
-                    color_discrete_sequence=["#20c997"],
-                    template="plotly_white",
-                    text="yoy_label"  # Add labels
-                )
-                fig_yoy_monthly.update_traces(textposition='outside')
-                fig_yoy_monthly = apply_chart_styling(fig_yoy_monthly)
-                st.plotly_chart(fig_yoy_monthly, use_container_width=True)
-            else:
-                st.info("No semiconductor YoY monthly data available (excluding World and index).")
+            fig_yoy_monthly = px.bar(
+                wsts_yoy_monthly_grouped,
+                x="yoy_change",
+                y="country",
+                orientation='h',
+                title="Semiconductor YoY Growth (Monthly)",
+                labels={"yoy_change": "YoY Change (%)", "country": "Region"},
+                color_discrete_sequence=["#20c997"],
+                template="plotly_white",
+                text="yoy_label"  # Add labels
+            )
+            fig_yoy_monthly.update_traces(textposition='outside')
+            fig_yoy_monthly = apply_chart_styling(fig_yoy_monthly)
+            st.plotly_chart(fig_yoy_monthly, use_container_width=True)
         else:
-            st.info("No semiconductor YoY monthly data available.")
+            st.info("No semiconductor YoY monthly data available (excluding World and index).")
 
     with col2:
-        if not wsts_yoy_annual.empty:
-            wsts_yoy_annual_filtered = wsts_yoy_annual[
-                (~wsts_yoy_annual['country'].isin(['World', 'index'])) &
-                (wsts_yoy_annual['yoy_change'].notna()) &
-                (wsts_yoy_annual['country'].notna())
-            ]
-            wsts_yoy_annual_grouped = (
-                wsts_yoy_annual_filtered
-                .groupby('country', as_index=False)['yoy_change']
-                .mean()
-            )
-            wsts_yoy_annual_grouped = wsts_yoy_annual_grouped.sort_values('yoy_change', ascending=False).head(10)
+        # Mean YoY per region and top 10, pushed down to DuckDB
+        wsts_yoy_annual_grouped = grouped_top_n("korea_trade", "wsts_yoy_annual", "country", "yoy_change", "avg", n=10,
+                                                exclude={"country": ['World', 'index']})
+        if not wsts_yoy_annual_grouped.empty:
             wsts_yoy_annual_grouped = wsts_yoy_annual_grouped.iloc[::-1]
             wsts_yoy_annual_grouped['yoy_label'] = wsts_yoy_annual_grouped['yoy_change'].round(1).astype(str) + '%'
-
-            if not wsts_yoy_annual_grouped.empty:
-                fig_yoy_annual = px.bar(
-                    wsts_yoy_annual_grouped,
-                    x="yoy_change",
-                    y="country",
-                    orientation='h',
-                    title="Semiconductor YoY Growth (Annual)",
-                    labels={"yoy_change": "YoY Change (%)", "country": "Region"},
-                    color_discrete_sequence=["#17a2b8"],
-                    template="plotly_white",
-                    text="yoy_label"  # Add labels
-                )
-                fig_yoy_annual.update_traces(textposition='outside')
-                fig_yoy_annual = apply_chart_styling(fig_yoy_annual)
-                st.plotly_chart(fig_yoy_annual, use_container_width=True)
-            else:
-                st.info("No semiconductor YoY annual data available (excluding World and index).")
+            fig_yoy_annual = px.bar(
+                wsts_yoy_annual_grouped,
+                x="yoy_change",
+                y="country",
+                orientation='h',
+                title="Semiconductor YoY Growth (Annual)",
+                labels={"yoy_change": "YoY Change (%)", "country": "Region"},
+                color_discrete_sequence=["#17a2b8"],
+                template="plotly_white",
+                text="yoy_label"  # Add labels
+            )
+            fig_yoy_annual.update_traces(textposition='outside')
+            fig_yoy_annual = apply_chart_styling(fig_yoy_annual)
+            st.plotly_chart(fig_yoy_annual, use_container_width=True)
         else:
-            st.info("No semiconductor YoY annual data available.")
+            st.info("No semiconductor YoY annual data available (excluding World and index).")
 
 
 # Market Share Analysis
 if not wsts_market_share_monthly.empty:
     # Filter out 'World' from market share data
-    wsts_market_share_filtered = wsts_market_share_monthly[~wsts_market_share_monthly['country'].isin(['World'])]
+    wsts_market_share_filtered = select("korea_trade", "wsts_market_share_monthly", exclude={"country": ['World']})
     if not wsts_market_share_filtered.empty:
-        fig_market_share = px.line(
+        fig_market_share = cached_figure("korea_trade", "wsts_market_share_monthly", (), lambda: apply_chart_styling(line_chart(
             wsts_market_share_filtered,
             x="date",
             y="market_share",
@@ -1005,36 +981,32 @@ if not wsts_market_share_monthly.empty:
             labels={"market_share": "Market Share (%)", "date": "Date", "country": "Region"},
             color_discrete_sequence=px.colors.qualitative.Pastel,
             template="plotly_white"
-        )
-        fig_market_share = apply_chart_styling(fig_market_share)
+        )))
         st.plotly_chart(fig_market_share, use_container_width=True)
     else:
         st.info("No semiconductor market share data available (excluding World).")
 
 # Volatility Analysis
-if not wsts_volatility.empty:
-    # Filter out 'World' from volatility data
-    wsts_volatility_filtered = wsts_volatility[~wsts_volatility['country'].isin(['World'])]
-    if not wsts_volatility_filtered.empty:
-        wsts_volatility_labeled = wsts_volatility_filtered.copy()
-        wsts_volatility_labeled = wsts_volatility_labeled.sort_values("value", ascending=False).head(10)
-        wsts_volatility_labeled = wsts_volatility_labeled.iloc[::-1]  # Reverse for top-to-bottom display
-        wsts_volatility_labeled["volatility_label"] = wsts_volatility_labeled["value"].round(2).astype(str)
-
-        fig_volatility_semiconductor = px.bar(
-            wsts_volatility_labeled,
-            x="value",
-            y="country",
-            orientation='h',
-            title="Semiconductor Industry Volatility (Top 10)",
-            labels={"value": "Volatility (Std Dev)", "country": "Region"},
-            color_discrete_sequence=["#fd7e14"],
-            template="plotly_white",
-            text="volatility_label"  # Add label
-        )
-        fig_volatility_semiconductor.update_traces(textposition="outside", cliponaxis=False)
-        fig_volatility_semiconductor = apply_chart_styling(fig_volatility_semiconductor)
-        st.plotly_chart(fig_volatility_semiconductor, use_container_width=True)
+# Filter out 'World' and keep the 10 most volatile regions in DuckDB
+wsts_volatility_labeled = top_n("korea_trade", "wsts_volatility", "value", n=10, exclude={"country": ['World']})
+if not wsts_volatility_labeled.empty:
+    wsts_volatility_labeled = wsts_volatility_labeled.iloc[::-1]  # Reverse for top-to-bottom display
+    wsts_volatility_labeled["volatility_label"] = wsts_volatility_labeled["value"].round(2).astype(str)
+
+    fig_volatility_semiconductor = px.bar(
+        wsts_volatility_labeled,
+        x="value",
+        y="country",
+        orientation='h',
+        title="Semiconductor Industry Volatility (Top 10)",
+        labels={"value": "Volatility (Std Dev)", "country": "Region"},
+        color_discrete_sequence=["#fd7e14"],
+        template="plotly_white",
+        text="volatility_label"  # Add label
+    )
+    fig_volatility_semiconductor.update_traces(textposition="outside", cliponaxis=False)
+    fig_volatility_semiconductor = apply_chart_styling(fig_volatility_semiconductor)
+    st.plotly_chart(fig_volatility_semiconductor, use_container_width=True)
 
 
 # Data Explorer
@@ -1049,21 +1021,11 @@ with tab1:
         with st.expander("📊 Export Partners Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = export_top_partners.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"export_partners_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="export_top_partners_download"
-                )
+                export_buttons(export_top_partners, "korea_trade", "export_top_partners", "export_partners", key="export_top_partners_download")
 
             search_term = st.text_input("🔍 Search partners:", placeholder="Enter partner name...", key="search_export_partners")
             if search_term:
-                filtered_data = export_top_partners[
-                    export_top_partners.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-                ]
+                filtered_data = search_rows("korea_trade", "export_top_partners", export_top_partners, search_term)
             else:
                 filtered_data = export_top_partners
             st.dataframe(filtered_data, use_container_width=True)
@@ -1074,20 +1036,10 @@ with tab1:
         with st.expander("📊 Import Partners Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = import_top_partners.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"import_partners_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="import_top_partners_download"
-                )
+                export_buttons(import_top_partners, "korea_trade", "import_top_partners", "import_partners", key="import_top_partners_download")
             search_term = st.text_input("🔍 Search partners:", placeholder="Enter partner name...", key="search_import_partners")
             if search_term:
-                filtered_data = import_top_partners[
-                    import_top_partners.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-                ]
+                filtered_data = search_rows("korea_trade", "import_top_partners", import_top_partners, search_term)
             else:
                 filtered_data = import_top_partners
             st.dataframe(filtered_data, use_container_width=True)
@@ -1100,20 +1052,10 @@ with tab2:
         with st.expander("📦 Export Items by Amount Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = export_top_items_by_amount.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"export_items_amount_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="export_items_amount_download"
-                )
+                export_buttons(export_top_items_by_amount, "korea_trade", "export_top_items_by_amount", "export_items_amount", key="export_items_amount_download")
             search_term = st.text_input("🔍 Search items:", placeholder="Enter item name...", key="search_export_items_amount")
             if search_term:
-                filtered_data = export_top_items_by_amount[
-                    export_top_items_by_amount.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-                ]
+                filtered_data = search_rows("korea_trade", "export_top_items_by_amount", export_top_items_by_amount, search_term)
             else:
                 filtered_data = export_top_items_by_amount
             st.dataframe(filtered_data, use_container_width=True)
@@ -1124,20 +1066,10 @@ with tab2:
         with st.expander("📦 Import Items by Amount Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = import_top_items_by_amount.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"import_items_amount_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="import_items_amount_download"
-                )
+                export_buttons(import_top_items_by_amount, "korea_trade", "import_top_items_by_amount", "import_items_amount", key="import_items_amount_download")
             search_term = st.text_input("🔍 Search items:", placeholder="Enter item name...", key="search_import_items_amount")
             if search_term:
-                filtered_data = import_top_items_by_amount[
-                    import_top_items_by_amount.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-                ]
+                filtered_data = search_rows("korea_trade", "import_top_items_by_amount", import_top_items_by_amount, search_term)
             else:
                 filtered_data = import_top_items_by_amount
             st.dataframe(filtered_data, use_container_width=True)
@@ -1150,20 +1082,10 @@ with tab3:
         with st.expander("📈 Export Partners YoY Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = trade_yoy_top_export_partners.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"export_partners_yoy_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="export_partners_yoy_download"
-                )
+                export_buttons(trade_yoy_top_export_partners, "korea_trade", "trade_yoy_top_export_partners", "export_partners_yoy", key="export_partners_yoy_download")
             search_term = st.text_input("🔍 Search partners:", placeholder="Enter partner name...", key="search_export_partners_yoy")
             if search_term:
-                filtered_data = trade_yoy_top_export_partners[
-                    trade_yoy_top_export_partners.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-                ]
+                filtered_data = search_rows("korea_trade", "trade_yoy_top_export_partners", trade_yoy_top_export_partners, search_term)
             else:
                 filtered_data = trade_yoy_top_export_partners
             st.dataframe(filtered_data, use_container_width=True)
@@ -1174,20 +1096,10 @@ with tab3:
         with st.expander("📈 Import Partners YoY Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = trade_yoy_top_import_partners.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"import_partners_yoy_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="import_partners_yoy_download"
-                )
+                export_buttons(trade_yoy_top_import_partners, "korea_trade", "trade_yoy_top_import_partners", "import_partners_yoy", key="import_partners_yoy_download")
             search_term = st.text_input("🔍 Search partners:", placeholder="Enter partner name...", key="search_import_partners_yoy")
             if search_term:
-                filtered_data = trade_yoy_top_import_partners[
-                    trade_yoy_top_import_partners.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-                ]
+                filtered_data = search_rows("korea_trade", "trade_yoy_top_import_partners", trade_yoy_top_import_partners, search_term)
             else:
                 filtered_data = trade_yoy_top_import_partners
             st.dataframe(filtered_data, use_container_width=True)
@@ -1200,19 +1112,9 @@ with tab4:
         with st.expander("💹 Value Index Top YoY Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = value_index_top_yoy.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"value_index_top_yoy_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="value_index_top_yoy_download"
-                )
+                export_buttons(value_index_top_yoy, "korea_trade", "value_index_top_yoy", "value_index_top_yoy", key="value_index_top_yoy_download")
             search_term = st.text_input("🔍 Search items:", placeholder="Enter item name...", key="search_value_index_top_yoy")
-            filtered_data = value_index_top_yoy[
-                value_index_top_yoy.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-            ] if search_term else value_index_top_yoy
+            filtered_data = search_rows("korea_trade", "value_index_top_yoy", value_index_top_yoy, search_term)
             st.dataframe(filtered_data, use_container_width=True)
     else:
         st.info("No value index top YoY data available.")
@@ -1222,19 +1124,9 @@ with tab4:
         with st.expander("💹 Value Index Bottom YoY Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = value_index_bottom_yoy.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"value_index_bottom_yoy_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="value_index_bottom_yoy_download"
-                )
+                export_buttons(value_index_bottom_yoy, "korea_trade", "value_index_bottom_yoy", "value_index_bottom_yoy", key="value_index_bottom_yoy_download")
             search_term = st.text_input("🔍 Search items:", placeholder="Enter item name...", key="search_value_index_bottom_yoy")
-            filtered_data = value_index_bottom_yoy[
-                value_index_bottom_yoy.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-            ] if search_term else value_index_bottom_yoy
+            filtered_data = search_rows("korea_trade", "value_index_bottom_yoy", value_index_bottom_yoy, search_term)
             st.dataframe(filtered_data, use_container_width=True)
     else:
         st.info("No value index bottom YoY data available.")
@@ -1244,19 +1136,9 @@ with tab4:
         with st.expander("💹 Value Index Volatility Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = value_index_volatility.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"value_index_volatility_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="value_index_volatility_download"
-                )
+                export_buttons(value_index_volatility, "korea_trade", "value_index_volatility", "value_index_volatility", key="value_index_volatility_download")
             search_term = st.text_input("🔍 Search items:", placeholder="Enter item name...", key="search_value_index_volatility")
-            filtered_data = value_index_volatility[
-                value_index_volatility.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-            ] if search_term else value_index_volatility
+            filtered_data = search_rows("korea_trade", "value_index_volatility", value_index_volatility, search_term)
             st.dataframe(filtered_data, use_container_width=True)
     else:
         st.info("No value index volatility data available.")
@@ -1267,19 +1149,9 @@ with tab5:
         with st.expander("🔌 Semiconductor Monthly Trend Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = wsts_trend_monthly.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"wsts_trend_monthly_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="wsts_trend_monthly_download"
-                )
+                export_buttons(wsts_trend_monthly, "korea_trade", "wsts_trend_monthly", "wsts_trend_monthly", key="wsts_trend_monthly_download")
             search_term = st.text_input("🔍 Search regions:", placeholder="Enter region name...", key="search_wsts_trend_monthly")
-            filtered_data = wsts_trend_monthly[
-                wsts_trend_monthly.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-            ] if search_term else wsts_trend_monthly
+            filtered_data = search_rows("korea_trade", "wsts_trend_monthly", wsts_trend_monthly, search_term)
             st.dataframe(filtered_data, use_container_width=True)
     else:
         st.info("No semiconductor monthly trend data available.")
@@ -1289,19 +1161,9 @@ with tab5:
         with st.expander("🔌 Semiconductor YoY Monthly Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = wsts_yoy_monthly.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"wsts_yoy_monthly_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="wsts_yoy_monthly_download"
-                )
+                export_buttons(wsts_yoy_monthly, "korea_trade", "wsts_yoy_monthly", "wsts_yoy_monthly", key="wsts_yoy_monthly_download")
             search_term = st.text_input("🔍 Search regions:", placeholder="Enter region name...", key="search_wsts_yoy_monthly")
-            filtered_data = wsts_yoy_monthly[
-                wsts_yoy_monthly.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-            ] if search_term else wsts_yoy_monthly
+            filtered_data = search_rows("korea_trade", "wsts_yoy_monthly", wsts_yoy_monthly, search_term)
             st.dataframe(filtered_data, use_container_width=True)
     else:
         st.info("No semiconductor YoY monthly data available.")
@@ -1311,19 +1173,9 @@ with tab5:
         with st.expander("🔌 Semiconductor Market Share Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = wsts_market_share_monthly.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"wsts_market_share_monthly_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="wsts_market_share_monthly_download"
-                )
+                export_buttons(wsts_market_share_monthly, "korea_trade", "wsts_market_share_monthly", "wsts_market_share_monthly", key="wsts_market_share_monthly_download")
             search_term = st.text_input("🔍 Search regions:", placeholder="Enter region name...", key="search_wsts_market_share_monthly")
-            filtered_data = wsts_market_share_monthly[
-                wsts_market_share_monthly.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-            ] if search_term else wsts_market_share_monthly
+            filtered_data = search_rows("korea_trade", "wsts_market_share_monthly", wsts_market_share_monthly, search_term)
             st.dataframe(filtered_data, use_container_width=True)
     else:
         st.info("No semiconductor market share data available.")
@@ -1333,19 +1185,9 @@ with tab6:
         with st.expander("⚖️ Trade Balance Data", expanded=False):
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
             with col4:
-                csv = trade_balance.to_csv(index=False)
-                st.download_button(
-                    label="📥 Export Data",
-                    data=csv,
-                    file_name=f"trade_balance_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    type="primary",
-                    key="trade_balance_download"
-                )
+                export_buttons(trade_balance, "korea_trade", "trade_balance", "trade_balance", key="trade_balance_download")
             search_term = st.text_input("🔍 Search partners:", placeholder="Enter partner name...", key="search_trade_balance")
-            filtered_data = trade_balance[
-                trade_balance.apply(lambda x: x.astype(str).str.contains(search_term, case=False, na=False)).any(axis=1)
-            ] if search_term else trade_balance
+            filtered_data = search_rows("korea_trade", "trade_balance", trade_balance, search_term)
             st.dataframe(filtered_data, use_container_width=True)
     else:
         st.info("No trade balance data available.")
@@ -0,0 +1,185 @@
+# utils/charts.py
+import json
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from utils.data_loader import dataset_store, artifact_version
+
+# Charts use the wide layout at full container width. LTTB keeps one point per
+# pixel column, min/max keeps two (the bucket's low and high)
+DEFAULT_WIDTH_PX = 1200
+
+# Above this many points in one figure, traces are drawn with WebGL (Scattergl)
+WEBGL_THRESHOLD = 2000
+
+# Serialized figures kept per process; one entry per (sector version, chart, filter state)
+MAX_CACHED_FIGURES = 128
+
+
+def to_numeric_x(x):
+    """x values as float64 for the area/bucket maths; dates become nanoseconds"""
+    x = pd.Series(x)
+    if pd.api.types.is_numeric_dtype(x):
+        return x.to_numpy(dtype="float64")
+    if not pd.api.types.is_datetime64_any_dtype(x):
+        # e.g. datetime.date objects from format_dates_for_display
+        x = pd.to_datetime(x)
+    return x.to_numpy("datetime64[ns]").astype("int64").astype("float64")
+
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: positions of the n_out points that keep the line's shape"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # First and last points are always kept; the rest is split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    # Bucket averages (the third triangle vertex) in one pass; the last bucket looks at the final point
+    counts = np.diff(np.append(edges, n))
+    avg_x = np.add.reduceat(x, edges) / counts
+    avg_y = np.add.reduceat(y, edges) / counts
+
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        bx, by = x[start:end], y[start:end]
+        area = np.abs((x[a] - avg_x[i + 1]) * (by - y[a]) - (x[a] - bx) * (avg_y[i + 1] - y[a]))
+        a = start + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def minmax_indices(y, n_out):
+    """Min and max of each bucket, so spikes survive; n_out // 2 buckets"""
+    n = len(y)
+    n_buckets = max(1, n_out // 2)
+    if n_out >= n:
+        return np.arange(n)
+    edges = np.linspace(0, n, n_buckets + 1).astype(int)
+    keep = [0, n - 1]
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end > start:
+            keep += [start + int(y[start:end].argmin()), start + int(y[start:end].argmax())]
+    return np.unique(keep)
+
+
+def downsample_positions(x, y, n_out, method="lttb"):
+    """Row positions to plot for one series; NaN values are dropped before choosing"""
+    y = np.asarray(y, dtype="float64")
+    valid = np.flatnonzero(~np.isnan(y))
+    if len(valid) <= n_out:
+        return np.arange(len(y))
+    xs, ys = to_numeric_x(x)[valid], y[valid]
+    picked = lttb_indices(xs, ys, n_out) if method == "lttb" else minmax_indices(ys, n_out)
+    return valid[picked]
+
+
+def downsample(df, x, y, by=None, width_px=DEFAULT_WIDTH_PX, x_range=None, method="lttb"):
+    """Rows of a long frame worth drawing: the visible x range, then about one
+    point per pixel per series (LTTB) or a low/high pair per pixel (min/max)"""
+    if df.empty:
+        return df
+    if x_range is not None:
+        numeric = pd.api.types.is_numeric_dtype(df[x])
+        xs = df[x] if numeric else pd.to_datetime(df[x])
+        lo, hi = (x_range if numeric else [None if v is None else pd.Timestamp(v) for v in x_range])
+        visible = np.ones(len(df), dtype=bool)
+        if lo is not None:
+            visible &= (xs >= lo).to_numpy()
+        if hi is not None:
+            visible &= (xs <= hi).to_numpy()
+        df = df[visible]
+
+    n_out = int(width_px) if method == "lttb" else int(width_px) * 2
+    groups = [df] if by is None else [group for _, group in df.groupby(by, sort=False, observed=True)]
+    if all(len(group) <= n_out for group in groups):
+        return df
+
+    parts = []
+    for group in groups:
+        positions = downsample_positions(group[x], group[y], n_out, method)
+        parts.append(group.iloc[positions])
+    return pd.concat(parts)
+
+
+def point_count(fig):
+    return sum(len(trace.x) if trace.x is not None else 0 for trace in fig.data)
+
+
+def to_webgl(fig, threshold=WEBGL_THRESHOLD):
+    """Swap SVG scatter traces for Scattergl once the figure holds more than threshold points"""
+    if point_count(fig) <= threshold:
+        return fig
+    traces = []
+    for trace in fig.data:
+        if trace.type == "scatter":
+            props = trace.to_plotly_json()
+            props.pop("type", None)
+            traces.append(go.Scattergl(**props))
+        else:
+            traces.append(trace)
+    fig.data = []
+    for trace in traces:
+        fig.add_trace(trace)
+    return fig
+
+
+def line_chart(df, x, y, color=None, width_px=DEFAULT_WIDTH_PX, x_range=None, method="lttb", **px_kwargs):
+    """px.line over a downsampled frame, rendered with WebGL above WEBGL_THRESHOLD points"""
+    plot_df = downsample(df, x, y, by=color, width_px=width_px, x_range=x_range, method=method)
+    render_mode = "webgl" if len(plot_df) > WEBGL_THRESHOLD else "svg"
+    return px.line(plot_df, x=x, y=y, color=color, render_mode=render_mode, **px_kwargs)
+
+
+def alert_history_chart(history, alert):
+    """Recent history of an alerted series with the alert's month marked"""
+    color = "#dc3545" if alert["severity"] == "high" else "#ffc107"
+    fig = line_chart(history, "date", "value", title=f"Recent History: {alert['name']}",
+                     labels={"value": alert["name"], "date": "Date"}, template="plotly_white",
+                     color_discrete_sequence=["#1e3c72"])
+    fig.add_vline(x=pd.Timestamp(alert["date"]).value / 1e6, line_dash="dash", line_color=color)
+    return fig
+
+
+def state_key(state):
+    """Stable string for a filter state; tuples keep their order, selections (lists, sets) are sorted"""
+    def normalize(value):
+        if isinstance(value, tuple):
+            return [normalize(v) for v in value]
+        if isinstance(value, (list, set, frozenset)):
+            return sorted((normalize(v) for v in value), key=str)
+        return value
+    return json.dumps(normalize(state), default=str, sort_keys=True)
+
+
+def figure_cache():
+    store = dataset_store()
+    if "figures" not in store:
+        with store["lock"]:
+            store.setdefault("figures", {"lock": threading.Lock(), "items": OrderedDict()})
+    return store["figures"]
+
+
+def cached_figure(sector, chart, state, build):
+    """Figure for (chart, filter state), built once per sector version and kept as JSON"""
+    cache = figure_cache()
+    key = (sector, artifact_version(sector), chart, state_key(state))
+    with cache["lock"]:
+        fig_json = cache["items"].get(key)
+        if fig_json is not None:
+            cache["items"].move_to_end(key)
+    if fig_json is None:
+        fig_json = pio.to_json(build(), validate=False)
+        with cache["lock"]:
+            cache["items"][key] = fig_json
+            if len(cache["items"]) > MAX_CACHED_FIGURES:
+                cache["items"].popitem(last=False)
+    return pio.from_json(fig_json, skip_invalid=True)
@@ -2,14 +2,39 @@
 import pandas as pd
 import json
 import os
-from functools import lru_cache
+import sys
+import threading
+from collections.abc import Mapping
+from functools import partial
+import streamlit as st
+
+# Add src/processed to Python path for the dataset schemas
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "src", "processed"))
+from schema import read_dtypes, apply_schema
+
+# Add eda/ to Python path for the artifact manifest written by the EDA run
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "eda"))
+from artifact_manifest import MANIFEST_NAME, load_manifest as read_manifest
+from home_summary import SUMMARY_NAME, load_home_summary as read_home_summary
+from term_index import TermIndex
+from rollup_cube import RollupCube
+from anomaly_detection import ALERTS_NAME, load_alerts as read_alerts
+from series_store import META_NAME as SERIES_META_NAME, SeriesStore
 
 BASE_PATH = "eda/outputs"
 
+# Pages start loading the rest of their sector in a background thread while they render
+PREFETCH = os.getenv("DASHBOARD_PREFETCH", "1") == "1"
+
+# Pages get shallow views of the shared frames; copy-on-write keeps their edits local
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
 def load_csv(sector, filename, **kwargs):
     path = os.path.join(BASE_PATH, sector, filename)
     try:
-        return pd.read_csv(path, **kwargs)
+        df = pd.read_csv(path, dtype=read_dtypes(filename), **kwargs)
+        return apply_schema(df, filename)
     except FileNotFoundError:
         print(f"Warning: {path} not found. Returning empty DataFrame.")
         return pd.DataFrame()
@@ -32,150 +57,357 @@ def load_text(sector, filename):
         print(f"Warning: {path} not found. Returning empty string.")
         return ""
 
-@lru_cache(maxsize=None)
-def load_agriculture_data():
-    return {
-        "ready": load_csv("agriculture", "streamlit_ready_data.csv", parse_dates=["date"]),
-        "trend": load_csv("agriculture", "production_trends.csv", parse_dates=["date"]),
-        "yoy": load_csv("agriculture", "production_yoy_change.csv", parse_dates=["date"]),
-        "growth": load_csv("agriculture", "growth_rates.csv"),
-        "stats": load_csv("agriculture", "production_stats.csv"),
-        "corr": load_csv("agriculture", "correlation_matrix.csv").set_index("commodity"),
-        "insights": load_json("agriculture", "key_insights.json"),
-        "gemini_insight": load_text("agriculture", "gemini_insight.txt"),
-    }
-
-@lru_cache(maxsize=None)
-def load_defence_data():
-    return {
-        "high_value": load_csv("defence", "high_value_contracts.csv", parse_dates=["date"]),
-        "emergency": load_csv("defence", "emergency_contracts.csv", parse_dates=["date"]),
-        "frequent": load_csv("defence", "frequent_items.csv", parse_dates=["date"]),
-        "combined": load_csv("defence", "defense_contracts_analysis.csv", parse_dates=["date"]),
-        "word_freq": load_csv("defence", "word_frequency_analysis.csv"),
-        "insights": load_json("defence", "comprehensive_insights.json"),
-        "gemini_insight": load_text("defence", "gemini_insight.txt"),
-        "sipri_insight": load_text("defence", "sipri_insight.txt"),
-    }
-
-@lru_cache(maxsize=None)
-def load_economy_data():
-    return {
+def load_term_index(sector):
+    """Procurement term index saved by the EDA run, or None before it has been built"""
+    index = TermIndex.load(os.path.join(BASE_PATH, sector))
+    if index is None:
+        print(f"Warning: term index for {sector} not found. Returning None.")
+    return index
+
+def load_rollup_cube(sector):
+    """Monthly/quarterly/annual rollup cube saved by the EDA run, or None before it has been built"""
+    cube = RollupCube.load(os.path.join(BASE_PATH, sector))
+    if cube is None:
+        print(f"Warning: rollup cube for {sector} not found. Returning None.")
+    return cube
+
+class LazySector(Mapping):
+    """Sector datasets keyed by name, each read from disk on first access and then kept"""
+
+    def __init__(self, loaders):
+        self._loaders = loaders
+        self._values = {}
+        self._locks = {key: threading.Lock() for key in loaders}
+        self._prefetch_started = False
+
+    def __getitem__(self, key):
+        if key not in self._values:
+            with self._locks[key]:
+                if key not in self._values:
+                    self._values[key] = self._loaders[key]()
+        value = self._values[key]
+        # Shallow views: no data is copied, and column edits on a page never reach the store
+        return value.copy(deep=False) if isinstance(value, pd.DataFrame) else value
+
+    def __contains__(self, key):
+        return key in self._loaders
+
+    def __iter__(self):
+        return iter(self._loaders)
+
+    def __len__(self):
+        return len(self._loaders)
+
+    def loaded(self):
+        return [key for key in self._loaders if key in self._values]
+
+    def dated_keys(self):
+        """Datasets read with a parsed 'date' column"""
+        return [key for key, loader in self._loaders.items()
+                if "date" in (getattr(loader, "keywords", {}) or {}).get("parse_dates", [])]
+
+    def load_all(self):
+        for key in self._loaders:
+            if key not in self._values:
+                with self._locks[key]:
+                    if key not in self._values:
+                        self._values[key] = self._loaders[key]()
+
+    def prefetch(self):
+        """Start loading the remaining datasets in a daemon thread (once per sector)"""
+        if self._prefetch_started:
+            return
+        self._prefetch_started = True
+        threading.Thread(target=self.load_all, daemon=True).start()
+
+def read_agriculture_data():
+    return LazySector({
+        "ready": partial(load_csv, "agriculture", "streamlit_ready_data.csv", parse_dates=["date"]),
+        "trend": partial(load_csv, "agriculture", "production_trends.csv", parse_dates=["date"]),
+        "yoy": partial(load_csv, "agriculture", "production_yoy_change.csv", parse_dates=["date"]),
+        "growth": partial(load_csv, "agriculture", "growth_rates.csv"),
+        "stats": partial(load_csv, "agriculture", "production_stats.csv"),
+        "corr": partial(load_csv, "agriculture", "correlation_matrix.csv", index_col="commodity"),
+        "insights": partial(load_json, "agriculture", "key_insights.json"),
+        "gemini_insight": partial(load_text, "agriculture", "gemini_insight.txt"),
+    })
+
+def read_defence_data():
+    return LazySector({
+        "high_value": partial(load_csv, "defence", "high_value_contracts.csv", parse_dates=["date"]),
+        "emergency": partial(load_csv, "defence", "emergency_contracts.csv", parse_dates=["date"]),
+        "frequent": partial(load_csv, "defence", "frequent_items.csv", parse_dates=["date"]),
+        "combined": partial(load_csv, "defence", "defense_contracts_analysis.csv", parse_dates=["date"]),
+        "word_freq": partial(load_csv, "defence", "word_frequency_analysis.csv"),
+        "term_index": partial(load_term_index, "defence"),
+        "rollup_cube": partial(load_rollup_cube, "defence"),
+        "insights": partial(load_json, "defence", "comprehensive_insights.json"),
+        "gemini_insight": partial(load_text, "defence", "gemini_insight.txt"),
+        "sipri_insight": partial(load_text, "defence", "sipri_insight.txt"),
+    })
+
+def read_economy_data():
+    return LazySector({
         # Raw data files
-        "sentiment_raw": load_csv("economy", "sentiment_raw.csv", parse_dates=["date"]),
-        "fx_raw": load_csv("economy", "fx_raw.csv", parse_dates=["date"]),
-        "economic_indicators_raw": load_csv("economy", "economic_indicators_raw.csv", parse_dates=["date"]),
+        "sentiment_raw": partial(load_csv, "economy", "sentiment_raw.csv", parse_dates=["date"]),
+        "fx_raw": partial(load_csv, "economy", "fx_raw.csv", parse_dates=["date"]),
+        "economic_indicators_raw": partial(load_csv, "economy", "economic_indicators_raw.csv", parse_dates=["date"]),
         
         # Processed data files
-        "sentiment_processed": load_csv("economy", "sentiment_processed.csv", parse_dates=["date"]),
-        "key_indicators_processed": load_csv("economy", "key_indicators_processed.csv", parse_dates=["date"]),
-        "cross_correlations": load_csv("economy", "cross_correlations.csv"),
+        "sentiment_processed": partial(load_csv, "economy", "sentiment_processed.csv", parse_dates=["date"]),
+        "key_indicators_processed": partial(load_csv, "economy", "key_indicators_processed.csv", parse_dates=["date"]),
+        "cross_correlations": partial(load_csv, "economy", "cross_correlations.csv"),
+        "lead_lag_table": partial(load_csv, "economy", "lead_lag_table.csv"),
+
+        # Chart-ready frames from eda/serving_layer.py
+        "economic_indicators_wide": partial(load_csv, "economy", "serving_economic_indicators_wide.csv", parse_dates=["date"]),
+        "fx_volatility_table": partial(load_csv, "economy", "serving_fx_volatility_table.csv", index_col="pair"),
         
         # Insights and AI analysis
-        "insights": load_json("economy", "key_insights.json"),
-        "gemini_insight": load_text("economy", "gemini_insights.txt"),
-    }
+        "insights": partial(load_json, "economy", "key_insights.json"),
+        "gemini_insight": partial(load_text, "economy", "gemini_insights.txt"),
+    })
 
-@lru_cache(maxsize=None)
-def load_energy_data():
-    return {
+def read_energy_data():
+    return LazySector({
         # Raw data
-        "iea_stocks_raw": load_csv("energy", "iea_stocks_raw.csv", parse_dates=["date"]),
-        "oil_imports_raw": load_csv("energy", "oil_imports_raw.csv", parse_dates=["date"]),
-        "opec_summary_raw": load_csv("energy", "opec_summary_raw.csv"),
+        "iea_stocks_raw": partial(load_csv, "energy", "iea_stocks_raw.csv", parse_dates=["date"]),
+        "oil_imports_raw": partial(load_csv, "energy", "oil_imports_raw.csv", parse_dates=["date"]),
+        "opec_summary_raw": partial(load_csv, "energy", "opec_summary_raw.csv"),
 
         # Processed/analysis data
-        "stock_country_ranking": load_csv("energy", "stock_country_ranking.csv"),
-        "stock_volatility_analysis": load_csv("energy", "stock_volatility_analysis.csv"),
-        "stock_seasonality_patterns": load_csv("energy", "stock_seasonality_patterns.csv"),
-        "stock_stockpile_statistics": load_csv("energy", "stock_stockpile_statistics.csv"),
-        "import_regional_share_trends": load_csv("energy", "import_regional_share_trends.csv"),
-        "import_volume_by_region": load_csv("energy", "import_volume_by_region.csv"),
-        "import_value_by_region": load_csv("energy", "import_value_by_region.csv"),
-        "import_price_by_region": load_csv("energy", "import_price_by_region.csv"),
-        "import_dominant_supplier_trend": load_csv("energy", "import_dominant_supplier_trend.csv"),
-        "import_metric_breakdown": load_csv("energy", "import_metric_breakdown.csv"),
+        "stock_country_ranking": partial(load_csv, "energy", "stock_country_ranking.csv"),
+        "stock_volatility_analysis": partial(load_csv, "energy", "stock_volatility_analysis.csv"),
+        "stock_seasonality_patterns": partial(load_csv, "energy", "stock_seasonality_patterns.csv"),
+        "stock_stockpile_statistics": partial(load_csv, "energy", "stock_stockpile_statistics.csv"),
+        "import_regional_share_trends": partial(load_csv, "energy", "import_regional_share_trends.csv"),
+        "import_volume_by_region": partial(load_csv, "energy", "import_volume_by_region.csv"),
+        "import_value_by_region": partial(load_csv, "energy", "import_value_by_region.csv"),
+        "import_price_by_region": partial(load_csv, "energy", "import_price_by_region.csv"),
+        "import_dominant_supplier_trend": partial(load_csv, "energy", "import_dominant_supplier_trend.csv"),
+        "import_metric_breakdown": partial(load_csv, "energy", "import_metric_breakdown.csv"),
 
         # Insights and AI analysis
-        "insights": load_json("energy", "key_insights.json"),
-        "gemini_insight": load_text("energy", "gemini_insight.txt"),
-    }
+        "insights": partial(load_json, "energy", "key_insights.json"),
+        "gemini_insight": partial(load_text, "energy", "gemini_insight.txt"),
+    })
 
-@lru_cache(maxsize=None)
-def load_industry_data():
-    return {
+def read_industry_data():
+    return LazySector({
         # Raw data
-        "manufacturing_inventory_raw": load_csv("industry", "manufacturing_inventory_raw.csv", parse_dates=["date"]),
-        "steel_production_raw": load_csv("industry", "steel_production_raw.csv", parse_dates=["date"]),
+        "manufacturing_inventory_raw": partial(load_csv, "industry", "manufacturing_inventory_raw.csv", parse_dates=["date"]),
+        "steel_production_raw": partial(load_csv, "industry", "steel_production_raw.csv", parse_dates=["date"]),
         # Processed/analysis data
-        "manufacturing_inventory_processed": load_csv("industry", "manufacturing_inventory_processed.csv", parse_dates=["date"]),
-        "inventory_volatility_analysis": load_csv("industry", "inventory_volatility_analysis.csv"),
-        "inventory_trend_statistics": load_csv("industry", "inventory_trend_statistics.csv"),
+        "manufacturing_inventory_processed": partial(load_csv, "industry", "manufacturing_inventory_processed.csv", parse_dates=["date"]),
+        "inventory_volatility_analysis": partial(load_csv, "industry", "inventory_volatility_analysis.csv"),
+        "inventory_trend_statistics": partial(load_csv, "industry", "inventory_trend_statistics.csv"),
         # Steel analysis data
-        "steel_top_current": load_csv("industry", "steel_top_current.csv"),
-        "steel_bottom_current": load_csv("industry", "steel_bottom_current.csv"),
-        "steel_top_jan_current": load_csv("industry", "steel_top_jan_current.csv"),
-        "steel_bottom_jan_current": load_csv("industry", "steel_bottom_jan_current.csv"),
-        "steel_vs_world_current": load_csv("industry", "steel_vs_world_current.csv", parse_dates=["date"]),
-        "steel_vs_world_jan_current": load_csv("industry", "steel_vs_world_jan_current.csv", parse_dates=["date"]),
-        "steel_major_economies_current": load_csv("industry", "steel_major_economies_current.csv"),
-        "steel_major_economies_jan_current": load_csv("industry", "steel_major_economies_jan_current.csv"),
+        "steel_top_current": partial(load_csv, "industry", "steel_top_current.csv"),
+        "steel_bottom_current": partial(load_csv, "industry", "steel_bottom_current.csv"),
+        "steel_top_jan_current": partial(load_csv, "industry", "steel_top_jan_current.csv"),
+        "steel_bottom_jan_current": partial(load_csv, "industry", "steel_bottom_jan_current.csv"),
+        "steel_vs_world_current": partial(load_csv, "industry", "steel_vs_world_current.csv", parse_dates=["date"]),
+        "steel_vs_world_jan_current": partial(load_csv, "industry", "steel_vs_world_jan_current.csv", parse_dates=["date"]),
+        "steel_major_economies_current": partial(load_csv, "industry", "steel_major_economies_current.csv"),
+        "steel_major_economies_jan_current": partial(load_csv, "industry", "steel_major_economies_jan_current.csv"),
+        # Chart-ready frames from eda/serving_layer.py
+        "steel_relative_change": partial(load_csv, "industry", "serving_steel_relative_change.csv", parse_dates=["date"]),
         # Insights and AI analysis
-        "insights": load_json("industry", "key_insights.json"),
-        "gemini_insight": load_text("industry", "gemini_insight.txt"),
-    }
+        "insights": partial(load_json, "industry", "key_insights.json"),
+        "gemini_insight": partial(load_text, "industry", "gemini_insight.txt"),
+    })
 
-@lru_cache(maxsize=None)
-def load_global_trade_data():
-    return {
+def read_global_trade_data():
+    return LazySector({
         # Processed data
-        "export_decrease_items_top5": load_csv("global_trade", "export_decrease_items_top5.csv"),
-        "export_increase_items_top5": load_csv("global_trade", "export_increase_items_top5.csv"),
-        "export_increase_countries_top5": load_csv("global_trade", "export_increase_countries_top5.csv"),
-        "trade_partners_top5": load_csv("global_trade", "trade_partners_top5.csv"),
-        "shipping_index_pivoted": load_csv("global_trade", "shipping_index_pivoted.csv", parse_dates=["date"]),
-        "shipping_index_correlation": load_csv("global_trade", "shipping_index_correlation.csv"),
-        "shipping_index_3m_volatility": load_csv("global_trade", "shipping_index_3m_volatility.csv", parse_dates=["date"]),
+        "export_decrease_items_top5": partial(load_csv, "global_trade", "export_decrease_items_top5.csv"),
+        "export_increase_items_top5": partial(load_csv, "global_trade", "export_increase_items_top5.csv"),
+        "export_increase_countries_top5": partial(load_csv, "global_trade", "export_increase_countries_top5.csv"),
+        "trade_partners_top5": partial(load_csv, "global_trade", "trade_partners_top5.csv"),
+        "shipping_index_pivoted": partial(load_csv, "global_trade", "shipping_index_pivoted.csv", parse_dates=["date"]),
+        "shipping_index_correlation": partial(load_csv, "global_trade", "shipping_index_correlation.csv"),
+        "shipping_index_3m_volatility": partial(load_csv, "global_trade", "shipping_index_3m_volatility.csv", parse_dates=["date"]),
+        # Chart-ready frames from eda/serving_layer.py
+        "shipping_index_coverage": partial(load_csv, "global_trade", "serving_shipping_index_coverage.csv",
+                                           parse_dates=["first_date", "last_date", "latest_date"]),
         # Insights and AI analysis
-        "insights": load_json("global_trade", "key_insights.json"),
-        "gemini_insight": load_text("global_trade", "gemini_insight_gloal_trade.txt"),
-    }
+        "insights": partial(load_json, "global_trade", "key_insights.json"),
+        "gemini_insight": partial(load_text, "global_trade", "gemini_insight_gloal_trade.txt"),
+    })
 
-@lru_cache(maxsize=None)
-def load_korea_trade_data():
-    return {
+def read_korea_trade_data():
+    return LazySector({
         # Export/Import Trade Analysis
-        "export_top_partners": load_csv("korea_trade", "export_top_partners.csv"),
-        "import_top_partners": load_csv("korea_trade", "import_top_partners.csv"),
+        "export_top_partners": partial(load_csv, "korea_trade", "export_top_partners.csv"),
+        "import_top_partners": partial(load_csv, "korea_trade", "import_top_partners.csv"),
         
         # Export/Import Items Analysis
-        "export_top_items_by_amount": load_csv("korea_trade", "export_top_items_by_amount.csv"),
-        "export_top_items_by_yoy": load_csv("korea_trade", "export_top_items_by_yoy.csv"),
-        "import_top_items_by_amount": load_csv("korea_trade", "import_top_items_by_amount.csv"),
-        "import_top_items_by_yoy": load_csv("korea_trade", "import_top_items_by_yoy.csv"),
+        "export_top_items_by_amount": partial(load_csv, "korea_trade", "export_top_items_by_amount.csv"),
+        "export_top_items_by_yoy": partial(load_csv, "korea_trade", "export_top_items_by_yoy.csv"),
+        "import_top_items_by_amount": partial(load_csv, "korea_trade", "import_top_items_by_amount.csv"),
+        "import_top_items_by_yoy": partial(load_csv, "korea_trade", "import_top_items_by_yoy.csv"),
         
         # Trade YoY Analysis
-        "trade_yoy_top_export_partners": load_csv("korea_trade", "trade_yoy_top_export_partners.csv"),
-        "trade_yoy_top_import_partners": load_csv("korea_trade", "trade_yoy_top_import_partners.csv"),
-        "trade_balance": load_csv("korea_trade", "trade_balance.csv", parse_dates=["date"]),
+        "trade_yoy_top_export_partners": partial(load_csv, "korea_trade", "trade_yoy_top_export_partners.csv"),
+        "trade_yoy_top_import_partners": partial(load_csv, "korea_trade", "trade_yoy_top_import_partners.csv"),
+        "trade_balance": partial(load_csv, "korea_trade", "trade_balance.csv", parse_dates=["date"]),
         
         # Value Index Analysis
-        "value_index_top_yoy": load_csv("korea_trade", "value_index_top_yoy.csv"),
-        "value_index_bottom_yoy": load_csv("korea_trade", "value_index_bottom_yoy.csv"),
-        "value_index_volatility": load_csv("korea_trade", "value_index_volatility.csv"),
+        "value_index_top_yoy": partial(load_csv, "korea_trade", "value_index_top_yoy.csv"),
+        "value_index_bottom_yoy": partial(load_csv, "korea_trade", "value_index_bottom_yoy.csv"),
+        "value_index_volatility": partial(load_csv, "korea_trade", "value_index_volatility.csv"),
         
         # Semiconductor Billings Analysis
-        "wsts_top_monthly_regions": load_csv("korea_trade", "wsts_top_monthly_regions.csv"),
-        "wsts_top_annual_regions": load_csv("korea_trade", "wsts_top_annual_regions.csv"),
-        "wsts_volatility": load_csv("korea_trade", "wsts_volatility.csv"),
-        "wsts_trend_monthly": load_csv("korea_trade", "wsts_trend_monthly.csv", parse_dates=["date"]),
-        "wsts_trend_annual": load_csv("korea_trade", "wsts_trend_annual.csv", parse_dates=["date"]),
-        "wsts_yoy_monthly": load_csv("korea_trade", "wsts_yoy_monthly.csv", parse_dates=["date"]),
-        "wsts_yoy_annual": load_csv("korea_trade", "wsts_yoy_annual.csv", parse_dates=["date"]),
-        "wsts_market_share_monthly": load_csv("korea_trade", "wsts_market_share_monthly.csv", parse_dates=["date"]),
+        "wsts_top_monthly_regions": partial(load_csv, "korea_trade", "wsts_top_monthly_regions.csv"),
+        "wsts_top_annual_regions": partial(load_csv, "korea_trade", "wsts_top_annual_regions.csv"),
+        "wsts_volatility": partial(load_csv, "korea_trade", "wsts_volatility.csv"),
+        "wsts_trend_monthly": partial(load_csv, "korea_trade", "wsts_trend_monthly.csv", parse_dates=["date"]),
+        "wsts_trend_annual": partial(load_csv, "korea_trade", "wsts_trend_annual.csv", parse_dates=["date"]),
+        "wsts_yoy_monthly": partial(load_csv, "korea_trade", "wsts_yoy_monthly.csv", parse_dates=["date"]),
+        "wsts_yoy_annual": partial(load_csv, "korea_trade", "wsts_yoy_annual.csv", parse_dates=["date"]),
+        "wsts_market_share_monthly": partial(load_csv, "korea_trade", "wsts_market_share_monthly.csv", parse_dates=["date"]),
         
         # Insights and AI analysis
-        "insights": load_json("korea_trade", "key_insights.json"),
-        "gemini_insight": load_text("korea_trade", "gemini_insights_korea_trade.txt"),
-        "gemini_insights_data": load_json("korea_trade", "gemini_insights_data.json"),
-    }
+        "insights": partial(load_json, "korea_trade", "key_insights.json"),
+        "gemini_insight": partial(load_text, "korea_trade", "gemini_insights_korea_trade.txt"),
+        "gemini_insights_data": partial(load_json, "korea_trade", "gemini_insights_data.json"),
+    })
+
+
+SECTOR_READERS = {
+    "agriculture": read_agriculture_data,
+    "defence": read_defence_data,
+    "economy": read_economy_data,
+    "energy": read_energy_data,
+    "industry": read_industry_data,
+    "global_trade": read_global_trade_data,
+    "korea_trade": read_korea_trade_data,
+}
+
+# One store per server process, shared by every session and page
+@st.cache_resource(show_spinner=False)
+def dataset_store():
+    return {"lock": threading.Lock(), "sectors": {}}
+
+def artifact_signature(sector):
+    """(name, mtime, size) of every artifact in a sector's output folder"""
+    folder = os.path.join(BASE_PATH, sector)
+    try:
+        entries = sorted(os.scandir(folder), key=lambda e: e.name)
+    except FileNotFoundError:
+        return ()
+    return tuple((e.name, e.stat().st_mtime_ns, e.stat().st_size) for e in entries if e.is_file())
+
+def load_manifest():
+    """Artifact manifest from the EDA run, re-read only when the file itself changes"""
+    store = dataset_store()
+    path = os.path.join(BASE_PATH, MANIFEST_NAME)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+    cached = store.get("manifest")
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, read_manifest(BASE_PATH))
+        store["manifest"] = cached
+    return cached[1]
+
+def load_home_summary():
+    """Precomputed Home summary from the EDA run, re-read only when the file changes"""
+    store = dataset_store()
+    path = os.path.join(BASE_PATH, SUMMARY_NAME)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+    cached = store.get("home_summary")
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, read_home_summary(BASE_PATH))
+        store["home_summary"] = cached
+    return cached[1]
+
+def load_alerts(domain):
+    """Anomaly alerts the EDA run detected for one domain, re-read only when alerts.json changes"""
+    store = dataset_store()
+    path = os.path.join(BASE_PATH, ALERTS_NAME)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+    cached = store.get("alerts")
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, read_alerts(BASE_PATH))
+        store["alerts"] = cached
+    return cached[1].get("domains", {}).get(domain, {}).get("alerts", [])
+
+def load_series_store():
+    """Memory-mapped store of every indicator, re-opened only when the EDA run rewrites it"""
+    store = dataset_store()
+    path = os.path.join(BASE_PATH, SERIES_META_NAME)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+    cached = store.get("series_store")
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, SeriesStore.open(BASE_PATH))
+        store["series_store"] = cached
+    return cached[1]
+
+def load_series_history(key, years=5):
+    """Last `years` of one indicator as (date, value) rows; empty if the series is not stored"""
+    series_store = load_series_store()
+    if series_store is None or key not in series_store:
+        return pd.DataFrame(columns=["date", "value"])
+    start = series_store.meta[key].end - pd.DateOffset(years=years)
+    return series_store.series(key, start=start).rename("value").reset_index()
+
+def artifact_version(sector):
+    """Manifest version of a sector; falls back to scanning the folder if the sector is not listed"""
+    entry = load_manifest().get("sectors", {}).get(sector)
+    if entry and entry.get("version"):
+        return entry["version"]
+    return artifact_signature(sector)
+
+def last_refreshed():
+    """Most recent EDA refresh time across sectors (ISO string), or None without a manifest"""
+    times = [entry["updated_at"] for entry in load_manifest().get("sectors", {}).values() if entry.get("updated_at")]
+    return max(times) if times else None
+
+def get_sector_data(sector, prefetch=False):
+    """Lazy, read-only sector data from the shared store, rebuilt when its manifest version changes"""
+    store = dataset_store()
+    signature = artifact_version(sector)
+    entry = store["sectors"].get(sector)
+    if entry is None or entry[0] != signature:
+        with store["lock"]:
+            entry = store["sectors"].get(sector)
+            if entry is None or entry[0] != signature:
+                entry = (signature, SECTOR_READERS[sector]())
+                store["sectors"][sector] = entry
+
+    data = entry[1]
+    if prefetch:
+        data.prefetch()
+    return data
+
+def load_agriculture_data(prefetch=PREFETCH):
+    return get_sector_data("agriculture", prefetch)
+
+def load_defence_data(prefetch=PREFETCH):
+    return get_sector_data("defence", prefetch)
+
+def load_economy_data(prefetch=PREFETCH):
+    return get_sector_data("economy", prefetch)
+
+def load_energy_data(prefetch=PREFETCH):
+    return get_sector_data("energy", prefetch)
+
+def load_industry_data(prefetch=PREFETCH):
+    return get_sector_data("industry", prefetch)
+
+def load_global_trade_data(prefetch=PREFETCH):
+    return get_sector_data("global_trade", prefetch)
+
+def load_korea_trade_data(prefetch=PREFETCH):
+    return get_sector_data("korea_trade", prefetch)
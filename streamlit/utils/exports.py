@@ -0,0 +1,86 @@
+# utils/exports.py
+import gzip
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from datetime import datetime
+import pandas as pd
+import streamlit as st
+
+from utils.data_loader import dataset_store, artifact_version
+
+# Serialized exports kept per process; one entry per (dataset version, rows, format)
+MAX_CACHED_EXPORTS = 32
+
+# format -> (button label, file extension, mime type)
+EXPORT_FORMATS = {
+    "csv": ("CSV", "csv", "text/csv"),
+    "csv.gz": ("CSV (gzip)", "csv.gz", "application/gzip"),
+    "parquet": ("Parquet", "parquet", "application/vnd.apache.parquet"),
+}
+
+
+def serialize(df, fmt):
+    if fmt == "csv":
+        return df.to_csv(index=False).encode("utf-8")
+    if fmt == "csv.gz":
+        return gzip.compress(df.to_csv(index=False).encode("utf-8"))
+    if fmt == "parquet":
+        buffer = io.BytesIO()
+        df.to_parquet(buffer, index=False)
+        return buffer.getvalue()
+    raise ValueError(f"Unsupported export format: {fmt}")
+
+
+def frame_key(df):
+    """Which rows and columns a table holds: its index labels and column names, hashed"""
+    digest = hashlib.sha1(pd.util.hash_pandas_object(df.index, index=False).to_numpy().tobytes())
+    digest.update("\x1f".join(map(str, df.columns)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def export_cache():
+    store = dataset_store()
+    if "exports" not in store:
+        with store["lock"]:
+            store.setdefault("exports", {"lock": threading.Lock(), "items": OrderedDict()})
+    return store["exports"]
+
+
+def export_bytes(df, sector, name, fmt="csv"):
+    """Serialized table, built once per sector version and filtered row set"""
+    cache = export_cache()
+    key = (sector, artifact_version(sector), name, frame_key(df), fmt)
+    with cache["lock"]:
+        data = cache["items"].get(key)
+        if data is not None:
+            cache["items"].move_to_end(key)
+            return data
+    data = serialize(df, fmt)
+    with cache["lock"]:
+        cache["items"][key] = data
+        if len(cache["items"]) > MAX_CACHED_EXPORTS:
+            cache["items"].popitem(last=False)
+    return data
+
+
+def export_buttons(df, sector, name, file_stem, key):
+    """'Export Data' button; once clicked, download buttons for every format.
+
+    Nothing is serialized until the user asks for an export, and the bytes are
+    shared by every session until the sector's artifacts change.
+    """
+    requested = f"{key}_requested"
+    if st.button("📥 Export Data", type="primary", key=key):
+        st.session_state[requested] = True
+    if st.session_state.get(requested):
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        for fmt, (label, ext, mime) in EXPORT_FORMATS.items():
+            st.download_button(
+                label=label,
+                data=export_bytes(df, sector, name, fmt),
+                file_name=f"{file_stem}_{timestamp}.{ext}",
+                mime=mime,
+                key=f"{key}_{fmt}"
+            )
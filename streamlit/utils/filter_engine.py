@@ -0,0 +1,150 @@
+# utils/filter_engine.py
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+from utils.data_loader import dataset_store, get_sector_data, artifact_version
+
+# Filtered results kept per dataset; one entry per distinct (date range, selections) tuple
+MAX_CACHED_RESULTS = 64
+
+ONE_DAY = np.timedelta64(1, "D")
+
+
+def to_datetime64(value):
+    """Sidebar date (datetime.date, Timestamp or string) as numpy datetime64[ns]"""
+    return np.datetime64(pd.Timestamp(value).normalize().to_datetime64(), "ns")
+
+
+def column_options(df, column):
+    """Distinct values of a column in first-seen order, as the sidebar multiselects list them"""
+    if column not in df.columns:
+        return []
+    return list(df[column].dropna().unique())
+
+
+def selection_key(values):
+    """Order-insensitive, hashable form of a multiselect selection"""
+    if values is None:
+        return None
+    return tuple(sorted({str(v) for v in values}))
+
+
+class FilterFrame:
+    """One dataset plus a date-sorted position index, so date ranges are two searchsorted calls.
+
+    The frame itself keeps its loaded (schema-typed) columns and row order; results come
+    back in that order, exactly as the old per-rerun boolean filters returned them.
+    """
+
+    def __init__(self, df, date_col="date"):
+        self.frame = df
+        self.dates = None
+        self.order = None
+        self.valid = 0
+        if date_col in df.columns:
+            dates = pd.to_datetime(df[date_col], errors="coerce").to_numpy("datetime64[ns]")
+            # Stable argsort puts NaT last, so searchsorted only ever looks at the valid prefix
+            self.order = np.argsort(dates, kind="stable")
+            self.dates = dates[self.order]
+            self.valid = int((~np.isnat(dates)).sum())
+            self.presorted = bool((self.order == np.arange(len(dates))).all())
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def date_bounds(self):
+        """(min, max) Timestamps of the dataset, or (None, None) without dates"""
+        if not self.valid:
+            return None, None
+        return pd.Timestamp(self.dates[0]), pd.Timestamp(self.dates[self.valid - 1])
+
+    def date_rows(self, start=None, end=None):
+        """Row positions with start <= date <= end (whole days, both inclusive); None means all rows"""
+        if self.dates is None or (start is None and end is None):
+            return None
+        valid = self.dates[:self.valid]
+        i = 0 if start is None else int(valid.searchsorted(to_datetime64(start), side="left"))
+        j = self.valid if end is None else int(valid.searchsorted(to_datetime64(end) + ONE_DAY, side="left"))
+        if i == 0 and j == len(self.frame):
+            return None
+        rows = self.order[i:max(i, j)]
+        return rows if self.presorted else np.sort(rows)
+
+    def value_mask(self, frame, column, values):
+        col = frame[column]
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            # Compare integer codes instead of strings
+            wanted = col.cat.categories.get_indexer(values)
+            return np.isin(col.cat.codes.to_numpy(), wanted[wanted >= 0])
+        return col.isin(values).to_numpy()
+
+    def filter(self, start=None, end=None, **selections):
+        """Rows inside the date range whose columns take one of the selected values.
+
+        A selection of None leaves that column unfiltered, and so does a column the
+        dataset does not have. Results are memoized per (start, end, selections).
+        """
+        selections = {col: values for col, values in selections.items()
+                      if values is not None and col in self.frame.columns}
+        key = (
+            None if start is None else str(pd.Timestamp(start).date()),
+            None if end is None else str(pd.Timestamp(end).date()),
+            tuple(sorted((col, selection_key(values)) for col, values in selections.items()))
+        )
+
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key].copy(deep=False)
+
+        rows = self.date_rows(start, end)
+        result = self.frame if rows is None else self.frame.take(rows)
+        if selections:
+            mask = np.ones(len(result), dtype=bool)
+            for col, values in selections.items():
+                mask &= self.value_mask(result, col, list(values))
+            result = result[mask]
+
+        with self._lock:
+            self._results[key] = result
+            if len(self._results) > MAX_CACHED_RESULTS:
+                self._results.popitem(last=False)
+        return result.copy(deep=False)
+
+
+def filter_frame(sector, key, date_col="date"):
+    """Shared FilterFrame for one sector dataset, rebuilt when the sector's artifacts change"""
+    store = dataset_store()
+    version = artifact_version(sector)
+    frames = store.setdefault("filter_frames", {})
+    entry = frames.get((sector, key))
+    if entry is None or entry[0] != version:
+        # Read outside the store lock; get_sector_data takes it itself
+        df = get_sector_data(sector).get(key, pd.DataFrame())
+        with store["lock"]:
+            entry = frames.get((sector, key))
+            if entry is None or entry[0] != version:
+                entry = (version, FilterFrame(df, date_col))
+                frames[(sector, key)] = entry
+    return entry[1]
+
+
+class SectorFilter:
+    """Sidebar filters for one dashboard page, applied to any of the sector's datasets"""
+
+    def __init__(self, sector):
+        self.sector = sector
+
+    def frame(self, key):
+        return filter_frame(self.sector, key)
+
+    def date_bounds(self, key):
+        return self.frame(key).date_bounds()
+
+    def options(self, key, column, start=None, end=None):
+        """Selectable values of a column within the date range"""
+        return column_options(self.frame(key).filter(start, end), column)
+
+    def apply(self, key, start=None, end=None, **selections):
+        return self.frame(key).filter(start, end, **selections)
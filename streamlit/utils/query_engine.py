@@ -0,0 +1,145 @@
+# utils/query_engine.py
+import os
+import threading
+from collections import OrderedDict
+import duckdb
+import pandas as pd
+
+from utils.data_loader import BASE_PATH, dataset_store, artifact_version
+
+# Query results kept per process; keyed by sector version, SQL and parameters
+MAX_CACHED_QUERIES = 256
+
+
+def artifact_path(sector, name):
+    """Parquet artifact if the EDA run wrote one, otherwise the CSV"""
+    for ext in (".parquet", ".csv"):
+        path = os.path.join(BASE_PATH, sector, name + ext)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def source_sql(path):
+    path = os.path.abspath(path).replace("'", "''")
+    if path.endswith(".parquet"):
+        return f"read_parquet('{path}')"
+    return f"read_csv_auto('{path}', header=true)"
+
+
+def query_store():
+    """DuckDB connection and result cache, shared by every session like the dataset store"""
+    store = dataset_store()
+    if "duckdb" not in store:
+        with store["lock"]:
+            if "duckdb" not in store:
+                store["duckdb"] = {
+                    "connection": duckdb.connect(database=":memory:"),
+                    "lock": threading.Lock(),
+                    "views": {},
+                    "results": OrderedDict(),
+                }
+    return store["duckdb"]
+
+
+def register_view(sector, name):
+    """Expose an artifact as the view <sector>.<name>; re-created when the sector version changes"""
+    engine = query_store()
+    version = artifact_version(sector)
+    if engine["views"].get((sector, name)) == version:
+        return version
+
+    path = artifact_path(sector, name)
+    if path is None:
+        raise FileNotFoundError(f"No artifact named {name} for {sector} under {BASE_PATH}")
+    with engine["lock"]:
+        con = engine["connection"]
+        con.execute(f'CREATE SCHEMA IF NOT EXISTS "{sector}"')
+        con.execute(f'CREATE OR REPLACE VIEW "{sector}"."{name}" AS SELECT * FROM {source_sql(path)}')
+        engine["views"][(sector, name)] = version
+    return version
+
+
+def query(sql, params=None, tables=()):
+    """Run SQL over EDA artifacts and return only the result rows as a DataFrame.
+
+    tables lists the (sector, name) views the SQL reads; they are registered on first
+    use and the result is memoized until one of their sectors gets a new version.
+    """
+    engine = query_store()
+    try:
+        versions = tuple(register_view(sector, name) for sector, name in tables)
+    except FileNotFoundError as e:
+        print(f"Warning: {e}. Returning empty DataFrame.")
+        return pd.DataFrame()
+    key = (versions, tuple(tables), sql, tuple(params or ()))
+
+    with engine["lock"]:
+        if key in engine["results"]:
+            engine["results"].move_to_end(key)
+            return engine["results"][key].copy(deep=False)
+
+        # One connection, so queries are serialized; DuckDB parallelizes within each scan
+        result = engine["connection"].execute(sql, list(params or ())).df()
+        engine["results"][key] = result
+        if len(engine["results"]) > MAX_CACHED_QUERIES:
+            engine["results"].popitem(last=False)
+    return result.copy(deep=False)
+
+
+def where_clause(include=None, exclude=None, not_null=()):
+    """SQL WHERE built from {column: values} filters, with its positional parameters"""
+    conditions, params = [], []
+    for column, values in (include or {}).items():
+        if values is None:
+            continue
+        values = [str(v) for v in values]
+        conditions.append(f'"{column}" IN ({", ".join("?" * len(values))})' if values else "FALSE")
+        params += values
+    for column, values in (exclude or {}).items():
+        values = [str(v) for v in values]
+        if values:
+            conditions.append(f'("{column}" IS NULL OR "{column}" NOT IN ({", ".join("?" * len(values))}))')
+            params += values
+    for column in not_null:
+        conditions.append(f'"{column}" IS NOT NULL')
+    return (" WHERE " + " AND ".join(conditions) if conditions else ""), params
+
+
+def select(sector, name, columns=None, include=None, exclude=None, not_null=(), order_by=None, descending=False, limit=None):
+    """Filtered (and optionally ordered / limited) rows of one artifact"""
+    cols = ", ".join(f'"{c}"' for c in columns) if columns else "*"
+    where, params = where_clause(include, exclude, not_null)
+    sql = f'SELECT {cols} FROM "{sector}"."{name}"{where}'
+    if order_by:
+        sql += f' ORDER BY "{order_by}" {"DESC" if descending else "ASC"} NULLS LAST'
+    if limit:
+        sql += f" LIMIT {int(limit)}"
+    return query(sql, params, tables=[(sector, name)])
+
+
+def top_n(sector, name, value, n=10, include=None, exclude=None, ascending=False):
+    """The n rows with the largest (or smallest) value, filtered before the sort"""
+    return select(sector, name, include=include, exclude=exclude,
+                  order_by=value, descending=not ascending, limit=n)
+
+
+def grouped_top_n(sector, name, by, value, agg="avg", n=10, include=None, exclude=None):
+    """Aggregate value per group and keep the n largest groups"""
+    if agg not in ("avg", "sum", "min", "max", "median", "stddev_samp", "count"):
+        raise ValueError(f"Unsupported aggregate: {agg}")
+    where, params = where_clause(include, exclude, not_null=(by, value))
+    sql = (f'SELECT "{by}", {agg}("{value}") AS "{value}" FROM "{sector}"."{name}"{where} '
+           f'GROUP BY "{by}" ORDER BY "{value}" DESC LIMIT {int(n)}')
+    return query(sql, params, tables=[(sector, name)])
+
+
+def unpivot(sector, name, id_column="date", name_column="region", value_column="value", exclude=None):
+    """Long (id, name, value) rows of a wide artifact, e.g. one column per region"""
+    where, params = where_clause(exclude={name_column: exclude or []})
+    # INCLUDE NULLS keeps gaps as NaN rows, like DataFrame.melt
+    sql = (f'SELECT * FROM "{sector}"."{name}" UNPIVOT INCLUDE NULLS '
+           f'("{value_column}" FOR "{name_column}" IN (COLUMNS(* EXCLUDE ("{id_column}"))))'
+           f'{where} ORDER BY "{name_column}", "{id_column}"')
+    return query(sql, params, tables=[(sector, name)])
+
@@ -0,0 +1,94 @@
+# utils/search_index.py
+import threading
+from collections import OrderedDict
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from utils.data_loader import dataset_store, get_sector_data, artifact_version
+
+# Search terms remembered per dataset; typing a term again costs nothing
+MAX_CACHED_TERMS = 64
+
+# Cells are joined with a control character no one types, so a match never spans two cells
+CELL_SEPARATOR = "\x1f"
+
+
+def row_texts(df):
+    """One lower-cased string per row: every cell as the data tables show it, joined"""
+    if df.empty or len(df.columns) == 0:
+        return pa.array([""] * len(df), type=pa.string())
+    # Empty cells stay empty, as str.contains(na=False) never matched them
+    cells = [pa.array(df[col].astype(str).fillna(""), type=pa.string()) for col in df.columns]
+    text = pc.binary_join_element_wise(*cells, CELL_SEPARATOR) if len(cells) > 1 else cells[0]
+    return pc.utf8_lower(text)
+
+
+class SearchIndex:
+    """Row strings of one dataset, built once; a search is one Arrow substring scan.
+
+    Matches are case-insensitive literal substrings of a single cell, like the old
+    per-column str.contains, and are memoized per term.
+    """
+
+    def __init__(self, df):
+        self.columns = [str(col) for col in df.columns]
+        self.labels = df.index
+        self.rows = row_texts(df)
+        self._hits = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hits(self, term):
+        """Boolean array over the indexed rows: True where some cell contains term"""
+        term = term.lower()
+        with self._lock:
+            if term in self._hits:
+                self._hits.move_to_end(term)
+                return self._hits[term]
+        hit = pc.match_substring(self.rows, pattern=term).to_numpy(zero_copy_only=False)
+        with self._lock:
+            self._hits[term] = hit
+            if len(self._hits) > MAX_CACHED_TERMS:
+                self._hits.popitem(last=False)
+        return hit
+
+    def covers(self, df):
+        """Positions of df's rows in the indexed dataset, or None if df is not a row subset of it"""
+        if [str(col) for col in df.columns] != self.columns:
+            return None
+        positions = self.labels.get_indexer(df.index) if self.labels.is_unique else None
+        if positions is None or (positions < 0).any():
+            return None
+        return positions
+
+    def search(self, df, term):
+        """Rows of df containing term; df may be any filtered view of the indexed dataset"""
+        positions = self.covers(df)
+        if positions is None:
+            # A reshaped table (renamed or formatted columns) gets a one-off index
+            return SearchIndex(df).search(df, term)
+        return df[self.hits(term)[positions]]
+
+
+def search_index(sector, key):
+    """Shared SearchIndex for one sector dataset, rebuilt when the sector's artifacts change"""
+    store = dataset_store()
+    version = artifact_version(sector)
+    indexes = store.setdefault("search_indexes", {})
+    entry = indexes.get((sector, key))
+    if entry is None or entry[0] != version:
+        # Read outside the store lock; get_sector_data takes it itself
+        df = get_sector_data(sector).get(key, pd.DataFrame())
+        with store["lock"]:
+            entry = indexes.get((sector, key))
+            if entry is None or entry[0] != version:
+                entry = (version, SearchIndex(df))
+                indexes[(sector, key)] = entry
+    return entry[1]
+
+
+def search_rows(sector, key, df, search_term):
+    """Data explorer search: rows of df (a view of dataset key) with a cell containing search_term"""
+    if not search_term:
+        return df
+    return search_index(sector, key).search(df, search_term)
@@ -1,8 +1,12 @@
-import pandas as pd
 from sqlalchemy import create_engine
 from pathlib import Path
 from dotenv import load_dotenv
 import os
+import sys
+
+# Add src/processed to Python path for the dataset schemas
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "src", "processed"))
+from schema import read_processed, apply_schema, sql_dtypes
 
 # Load .env credentials
 load_dotenv()
@@ -30,10 +34,11 @@ for domain_dir in base_dir.iterdir():
         table_name = f"{domain}_{file.stem}".lower().replace("-", "_")
         print(f"🔄 Uploading: {file} → table: {table_name}")
         try:
-            df = pd.read_csv(file)
+            df = read_processed(file)
             df["domain"] = domain
             df["file_source"] = file.stem
-            df.to_sql(table_name, engine, if_exists="replace", index=False)
+            df = apply_schema(df, file.stem)
+            df.to_sql(table_name, engine, if_exists="replace", index=False, dtype=sql_dtypes(df, file.stem))
             print(f"✅ Done: {table_name}")
         except Exception as e:
             print(f"❌ Failed on {file}: {e}")